@@ -0,0 +1,96 @@
+"""Benchmarks for the speed of pydrake.common.yaml on a large scenario-like
+document, comparing the libyaml-accelerated loaders and dumpers (when PyYAML
+was built with libyaml) against the pure-Python ones.
+
+The command-line flags mimic (a subset of) those of a Google Benchmark
+program (see tools/performance/py_benchmark.py), e.g.,
+``--benchmark_filter=REGEX`` selects which benchmarks to run. This means that
+the program can be run under the //tools/performance:benchmark_tool (see the
+``yaml_experiment`` target).
+"""
+
+import dataclasses as dc
+import functools
+
+import yaml
+
+import pydrake.common.yaml as mut
+from tools.performance import py_benchmark
+
+
+@dc.dataclass
+class Directive:
+    name: str = ""
+    initial_position: dict[str, list[float]] = dc.field(default_factory=dict)
+
+
+@dc.dataclass
+class Scenario:
+    directives: list[Directive] = dc.field(default_factory=list)
+
+
+def _make_scenario():
+    return Scenario(
+        directives=[
+            Directive(
+                name=f"model_{i}",
+                initial_position={
+                    f"joint_{j}": [0.1 * i, 0.2 * j] for j in range(20)
+                },
+            )
+            for i in range(500)
+        ]
+    )
+
+
+def _load_setup(args, *, loader):
+    data = mut.yaml_dump_typed(_make_scenario())
+    return functools.partial(yaml.load, data, Loader=loader)
+
+
+def _dump_setup(args, *, dumper):
+    root = mut._yaml_dump_typed_item(obj=_make_scenario(), schema=Scenario)
+    return functools.partial(
+        yaml.dump,
+        root,
+        Dumper=dumper,
+        default_flow_style=mut._FLOW_STYLE,
+        sort_keys=False,
+    )
+
+
+def _make_benchmarks():
+    """Returns the list of (name, setup, items_per_iteration) for all
+    benchmarks, in the order they are run. Each item is one document.
+    """
+    result = []
+    for loader in mut._SCHEMA_LOADERS:
+        result.append(
+            (
+                f"Load/{loader.__name__}",
+                functools.partial(_load_setup, loader=loader),
+                1,
+            )
+        )
+    for python_dumper, c_dumper in mut._C_SCHEMA_DUMPERS.items():
+        for dumper in (python_dumper, c_dumper):
+            result.append(
+                (
+                    f"Dump/{dumper.__name__}",
+                    functools.partial(_dump_setup, dumper=dumper),
+                    1,
+                )
+            )
+    return result
+
+
+def main():
+    py_benchmark.main(
+        description=__doc__,
+        benchmarks=_make_benchmarks(),
+        time_unit="ms",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Checks that the libyaml-accelerated loaders and dumpers produce the same
+results as the pure-Python ones, e.g., on a large scenario-like document.
+For their relative speed, see the yaml_benchmarks program in
+//bindings/pydrake/common/benchmarking.
+"""
+
+import dataclasses as dc
+import unittest
+
+import yaml
+
+import pydrake.common.yaml as mut
+
+
+@dc.dataclass
+class Directive:
+    name: str = ""
+    initial_position: dict[str, list[float]] = dc.field(default_factory=dict)
+
+
+@dc.dataclass
+class Scenario:
+    directives: list[Directive] = dc.field(default_factory=list)
+
+
+def _make_scenario():
+    return Scenario(
+        directives=[
+            Directive(
+                name=f"model_{i}",
+                initial_position={
+                    f"joint_{j}": [0.1 * i, 0.2 * j] for j in range(20)
+                },
+            )
+            for i in range(500)
+        ]
+    )
+
+
+class TestYamlCEquivalence(unittest.TestCase):
+    def test_load(self):
+        data = mut.yaml_dump_typed(_make_scenario())
+        expected = yaml.load(data, Loader=mut._SchemaLoader)
+        for loader in mut._SCHEMA_LOADERS[1:]:
+            with self.subTest(loader=loader.__name__):
+                actual = yaml.load(data, Loader=loader)
+                self.assertEqual(actual, expected)
+
+    def test_dump(self):
+        root = mut._yaml_dump_typed_item(obj=_make_scenario(), schema=Scenario)
+        kwargs = {"default_flow_style": mut._FLOW_STYLE, "sort_keys": False}
+        for python_dumper, c_dumper in mut._C_SCHEMA_DUMPERS.items():
+            with self.subTest(dumper=c_dumper.__name__):
+                expected = yaml.dump(root, Dumper=python_dumper, **kwargs)
+                actual = yaml.dump(root, Dumper=c_dumper, **kwargs)
+                self.assertEqual(actual, expected)
+
+    def test_dump_scalar_root(self):
+        # The C emitter would omit the document end marker after a top-level
+        # scalar, so yaml_dump must still use the Python emitter for those.
+        kwargs = {"default_flow_style": mut._FLOW_STYLE}
+        for data in (1, 1.5, "abc", None, True):
+            with self.subTest(data=data):
+                expected = yaml.dump(data, Dumper=mut._SchemaDumper, **kwargs)
+                self.assertEqual(mut.yaml_dump(data), expected)
+        self.assertEqual(mut.yaml_dump(1), "1\n...\n")
@@ -2,7 +2,10 @@ import os
 from textwrap import dedent
 import unittest
 
+import yaml
+
 from pydrake.common.schema import UniformVectorX
+import pydrake.common.yaml as mut
 from pydrake.common.yaml import (
     yaml_dump,
     yaml_load,
@@ -128,6 +131,30 @@ class TestYaml(unittest.TestCase):
         ).lstrip()
         self.assertEqual(expected_str, actual_str)
 
+    def test_libyaml(self):
+        """Checks that the libyaml-accelerated loader and dumpers (when
+        available) give the same results as the pure-Python ones.
+        """
+        data = dedent("""
+        _template: &template {foo: 1.0}
+        doc:
+          value: {<<: *template, bar: [1, 2]}
+          variant: !Gaussian {mean: 2.0, std: 4.0}
+          empty: {}
+          nested: [{a: null}, [true, 'x: y']]
+        """)
+        expected = yaml.load(data, Loader=mut._SchemaLoader)
+        for loader in mut._SCHEMA_LOADERS:
+            with self.subTest(loader=loader):
+                actual = yaml.load(data, Loader=loader)
+                self.assertDictEqual(actual, expected)
+        for python_dumper, c_dumper in mut._C_SCHEMA_DUMPERS.items():
+            with self.subTest(dumper=c_dumper):
+                self.assertEqual(
+                    yaml.dump(expected, Dumper=c_dumper),
+                    yaml.dump(expected, Dumper=python_dumper),
+                )
+
     def test_dump_misuse_error(self):
         with self.assertRaisesRegex(Exception, "use yaml_dump_typed"):
             yaml_dump(UniformVectorX(min=[-1], max=[1]))
@@ -9,6 +9,7 @@ from pathlib import Path
 from textwrap import dedent
 import typing
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -19,6 +20,7 @@ from pydrake.common.test_utilities.meta import (
     run_with_multiple_values,
 )
 from pydrake.common.value import Value
+import pydrake.common.yaml as mut
 from pydrake.common.yaml import yaml_dump_typed, yaml_load_typed
 
 # To provide test coverage for all of the special cases of YAML loading, we'll
@@ -807,6 +809,45 @@ class TestYamlTypedRead(unittest.TestCase, metaclass=ValueParameterizedTest):
         with self.assertRaisesRegex(RuntimeError, "UnknownTag.*match"):
             yaml_load_typed(schema=VariantStruct, data=data, **options)
 
+    def test_read_variant_order(self):
+        # Python's typing considers these two unions to be equal, but their
+        # default (i.e., first) types differ. The cached load plans must not
+        # confuse them.
+        @dc.dataclass
+        class FloatFirst:
+            value: FloatStruct | StringStruct = dc.field(
+                default_factory=FloatStruct
+            )
+
+        @dc.dataclass
+        class StringFirst:
+            value: StringStruct | FloatStruct = dc.field(
+                default_factory=StringStruct
+            )
+
+        data = "value: { value: '1' }"
+        x = yaml_load_typed(schema=FloatFirst, data=data)
+        self.assertEqual(x.value, FloatStruct(1.0))
+        y = yaml_load_typed(schema=StringFirst, data=data)
+        self.assertEqual(y.value, StringStruct("1"))
+
+    def test_read_plan_cache_bound(self):
+        # The plan caches are bounded, so a caller that creates a new schema
+        # type for every load does not grow them without limit.
+        old_max_plans = mut._MAX_LOAD_PLANS
+        mut._MAX_LOAD_PLANS = 4
+        try:
+            for i in range(10):
+                schema = dc.make_dataclass(
+                    f"Temp{i}", [("value", float, dc.field(default=0.0))]
+                )
+                x = yaml_load_typed(schema=schema, data="value: 1.0")
+                self.assertEqual(x.value, 1.0)
+                self.assertLessEqual(len(mut._LOAD_PLANS), 4)
+                self.assertLessEqual(len(mut._FIELDS_PLANS), 4)
+        finally:
+            mut._MAX_LOAD_PLANS = old_max_plans
+
     @run_with_multiple_values(_all_typed_read_options())
     def test_read_list_variant(self, *, options):
         data = dedent("""
@@ -902,6 +943,57 @@ class TestYamlTypedRead(unittest.TestCase, metaclass=ValueParameterizedTest):
         x = yaml_load_typed(schema=NumpyStruct, data=data, **options)
         np.testing.assert_equal(x.value, np.array(expected), verbose=True)
 
+    @run_with_multiple_values(_all_typed_read_options())
+    def test_read_np_binary(self, *, options):
+        # The data is float64 [0.0, 1.0, ..., 5.0] in row-major order.
+        data = dedent("""
+        value: !BinaryArray
+          dtype: <f8
+          shape: [2, 3]
+          data: !!binary |
+            AAAAAAAAAAAAAAAAAADwPwAAAAAAAABAAAAAAAAACEAAAAAAAAAQQAAAAAAAABRA
+        """)
+        expected = [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+        x = yaml_load_typed(schema=NumpyStruct, data=data, **options)
+        np.testing.assert_equal(x.value, np.array(expected), verbose=True)
+
+        # The array is also recognized inside of a variant or a list.
+        data = dedent("""
+        value: !NumpyStruct
+          value: !BinaryArray {dtype: <f8, shape: [0], data: !!binary ""}
+        """)
+        x = yaml_load_typed(schema=VariantStruct, data=data, **options)
+        np.testing.assert_equal(x.value.value, np.array([]), verbose=True)
+        data = dedent("""
+        value:
+        - !NumpyStruct
+          value: !BinaryArray
+            dtype: <f8
+            shape: [1]
+            data: !!binary AAAAAAAA8D8=
+        """)
+        x = yaml_load_typed(schema=ListVariantStruct, data=data, **options)
+        np.testing.assert_equal(x.value[0].value, np.array([1.0]))
+
+    def test_read_np_binary_errors(self):
+        cases = [
+            ("dtype: <f4, shape: [1], data: !!binary AACAPw==", "dtype"),
+            ("dtype: <f8, shape: [-1], data: !!binary ''", "shape"),
+            ("dtype: <f8, shape: foo, data: !!binary ''", "shape"),
+            (
+                "dtype: <f8, shape: [1000000, 1000000], data: !!binary ''",
+                "bytes",
+            ),
+            ("dtype: <f8, shape: [1], data: AAAAAAAA8D8=", "!!binary"),
+            ("dtype: <f8, shape: [2], data: !!binary AAAAAAAA8D8=", "bytes"),
+            ("dtype: <f8, shape: [0], data: !!binary '', x: 1", "keys"),
+        ]
+        for fields, error_regex in cases:
+            with self.subTest(fields=fields):
+                data = f"value: !BinaryArray {{{fields}}}"
+                with self.assertRaisesRegex(RuntimeError, error_regex):
+                    yaml_load_typed(schema=NumpyStruct, data=data)
+
     @run_with_multiple_values(_all_typed_read_options())
     def test_read_np_missing(self, *, options):
         schema = NumpyStruct
@@ -1050,6 +1142,107 @@ class TestYamlTypedReadAcceptance(unittest.TestCase):
         result = yaml_load_typed(schema=StringStruct, filename=filename)
         self.assertEqual(result.value, "some_value_1")
 
+    def test_load_cache(self):
+        cache_dir = Path(os.environ["TEST_TMPDIR"]) / "load_cache"
+        filename = Path(os.environ["TEST_TMPDIR"]) / "load_cache.yaml"
+        filename.write_text("child: { value: [1.0, 2.0] }", encoding="utf-8")
+        kwargs = dict(
+            schema=ListStruct,
+            filename=filename,
+            child_name="child",
+            cache_dir=cache_dir,
+        )
+
+        # The first load populates the cache.
+        x = yaml_load_typed(**kwargs)
+        self.assertEqual(x.value, [1.0, 2.0])
+        self.assertEqual(len(list(cache_dir.glob("*.pickle"))), 1)
+
+        # The second load is a cache hit, and returns a fresh copy.
+        y = yaml_load_typed(**kwargs)
+        self.assertEqual(y, x)
+        y.value.append(3.0)
+        z = yaml_load_typed(**kwargs)
+        self.assertEqual(z.value, [1.0, 2.0])
+        self.assertEqual(len(list(cache_dir.glob("*.pickle"))), 1)
+
+        # A change to the content, defaults, or options misses the cache.
+        x = yaml_load_typed(**kwargs, defaults=ListStruct(value=[]))
+        self.assertEqual(x.value, [1.0, 2.0])
+        x = yaml_load_typed(**kwargs, allow_yaml_with_no_schema=True)
+        self.assertEqual(x.value, [1.0, 2.0])
+        filename.write_text("child: { value: [3.0] }", encoding="utf-8")
+        x = yaml_load_typed(**kwargs)
+        self.assertEqual(x.value, [3.0])
+        self.assertEqual(len(list(cache_dir.glob("*.pickle"))), 4)
+
+        # Loading from data (instead of a file) uses the same cache.
+        x = yaml_load_typed(
+            schema=ListStruct,
+            data="child: { value: [3.0] }",
+            child_name="child",
+            cache_dir=cache_dir,
+        )
+        self.assertEqual(x.value, [3.0])
+        self.assertEqual(len(list(cache_dir.glob("*.pickle"))), 4)
+
+        # Errors are still reported in terms of the filename.
+        filename.write_text("child: { value: [", encoding="utf-8")
+        with self.assertRaisesRegex(Exception, "load_cache.yaml"):
+            yaml_load_typed(**kwargs)
+
+    def test_load_cache_eviction(self):
+        cache_dir = Path(os.environ["TEST_TMPDIR"]) / "load_cache_eviction"
+
+        def load(value):
+            return yaml_load_typed(
+                schema=FloatStruct, data=f"value: {value}", cache_dir=cache_dir
+            )
+
+        load(1.0)
+        (entry_1,) = cache_dir.glob("*.pickle")
+        load(2.0)
+        (entry_2,) = set(cache_dir.glob("*.pickle")) - {entry_1}
+        os.utime(entry_1, (1, 1))
+        os.utime(entry_2, (2, 2))
+        # A cache hit marks entry_1 as the most recently used.
+        load(1.0)
+        # Shrink the cache to fit only two entries; adding a third entry will
+        # evict the least-recently-used one.
+        entry_size = entry_1.stat().st_size
+        old_max_bytes = mut._TYPED_CACHE_MAX_BYTES
+        mut._TYPED_CACHE_MAX_BYTES = 2 * entry_size
+        try:
+            load(3.0)
+        finally:
+            mut._TYPED_CACHE_MAX_BYTES = old_max_bytes
+        self.assertTrue(entry_1.exists())
+        self.assertFalse(entry_2.exists())
+        self.assertEqual(len(list(cache_dir.glob("*.pickle"))), 2)
+
+    def test_load_cache_corrupt(self):
+        cache_dir = Path(os.environ["TEST_TMPDIR"]) / "load_cache_corrupt"
+        kwargs = dict(schema=FloatStruct, data="value: 1.0")
+        x = yaml_load_typed(**kwargs, cache_dir=cache_dir)
+        (entry,) = cache_dir.glob("*.pickle")
+        entry.write_bytes(b"garbage")
+        y = yaml_load_typed(**kwargs, cache_dir=cache_dir)
+        self.assertEqual(y, x)
+        self.assertNotEqual(entry.read_bytes(), b"garbage")
+        # A truncated entry is also a miss.
+        entry.write_bytes(entry.read_bytes()[:10])
+        z = yaml_load_typed(**kwargs, cache_dir=cache_dir)
+        self.assertEqual(z, x)
+
+    def test_load_cache_write_failure(self):
+        cache_dir = Path(os.environ["TEST_TMPDIR"]) / "load_cache_failure"
+        kwargs = dict(schema=FloatStruct, data="value: 1.0")
+        with mock.patch.object(mut.os, "replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                yaml_load_typed(**kwargs, cache_dir=cache_dir)
+        # The temporary file was cleaned up.
+        self.assertEqual(list(cache_dir.iterdir()), [])
+
     def test_read_bad_schema(self):
         # N.B. This test covers python-specific error handling, so does not
         # have any corrresponding cases in the C++ unit tests.
@@ -1423,6 +1616,52 @@ class TestYamlTypedWrite(unittest.TestCase):
         """),
         )
 
+    def test_write_numpy_binary(self):
+        x = NumpyStruct(value=np.arange(6.0).reshape((2, 3)))
+        expected_doc = dedent("""\
+        value: !BinaryArray
+          dtype: <f8
+          shape: [2, 3]
+          data: !!binary |
+            AAAAAAAAAAAAAAAAAADwPwAAAAAAAABAAAAAAAAACEAAAAAAAAAQQAAAAAAAABRA
+        """)
+        self.assertEqual(
+            yaml_dump_typed(x, binary_array_min_size=6), expected_doc
+        )
+        # Small arrays are still written as lists.
+        self.assertEqual(
+            yaml_dump_typed(x, binary_array_min_size=7),
+            dedent("""\
+        value:
+        - [0.0, 1.0, 2.0]
+        - [3.0, 4.0, 5.0]
+        """),
+        )
+        # The order of the values is row-major, independent of the memory
+        # layout of the array.
+        y = NumpyStruct(value=np.asfortranarray(x.value))
+        self.assertEqual(
+            yaml_dump_typed(y, binary_array_min_size=6), expected_doc
+        )
+        # An unchanged array is elided when dumping with defaults.
+        self.assertEqual(
+            yaml_dump_typed(x, defaults=x, binary_array_min_size=6), "{}\n"
+        )
+
+    def test_write_numpy_binary_round_trip(self):
+        x = ListVariantStruct(
+            value=[
+                NumpyStruct(value=np.linspace(-1.0, 1.0, 100)),
+                NumpyStruct(value=np.array([[nan, inf], [-inf, 1e-300]])),
+                NumpyStruct(value=np.array([])),
+            ]
+        )
+        doc = yaml_dump_typed(x, binary_array_min_size=0)
+        self.assertEqual(doc.count("!BinaryArray"), 3)
+        readback = yaml_load_typed(schema=ListVariantStruct, data=doc)
+        for expected, actual in zip(x.value, readback.value):
+            np.testing.assert_equal(actual.value, expected.value)
+
     def test_write_nested(self):
         x = OuterStruct()
         x.outer_value = 1.0
@@ -1792,3 +2031,18 @@ class TestYamlTypedReadPybind11(unittest.TestCase):
         self.assertEqual(x.some_map, dict(one=1.0))
         self.assertEqual(x.some_variant.quux, 1.0)
         self.assertEqual(yaml_dump_typed(x), data)
+
+    def test_mydata2_cache(self):
+        cache_dir = Path(os.environ["TEST_TMPDIR"]) / "mydata2_cache"
+        data = dedent("""\
+        some_double: 2.0
+        some_eigen:
+        - [2.0]
+        some_variant: !MyData1
+          quux: 2.0
+        """)
+        x = yaml_load_typed(schema=MyData2, data=data, cache_dir=cache_dir)
+        self.assertEqual(len(list(cache_dir.glob("*.pickle"))), 1)
+        y = yaml_load_typed(schema=MyData2, data=data, cache_dir=cache_dir)
+        self.assertIsNot(y, x)
+        self.assertEqual(yaml_dump_typed(y), yaml_dump_typed(x))
@@ -2,8 +2,13 @@ import collections.abc
 import copy
 import dataclasses
 import functools
+import hashlib
+import io
 import math
+import os
 from pathlib import Path
+import pickle
+import tempfile
 import types
 import typing
 
@@ -13,6 +18,11 @@ import yaml.representer
 
 from pydrake.common import pretty_class_name
 
+# When PyYAML was built with libyaml, we use its C-accelerated parser and
+# emitter in place of the pure-Python ones. The loader and dumper classes below
+# come in pairs (e.g., _SchemaLoader and _CSchemaLoader) with the same behavior.
+_HAS_LIBYAML = getattr(yaml, "__with_libyaml__", False)
+
 
 class _SchemaLoader(yaml.loader.SafeLoader):
     """Customizes SafeLoader for the purposes of this module."""
@@ -31,13 +41,27 @@ class _SchemaLoader(yaml.loader.SafeLoader):
           "std": 4.0,
         }.
         """
-        assert type(loader) is _SchemaLoader, loader
+        assert isinstance(loader, _SCHEMA_LOADERS), loader
         result = loader.construct_mapping(node)
         result.update({"_tag": tag})
         return result
 
 
 _SchemaLoader.add_multi_constructor("", _SchemaLoader._handle_multi_variant)
+_SCHEMA_LOADERS = (_SchemaLoader,)
+
+if _HAS_LIBYAML:
+
+    class _CSchemaLoader(yaml.CSafeLoader):
+        """Like _SchemaLoader, but using libyaml's C parser."""
+
+    _CSchemaLoader.add_multi_constructor(
+        "", _SchemaLoader._handle_multi_variant
+    )
+    _SCHEMA_LOADERS += (_CSchemaLoader,)
+
+# The loader used by this module's functions.
+_DEFAULT_SCHEMA_LOADER = _SCHEMA_LOADERS[-1]
 
 
 def yaml_load_data(data, *, private=False):
@@ -55,7 +79,7 @@ def yaml_load_data(data, *, private=False):
     without any schema checking nor default values. To load with respect to
     a schema with defaults, see ``yaml_load_typed()``.
     """
-    result = yaml.load(data, Loader=_SchemaLoader)
+    result = yaml.load(data, Loader=_DEFAULT_SCHEMA_LOADER)
     if not private:
         try:
             all_keys = list(result.keys())
@@ -153,7 +177,7 @@ class _SchemaDumper(yaml.dumper.SafeDumper):
             del data["_tag"]
             return self.represent_mapping(tag, data)
         else:
-            return super().represent_dict(data)
+            return self.represent_dict(data)
 
     def _represent_undefined(self, data):
         if getattr(type(data), "__module__", "").startswith("pydrake"):
@@ -162,7 +186,7 @@ class _SchemaDumper(yaml.dumper.SafeDumper):
                 "use yaml_dump_typed instead",
                 data,
             )
-        return super().represent_undefined(data)
+        return self.represent_undefined(data)
 
 
 _SchemaDumper.add_representer(None, _SchemaDumper._represent_undefined)
@@ -190,21 +214,80 @@ class _DrakeFlowSchemaDumper(_SchemaDumper):
         return super().serialize_node(node, parent, index)
 
 
+# Maps each pure-Python dumper class to its libyaml-accelerated counterpart.
+_C_SCHEMA_DUMPERS = {}
+
+
+class _RequiresPythonDumper(Exception):
+    """Raised by the libyaml-accelerated dumpers when the data uses a feature
+    that only the pure-Python dumpers support.
+    """
+
+
+if _HAS_LIBYAML:
+
+    class _CSchemaDumper(yaml.CSafeDumper):
+        """Like _SchemaDumper, but using libyaml's C emitter.
+
+        The C emitter doesn't consult DEFAULT_TAG_PREFIXES, so it cannot spell
+        ExplicitScalar tags as `!!int`; data containing an ExplicitScalar must
+        be dumped using the pure-Python _SchemaDumper instead.
+        """
+
+        def _represent_explicit_scalar(self, explicit_scalar):
+            raise _RequiresPythonDumper()
+
+    _CSchemaDumper.add_representer(None, _SchemaDumper._represent_undefined)
+    _CSchemaDumper.add_representer(dict, _SchemaDumper._represent_dict)
+    _CSchemaDumper.add_representer(
+        _SchemaDumper.ExplicitScalar, _CSchemaDumper._represent_explicit_scalar
+    )
+
+    class _CDrakeFlowSchemaDumper(_CSchemaDumper):
+        """Like _DrakeFlowSchemaDumper, but using libyaml's C emitter. The C
+        emitter doesn't call serialize_node(), so we choose the mapping flow
+        style while representing instead.
+        """
+
+        def represent_mapping(self, tag, mapping, flow_style=None):
+            node = super().represent_mapping(tag, mapping, flow_style)
+            node.flow_style = len(node.value) == 0
+            return node
+
+    _C_SCHEMA_DUMPERS[_SchemaDumper] = _CSchemaDumper
+    _C_SCHEMA_DUMPERS[_DrakeFlowSchemaDumper] = _CDrakeFlowSchemaDumper
+
+
+def _yaml_dump_str(data, *, Dumper, **kwargs):
+    """Returns `yaml.dump(data, Dumper=Dumper, **kwargs)`, using the libyaml-
+    accelerated counterpart of the given Dumper class when possible.
+
+    The C emitter omits the `...` document end marker after a top-level
+    scalar, so only a top-level dict or list uses the C emitter.
+    """
+    c_dumper = _C_SCHEMA_DUMPERS.get(Dumper)
+    if c_dumper is not None and isinstance(data, (dict, list)):
+        try:
+            return yaml.dump(data, Dumper=c_dumper, **kwargs)
+        except _RequiresPythonDumper:
+            pass
+    return yaml.dump(data, Dumper=Dumper, **kwargs)
+
+
 def yaml_dump(data, *, filename=None):
     """Dumps a yaml object to a string or `filename` (if specified).
 
     This is the counterpart to `yaml_load(..., private=True)`, and will permit
     re-expressing the same tagged data.
     """
+    result = _yaml_dump_str(
+        data, Dumper=_SchemaDumper, default_flow_style=_FLOW_STYLE
+    )
     if filename is not None:
         with open(filename, "w") as f:
-            yaml.dump(
-                data, f, Dumper=_SchemaDumper, default_flow_style=_FLOW_STYLE
-            )
+            f.write(result)
     else:
-        return yaml.dump(
-            data, Dumper=_SchemaDumper, default_flow_style=_FLOW_STYLE
-        )
+        return result
 
 
 _LoadYamlOptions = collections.namedtuple(
@@ -276,16 +359,91 @@ def _create_from_schema(*, schema, forthcoming_value):
     When schema is a sum type (e.g., typing.Union[...]), returns None.
 
     When schema is a numpy type, returns a 1-d ndarray with the same size as
-    the ``forthcoming_value`` if provided, otherwise an empty array.
+    the ``forthcoming_value`` if provided, otherwise an empty array. When the
+    ``forthcoming_value`` is a ``!BinaryArray`` mapping, returns an empty
+    placeholder instead; the mapping's (untrusted) shape is only used once it
+    has been validated by _decode_binary_array.
     """
     if _is_union(typing.get_origin(schema)):
         return None
     if schema == np.ndarray:
+        if _is_binary_array(forthcoming_value):
+            return np.empty(0)
         size = len(forthcoming_value)
         return np.array([math.nan] * size)
     return schema()
 
 
+# The yaml tag for our compact encoding of a float64 np.ndarray, as a mapping
+# with keys `dtype`, `shape`, and `data`. The `data` is the array's values in
+# row-major (C) order as little-endian float64 bytes, which pyyaml dumps using
+# base64 with the !!binary tag. The C++ YamlReadArchive reads this encoding
+# into Eigen matrices, as well.
+_BINARY_ARRAY_TAG = "!BinaryArray"
+_BINARY_ARRAY_DTYPE = "<f8"
+
+
+def _is_binary_array(yaml_value):
+    """Returns True iff the yaml_value is a !BinaryArray mapping."""
+    return (
+        isinstance(yaml_value, dict)
+        and yaml_value.get("_tag") == _BINARY_ARRAY_TAG
+    )
+
+
+def _encode_binary_array(value):
+    """Returns the !BinaryArray mapping for the given float64 ndarray."""
+    return {
+        "_tag": _BINARY_ARRAY_TAG,
+        "dtype": _BINARY_ARRAY_DTYPE,
+        "shape": list(value.shape),
+        "data": value.astype(_BINARY_ARRAY_DTYPE, copy=False).tobytes(),
+    }
+
+
+def _decode_binary_array(*, name, yaml_value):
+    """Returns a new ndarray holding the values of the given !BinaryArray
+    mapping. The bytes are copied directly into a preallocated array, without
+    any per-element conversions.
+    """
+    extra_keys = set(yaml_value) - {"_tag", "dtype", "shape", "data"}
+    if extra_keys:
+        raise RuntimeError(
+            f"The {_BINARY_ARRAY_TAG} for '{name}' has unknown keys"
+            f" {sorted(extra_keys)}"
+        )
+    dtype = yaml_value.get("dtype")
+    if dtype != _BINARY_ARRAY_DTYPE:
+        raise RuntimeError(
+            f"The {_BINARY_ARRAY_TAG} for '{name}' has unsupported dtype"
+            f" {dtype!r}; only {_BINARY_ARRAY_DTYPE!r} is supported"
+        )
+    shape = yaml_value.get("shape")
+    if not isinstance(shape, list) or not all(
+        type(dim) is int and dim >= 0 for dim in shape
+    ):
+        raise RuntimeError(
+            f"The {_BINARY_ARRAY_TAG} for '{name}' has invalid shape {shape!r}"
+        )
+    data = yaml_value.get("data")
+    if not isinstance(data, bytes):
+        raise RuntimeError(
+            f"The {_BINARY_ARRAY_TAG} for '{name}' must have !!binary data,"
+            f" not {type(data)}"
+        )
+    # Check the size before allocating anything, so that a bogus shape can't
+    # request an enormous array.
+    expected_nbytes = math.prod(shape) * np.dtype(_BINARY_ARRAY_DTYPE).itemsize
+    if len(data) != expected_nbytes:
+        raise RuntimeError(
+            f"The {_BINARY_ARRAY_TAG} for '{name}' has {len(data)} bytes of"
+            f" data but its shape {shape} requires {expected_nbytes}"
+        )
+    result = np.empty(shape)
+    result.reshape(-1)[:] = np.frombuffer(data, dtype=_BINARY_ARRAY_DTYPE)
+    return result
+
+
 # For details, see:
 #  https://yaml.org/spec/1.2.2/#scalars
 #  https://yaml.org/spec/1.2.2/#json-schema
@@ -328,6 +486,143 @@ def _convert_yaml_primitive_to_schema_type(*, yaml_value, value_schema):
     return None
 
 
+class _LoadPlan(typing.NamedTuple):
+    """A precomputed summary of how _merge_yaml_dict_item_into_target parses
+    yaml data into a given value_schema type. See _get_load_plan().
+    """
+
+    # One of "primitive", "optional", "path", "ndarray", "list", "dict",
+    # "union", "unsupported_generic", or "class".
+    kind: str
+    # The results of typing.get_origin and typing.get_args for the schema.
+    generic_base: typing.Any
+    generic_args: tuple
+    # For "optional", the non-None type. For "list" and "dict", the type of
+    # the values.
+    nested_type: typing.Any = None
+    # For "union", maps each yaml type tag name to a pair of the matching
+    # type argument and its origin type (for isinstance checks).
+    tags: dict | None = None
+
+
+# Maps id(value_schema) => (value_schema, _LoadPlan). This is keyed on the
+# identity of the type object, not its equality, because typing considers
+# Union[A, B] to be equal to Union[B, A] but for us the order matters. Holding
+# the value_schema in the value keeps its id() from being reused.
+_LOAD_PLANS = dict()
+
+# The most plans to keep. Schema types declared as dataclass fields are long-
+# lived, but a caller that builds a new (equal) generic alias for every load
+# would otherwise grow the cache without bound.
+_MAX_LOAD_PLANS = 10_000
+
+
+def _get_load_plan(value_schema):
+    """Returns the _LoadPlan for the given value_schema. Plans are cached per
+    type object, so that the reflection on each schema type only happens once
+    no matter how many times (or how deeply nested) it's loaded.
+    """
+    entry = _LOAD_PLANS.get(id(value_schema))
+    if entry is not None:
+        return entry[1]
+    if len(_LOAD_PLANS) >= _MAX_LOAD_PLANS:
+        _LOAD_PLANS.clear()
+    plan = _make_load_plan(value_schema)
+    _LOAD_PLANS[id(value_schema)] = (value_schema, plan)
+    return plan
+
+
+def _make_load_plan(value_schema):
+    """Computes (without caching) the _LoadPlan for the given value_schema."""
+    generic_base = typing.get_origin(value_schema)
+    generic_args = typing.get_args(value_schema)
+    plan = functools.partial(
+        _LoadPlan, generic_base=generic_base, generic_args=generic_args
+    )
+    if value_schema in _PRIMITIVE_YAML_TYPES:
+        return plan(kind="primitive")
+    nested_optional_type = _get_nested_optional_type(value_schema)
+    if nested_optional_type is not None:
+        return plan(kind="optional", nested_type=nested_optional_type)
+    if value_schema == Path:
+        return plan(kind="path")
+    if value_schema == np.ndarray:
+        return plan(kind="ndarray")
+    if generic_base in (list, typing.List):
+        (value_type,) = generic_args
+        return plan(kind="list", nested_type=value_type)
+    if generic_base in (dict, collections.abc.Mapping):
+        (key_type, value_type) = generic_args
+        # This requirement matches what we have in C++. Allowing sequences
+        # or maps as keys would mean we're no longer JSON-compatible.
+        assert key_type is str
+        return plan(kind="dict", nested_type=value_type)
+    if _is_union(generic_base):
+        tags = dict()
+        for candidate in generic_args:
+            candidate_name = pretty_class_name(candidate)
+            if "[" in candidate_name:
+                # When matching vs template type, compare the base name.
+                candidate_name = candidate_name.split("[", 1)[0]
+            candidate_origin = typing.get_origin(candidate)
+            if candidate_origin is None:
+                candidate_origin = candidate
+            # When more than one candidate has the same name, the first wins.
+            tags.setdefault(candidate_name, (candidate, candidate_origin))
+        return plan(kind="union", tags=tags)
+    if generic_base is not None:
+        return plan(kind="unsupported_generic")
+    return plan(kind="class")
+
+
+class _FieldsPlan(typing.NamedTuple):
+    """A precomputed summary of the fields of a schema type, as used by
+    _merge_yaml_dict_into_target. See _get_fields_plan().
+    """
+
+    # The (name, type) of each field, in order.
+    fields: tuple
+    # The names of all fields.
+    names: frozenset
+    # The names of the fields whose type is Optional.
+    optionals: frozenset
+
+
+# Maps id(schema) => (schema, _FieldsPlan). This is keyed and bounded the same
+# way as _LOAD_PLANS (using _MAX_LOAD_PLANS).
+_FIELDS_PLANS = dict()
+
+
+def _get_fields_plan(schema):
+    """Returns the _FieldsPlan for the given schema type. Plans are cached per
+    type object; see _get_load_plan().
+    """
+    entry = _FIELDS_PLANS.get(id(schema))
+    if entry is not None:
+        return entry[1]
+    if len(_FIELDS_PLANS) >= _MAX_LOAD_PLANS:
+        _FIELDS_PLANS.clear()
+    plan = _make_fields_plan(schema)
+    _FIELDS_PLANS[id(schema)] = (schema, plan)
+    return plan
+
+
+def _make_fields_plan(schema):
+    """Computes (without caching) the _FieldsPlan for the given schema."""
+    static_field_map = _enumerate_field_types(schema)
+    return _FieldsPlan(
+        fields=tuple(static_field_map.items()),
+        names=frozenset(static_field_map.keys()),
+        optionals=frozenset(
+            [
+                name
+                for name, sub_schema in static_field_map.items()
+                if _get_load_plan(sub_schema).kind == "optional"
+            ]
+        ),
+    )
+
+
 def _merge_yaml_dict_item_into_target(
     *, options, name, yaml_value, target, value_schema
 ):
@@ -343,11 +638,14 @@ def _merge_yaml_dict_item_into_target(
         getter = functools.partial(getattr, target, name)
         setter = functools.partial(setattr, target, name)
 
+    plan = _get_load_plan(value_schema)
+    kind = plan.kind
+
     # Handle all of the plain YAML scalars:
     #  https://yaml.org/spec/1.2.2/#scalars
     #  https://yaml.org/spec/1.2.2/#json-schema
     #  https://yaml.org/type/binary.html
-    if value_schema in _PRIMITIVE_YAML_TYPES:
+    if kind == "primitive":
         if type(yaml_value) in (list, dict):
             raise RuntimeError(
                 f"Expected a {value_schema} value for '{name}' but instead got"
@@ -366,8 +664,8 @@ def _merge_yaml_dict_item_into_target(
         return
 
     # Handle nullable types (std::optional<T> or typing.Optional[T]).
-    nested_optional_type = _get_nested_optional_type(value_schema)
-    if nested_optional_type is not None:
+    if kind == "optional":
+        nested_optional_type = plan.nested_type
         # If the yaml was null, the Python field will be None.
         if yaml_value is None:
             setter(None)
@@ -391,7 +689,7 @@ def _merge_yaml_dict_item_into_target(
         return
 
     # Handle pathlib.Path.
-    if value_schema == Path:
+    if kind == "path":
         if not isinstance(yaml_value, str):
             raise RuntimeError(
                 f"Expected a !!str value for '{name}: Path' but instead got"
@@ -402,23 +700,21 @@ def _merge_yaml_dict_item_into_target(
         return
 
     # Handle NumPy types.
-    if value_schema == np.ndarray:
-        new_value = np.array(yaml_value, dtype=float)
+    if kind == "ndarray":
+        if _is_binary_array(yaml_value):
+            new_value = _decode_binary_array(name=name, yaml_value=yaml_value)
+        else:
+            new_value = np.array(yaml_value, dtype=float)
         setter(new_value)
         return
 
-    # Check if the field is generic like list[str]; if yes, the generic_base
-    # will be, e.g., `list` and generic_args will be, e.g., `[str]`.
-    generic_base = typing.get_origin(value_schema)
-    generic_args = typing.get_args(value_schema)
-
     # Handle YAML sequences:
     #  https://yaml.org/spec/1.2.2/#sequence
     #
     # In Drake's YamlLoad convention, merging a sequence denotes *overwriting*
     # what was there.
-    if generic_base in (list, typing.List):
-        (value_type,) = generic_args
+    if kind == "list":
+        value_type = plan.nested_type
         new_value = []
         for sub_yaml_value in yaml_value:
             sub_target = {
@@ -442,11 +738,8 @@ def _merge_yaml_dict_item_into_target(
     #
     # In Drake's YamlLoad convention, merging a mapping denotes *updating*
     # what was there iff retain_map_defaults was set.
-    if generic_base in (dict, collections.abc.Mapping):
-        (key_type, value_type) = generic_args
-        # This requirement matches what we have in C++. Allowing sequences
-        # or maps as keys would mean we're no longer JSON-compatible.
-        assert key_type is str
+    if kind == "dict":
+        value_type = plan.nested_type
         if options.retain_map_defaults:
             old_value = getter()
             new_value = copy.deepcopy(old_value)
@@ -469,7 +762,8 @@ def _merge_yaml_dict_item_into_target(
         return
 
     # Handle schema sum types (std::variant<...> or typing.Union[...]).
-    if _is_union(generic_base):
+    if kind == "union":
+        generic_args = plan.generic_args
         # The YAML data might be a scalar value (as opposed to a mapping).
         yaml_value_type = type(yaml_value)
         if yaml_value_type in list(_PRIMITIVE_YAML_TYPES) + [type(None)]:
@@ -506,34 +800,34 @@ def _merge_yaml_dict_item_into_target(
         # A mapping can optionally specify a type tag to choose which Union[]
         # type to parse into. When none is provided, the default is to use the
         # first option listed in the sum type (to match what C++ does).
-        if yaml_value is not None and "_tag" in yaml_value:
+        if _is_binary_array(yaml_value) and np.ndarray in generic_args:
+            # The tag is part of the array encoding, not a type selector.
+            refined_yaml_value = yaml_value
+            refined_value_schema = np.ndarray
+            refined_value_schema_origin = np.ndarray
+        elif yaml_value is not None and "_tag" in yaml_value:
             # Pop the type tag out of the yaml_value dictionary.
             refined_yaml_value = copy.copy(yaml_value)
             _tag = refined_yaml_value.pop("_tag")
             assert _tag.startswith("!"), yaml_value
             tag = _tag[1:]
             # Find which Union[] type argument matches the tag.
-            refined_value_schema = None
-            for candidate in generic_args:
-                candidate_name = pretty_class_name(candidate)
-                if "[" in candidate_name:
-                    # When matching vs template type, compare the base name.
-                    candidate_name = candidate_name.split("[", 1)[0]
-                if candidate_name == tag:
-                    refined_value_schema = candidate
-                    break
-            else:
+            match = plan.tags.get(tag)
+            if match is None:
                 raise RuntimeError(
                     f"The yaml type tag value '{tag}' did not match any of the"
                     f" allowed type options for '{name}' ({generic_args})"
                 )
+            refined_value_schema, refined_value_schema_origin = match
         else:
             refined_yaml_value = yaml_value
             refined_value_schema = generic_args[0]
+            refined_value_schema_origin = typing.get_origin(
+                refined_value_schema
+            )
+            if refined_value_schema_origin is None:
+                refined_value_schema_origin = refined_value_schema
         # Self-call, but now with an updated value and type.
-        refined_value_schema_origin = typing.get_origin(refined_value_schema)
-        if refined_value_schema_origin is None:
-            refined_value_schema_origin = refined_value_schema
         if not isinstance(getter(), refined_value_schema_origin):
             setter(
                 _create_from_schema(
@@ -551,14 +845,15 @@ def _merge_yaml_dict_item_into_target(
         return
 
     # By this point, we've handled all known cases of generic types.
-    if generic_base is not None:
+    if kind == "unsupported_generic":
         raise NotImplementedError(
-            f"The generic type {generic_base} of {value_schema} is "
+            f"The generic type {plan.generic_base} of {value_schema} is "
             "not yet supported"
         )
 
     # If the value_schema is neither primitive nor generic, then we'll assume
     # it's a directly-nested subclass.
+    assert kind == "class"
     old_value = getter()
     new_value = copy.deepcopy(old_value)
     _merge_yaml_dict_into_target(
@@ -578,21 +873,16 @@ def _merge_yaml_dict_into_target(*, options, yaml_dict, target, target_schema):
     """
     assert isinstance(yaml_dict, collections.abc.Mapping), yaml_dict
     assert target is not None
-    static_field_map = _enumerate_field_types(target_schema)
-    schema_names = list(static_field_map.keys())
-    schema_optionals = set(
-        [
-            name
-            for name, sub_schema in static_field_map.items()
-            if _get_nested_optional_type(sub_schema) is not None
-        ]
-    )
-    yaml_names = list(yaml_dict.keys())
-    extra_yaml_names = [name for name in yaml_names if name not in schema_names]
+    fields_plan = _get_fields_plan(target_schema)
+    schema_names = fields_plan.names
+    schema_optionals = fields_plan.optionals
+    extra_yaml_names = [
+        name for name in yaml_dict.keys() if name not in schema_names
+    ]
     missing_yaml_names = [
         name
-        for name, sub_schema in static_field_map.items()
-        if name not in yaml_names and name not in schema_optionals
+        for name, sub_schema in fields_plan.fields
+        if name not in yaml_dict and name not in schema_optionals
     ]
     if extra_yaml_names and not options.allow_yaml_with_no_schema:
         raise RuntimeError(
@@ -602,7 +892,7 @@ def _merge_yaml_dict_into_target(*, options, yaml_dict, target, target_schema):
         raise RuntimeError(
             f"The fields {missing_yaml_names} were missing in the yaml data"
         )
-    for name, sub_schema in static_field_map.items():
+    for name, sub_schema in fields_plan.fields:
         if name in yaml_dict:
             sub_value = yaml_dict[name]
         elif name in schema_optionals:
@@ -627,6 +917,156 @@ def _merge_yaml_dict_into_target(*, options, yaml_dict, target, target_schema):
         )
 
 
+# Bump this number whenever the pickled format of the yaml_load_typed cache
+# changes in an incompatible way.
+_TYPED_CACHE_VERSION = 1
+
+# The most bytes to keep in a yaml_load_typed cache_dir. When a write takes the
+# cache over this limit, the least-recently-used entries are evicted.
+_TYPED_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _restore_from_fields(cls, values):
+    """Unpickles a bound C++ class that was pickled by _TypedCachePickler."""
+    result = cls()
+    for name, value in values.items():
+        setattr(result, name, value)
+    return result
+
+
+class _TypedCachePickler(pickle.Pickler):
+    """Pickles yaml_load_typed results for the on-disk cache. Bound C++ classes
+    that use DefAttributesUsingSerialize don't support pickling on their own,
+    so here we pickle them as their __fields__ values instead (accessing them
+    the same way as yaml_dump_typed and yaml_load_typed do).
+    """
+
+    def reducer_override(self, obj):
+        cls = type(obj)
+        fields = getattr(cls, "__fields__", None)
+        if fields is None or isinstance(obj, type):
+            return NotImplemented
+        if dataclasses.is_dataclass(cls):
+            return NotImplemented
+        values = {
+            field.name: _yaml_dump_get_attribute(obj=obj, name=field.name)
+            for field in fields
+        }
+        return (_restore_from_fields, (cls, values))
+
+
+def _typed_cache_pickle(value):
+    """Returns the cache's pickled bytes for the given value, or None when the
+    value cannot be pickled.
+    """
+    buffer = io.BytesIO()
+    try:
+        _TypedCachePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return buffer.getvalue()
+
+
+def _typed_cache_key(*, content, schema, child_name, options, initial):
+    """Returns the yaml_load_typed cache key for the given arguments, or None
+    when the arguments cannot be cached. The `initial` is the object that the
+    yaml document will be merged into, i.e., a copy of the defaults.
+    """
+    pickled_initial = _typed_cache_pickle(initial)
+    if pickled_initial is None:
+        return None
+    if isinstance(schema, type):
+        schema_name = f"{schema.__module__}.{schema.__qualname__}"
+    else:
+        schema_name = repr(schema)
+    hasher = hashlib.sha256()
+    for item in (
+        str(_TYPED_CACHE_VERSION),
+        hashlib.sha256(content).hexdigest(),
+        schema_name,
+        repr(child_name),
+        repr(tuple(options)),
+    ):
+        hasher.update(item.encode("utf-8"))
+        hasher.update(b"\0")
+    # Including the initial value means that changes to the schema's default
+    # values (or to the defaults=... argument) will miss the cache.
+    hasher.update(pickled_initial)
+    return hasher.hexdigest()
+
+
+def _typed_cache_read(path):
+    """Returns the cached value stored at the given path, or None on a miss."""
+    try:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+    ):
+        # A corrupt (or incompatible) entry is treated as a miss, and will be
+        # overwritten with a fresh result.
+        return None
+    try:
+        # Mark the entry as recently used (for LRU eviction).
+        os.utime(path)
+    except OSError:
+        pass
+    return result
+
+
+def _typed_cache_write(path, value):
+    """Stores the given value at the given path in the cache (if the value can
+    be pickled), and then evicts old entries as needed.
+    """
+    pickled = _typed_cache_pickle(value)
+    if pickled is None:
+        return
+    cache_dir = path.parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file and then rename it into place, so that other
+    # processes sharing the cache_dir never see a partially-written entry.
+    # If anything goes wrong (e.g., the disk is full), the temporary file is
+    # removed instead of being left behind in the cache_dir.
+    with tempfile.NamedTemporaryFile(
+        dir=cache_dir, suffix=".tmp", delete=False
+    ) as f:
+        try:
+            f.write(pickled)
+            f.close()
+            os.replace(f.name, path)
+        except BaseException:
+            f.close()
+            Path(f.name).unlink(missing_ok=True)
+            raise
+    _typed_cache_evict(cache_dir)
+
+
+def _typed_cache_evict(cache_dir):
+    """Removes the least-recently-used entries from the cache_dir until its
+    total size is at most _TYPED_CACHE_MAX_BYTES.
+    """
+    entries = []
+    for path in cache_dir.glob("*.pickle"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # Another process evicted it already.
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= _TYPED_CACHE_MAX_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total_bytes -= size
+
+
 def yaml_load_typed(
     *,
     schema=None,
@@ -637,6 +1077,7 @@ def yaml_load_typed(
     allow_yaml_with_no_schema=False,
     allow_schema_with_no_yaml=True,
     retain_map_defaults=True,
+    cache_dir=None,
 ):
     """Loads either a ``data`` str or a ``filename`` against the given
     ``schema`` type and returns an instance of that type.
@@ -674,6 +1115,18 @@ def yaml_load_typed(
            the dict contents entirely. In other words, a Mapping field in a
            schema can have default values that are left intact unless the YAML
            data provides a value *for that specific key*.
+        cache_dir: If provided, the directory of an on-disk cache of loaded
+            results, which speeds up loading the same document many times
+            (e.g., once per process in a parallel sweep). Results are keyed on
+            the YAML content (not the filename), the schema's qualified name,
+            the ``child_name``, the ``defaults`` (or default-constructed
+            schema), and the ``allow_...`` and ``retain_...`` options. A cache
+            hit returns a new, independent copy of the result. The cache is
+            stored using ``pickle``, so only use a directory that you trust.
+            Changing a schema's field types without also changing its default
+            values is not detected, so clear the cache after such changes. The
+            least-recently-used entries are evicted once the cache grows past
+            256 MiB.
     """
 
     # Infer the schema when possible.
@@ -697,6 +1150,35 @@ def yaml_load_typed(
     else:
         result = schema()
 
+    # When caching, check for a previously-loaded result.
+    cache_path = None
+    if cache_dir is not None:
+        if data is None and filename is not None:
+            with open(filename, "rb") as f:
+                content = f.read()
+            # Parse from the bytes we've already read, but keep the filename
+            # for use in error messages.
+            data = io.BytesIO(content)
+            data.name = str(filename)
+            filename = None
+        elif isinstance(data, str) and filename is None:
+            content = data.encode("utf-8")
+        else:
+            content = None
+        if content is not None:
+            key = _typed_cache_key(
+                content=content,
+                schema=schema,
+                child_name=child_name,
+                options=options,
+                initial=result,
+            )
+            if key is not None:
+                cache_path = Path(cache_dir) / f"{key}.pickle"
+                cached = _typed_cache_read(cache_path)
+                if cached is not None:
+                    return cached
+
     # Parse the YAML document.
     document = yaml_load(data=data, filename=filename)
     if child_name is not None:
@@ -715,6 +1197,8 @@ def yaml_load_typed(
         target=result,
         target_schema=schema,
     )
+    if cache_path is not None:
+        _typed_cache_write(cache_path, result)
     return result
 
 
@@ -731,14 +1215,20 @@ def _yaml_dump_get_attribute(*, obj, name):
     return getattr(obj, name)
 
 
-def _yaml_dump_typed_item(*, obj, schema):
+def _yaml_dump_typed_item(*, obj, schema, binary_array_min_size=None):
     """Given an object ``obj`` and its type ``schema``, returns the plain YAML
     object that should be serialized. Objects that are already primitive types
     (str, float, etc.) are returned unchanged. Bare collection types (List and
     Mapping) are processed recursively. Structs (dataclasses) are processed
     using their schema. The result is "plain" in the sense that's it's always
     just a tree of primitives, lists, and dicts -- no user-defined types.
+
+    When ``binary_array_min_size`` is not None, any ndarray with at least that
+    many elements is dumped as a !BinaryArray mapping instead of a list.
     """
+    recurse = functools.partial(
+        _yaml_dump_typed_item, binary_array_min_size=binary_array_min_size
+    )
     assert schema is not None
 
     # Handle all of the plain YAML scalars:
@@ -756,9 +1246,7 @@ def _yaml_dump_typed_item(*, obj, schema):
     #  https://yaml.org/spec/1.2.2/#sequence
     if generic_base in (list, typing.List):
         (item_schema,) = generic_args
-        return [
-            _yaml_dump_typed_item(obj=item, schema=item_schema) for item in obj
-        ]
+        return [recurse(obj=item, schema=item_schema) for item in obj]
 
     # Handle YAML maps:
     #  https://yaml.org/spec/1.2.2/#mapping
@@ -771,7 +1259,7 @@ def _yaml_dump_typed_item(*, obj, schema):
         result = dict()
         for key in sorted(obj):
             value = obj[key]
-            value_plain = _yaml_dump_typed_item(obj=value, schema=value_schema)
+            value_plain = recurse(obj=value, schema=value_schema)
             result[key] = value_plain
         return result
 
@@ -780,7 +1268,7 @@ def _yaml_dump_typed_item(*, obj, schema):
     if optional_schema is not None:
         if obj is None:
             return None
-        return _yaml_dump_typed_item(obj=obj, schema=optional_schema)
+        return recurse(obj=obj, schema=optional_schema)
 
     # Handle schema sum types (std::variant<...> or typing.Union[...]).
     if _is_union(generic_base):
@@ -801,8 +1289,8 @@ def _yaml_dump_typed_item(*, obj, schema):
                 f"A value of type {type(obj)} did not match any {schema}"
             )
         union_schema = generic_args[i]
-        result = _yaml_dump_typed_item(obj=obj, schema=union_schema)
-        if i != 0:
+        result = recurse(obj=obj, schema=union_schema)
+        if i != 0 and not _is_binary_array(result):
             if union_schema in _PRIMITIVE_JSON_TYPES:
                 result = _SchemaDumper.ExplicitScalar(
                     value=result, schema=union_schema
@@ -827,6 +1315,9 @@ def _yaml_dump_typed_item(*, obj, schema):
         # statically specify a shape and/or dtype in the schema. For now,
         # we only support floats with no restrictions on the shape.
         assert obj.dtype == np.dtype(np.float64)
+        if binary_array_min_size is not None:
+            if obj.size >= binary_array_min_size:
+                return _encode_binary_array(obj)
         list_value = obj.tolist()
         list_schema = float
         for _ in obj.shape:
@@ -838,7 +1329,7 @@ def _yaml_dump_typed_item(*, obj, schema):
     result = dict()
     for name, item_schema in _enumerate_field_types(schema).items():
         item_obj = _yaml_dump_get_attribute(obj=obj, name=name)
-        item_plain = _yaml_dump_typed_item(obj=item_obj, schema=item_schema)
+        item_plain = recurse(obj=item_obj, schema=item_schema)
         if item_plain is None:
             if _get_nested_optional_type(item_schema) is not None:
                 # When an Optional member field is set to None, then don't emit
@@ -870,6 +1361,9 @@ def _erase_matching_maps(*, node, defaults):
             # The maps are tagged differently, so we should not subtract their
             # children, since they may have different semantics.
             continue
+        if _is_binary_array(sub_node):
+            # An encoded array is a single value, not a map of fields.
+            continue
         # Recurse into children with the same key name.
         _erase_matching_maps(node=sub_node, defaults=sub_defaults)
     for key in keys_to_prune:
@@ -877,7 +1371,13 @@ def _erase_matching_maps(*, node, defaults):
 
 
 def yaml_dump_typed(
-    data, *, filename=None, schema=None, child_name=None, defaults=None
+    data,
+    *,
+    filename=None,
+    schema=None,
+    child_name=None,
+    defaults=None,
+    binary_array_min_size=None,
 ):
     """Dumps an object to a YAML string or ``filename`` (if specified), using
     the ``schema`` in order to support non-primitive types.
@@ -899,6 +1399,12 @@ def yaml_dump_typed(
             with the ``data`` nested underneath.
         defaults: If provided, then only data that differs from the given
             ``defaults`` will be dumped.
+        binary_array_min_size: If provided, then any ``np.ndarray`` with at
+            least this many elements is dumped using a compact binary encoding
+            instead of as a (nested) list of floats. The encoding is a mapping
+            tagged ``!BinaryArray`` with its ``dtype``, ``shape``, and
+            (base64) ``data``; both ``yaml_load_typed`` and the C++ YAML
+            loader can read it back.
     """
     # Sanity checks.
     assert data is not None
@@ -914,11 +1420,17 @@ def yaml_dump_typed(
         schema = type(data)
 
     # Convert to a tree of primitives, lists, and dicts.
-    root = _yaml_dump_typed_item(obj=data, schema=schema)
+    root = _yaml_dump_typed_item(
+        obj=data, schema=schema, binary_array_min_size=binary_array_min_size
+    )
 
     # If a baseline value was provided, then subtract it from the result.
     if defaults is not None:
-        plain_defaults = _yaml_dump_typed_item(obj=defaults, schema=schema)
+        plain_defaults = _yaml_dump_typed_item(
+            obj=defaults,
+            schema=schema,
+            binary_array_min_size=binary_array_min_size,
+        )
         _erase_matching_maps(node=root, defaults=plain_defaults)
 
     # If a child_name was provided, then weave it into the root.
@@ -934,17 +1446,17 @@ def yaml_dump_typed(
 
     # Write the data to disk xor return a string, based on the presence of a
     # filename. Use layout options to match the C++ (SaveYamlFile) style.
-    dump_func = functools.partial(
-        yaml.dump,
+    result = _yaml_dump_str(
+        root,
         Dumper=_DrakeFlowSchemaDumper,
         default_flow_style=_FLOW_STYLE,
         sort_keys=False,
     )
     if filename is not None:
         with open(filename, "w", encoding="utf-8") as f:
-            dump_func(root, f)
+            f.write(result)
     else:
-        return dump_func(root)
+        return result
 
 
 __all__ = [
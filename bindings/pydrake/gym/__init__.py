@@ -40,5 +40,6 @@ not enough to perform training).
 """
 
 from ._drake_gym_env import DrakeGymEnv  # noqa: F401 (unused-import)
+from ._drake_vector_env import DrakeVectorEnv  # noqa: F401 (unused-import)
 
 __all__ = [x for x in globals() if not x.startswith("_")]
@@ -43,13 +43,16 @@ class DrakeGymEnv(gym.Env):
         reset_handler: Callable[[Simulator, Context], None] = None,
         info_handler: Callable[[Simulator], dict] = None,
         hardware: bool = False,
+        reset_from_snapshot: bool = False,
+        fast_step: bool = False,
+        action_repeat: int = 1,
     ):
         """
         Args:
             simulator: Either a ``drake.systems.analysis.Simulator``, or
                 a function that produces a (randomized) Simulator.
             time_step: Each call to ``step()`` will advance the simulator by
-                ``time_step`` seconds.
+                ``time_step`` seconds (times ``action_repeat``).
             action_space: Defines the ``gym.spaces.Space`` for the actions.  If
                 the action port is vector-valued, then passing ``None``
                 defaults to a ``gym.spaces.Box`` of the correct dimension with
@@ -103,6 +106,31 @@ class DrakeGymEnv(gym.Env):
             hardware: If True, it prevents from setting random context at
                 ``reset()`` when using ``random_generator``, but it does
                 execute ``reset_handler()`` if given.
+            reset_from_snapshot: If True, then the Simulator is only created
+                (and its ports are only looked up) once, and ``reset()``
+                restores the time, state, and parameters of the Simulator's
+                Context from a snapshot taken at that point, prior to applying
+                the randomization (``reset_handler()`` or
+                ``SetRandomContext()``). When ``simulator`` is a factory
+                function, it is only called once (during the first
+                ``reset()``), so any randomization it performs is not
+                re-sampled across episodes. This avoids rebuilding the
+                Diagram at every episode, which often dominates the run time
+                of short episodes.
+            fast_step: If True, then ``step()`` avoids per-step allocations
+                and redundant evaluations: the action is written in place
+                into the action input port's existing fixed value, a
+                vector-valued observation is copied into a preallocated array
+                (which is overwritten by the next ``step()`` or ``reset()``,
+                so must be copied by callers that retain it), and the prior
+                observation is no longer evaluated before advancing the
+                simulator; if ``AdvanceTo`` fails, the observation returned by
+                the previous ``step()`` or ``reset()`` is returned instead.
+            action_repeat: The number of consecutive ``time_step`` intervals
+                over which each action is held (a.k.a. "frame skip"). The
+                reward returned by ``step()`` is the sum of the rewards
+                evaluated at the end of each interval; the repetition stops
+                early if the episode terminates.
 
         Notes (using ``env`` as an instance of this class):
 
@@ -179,6 +207,16 @@ class DrakeGymEnv(gym.Env):
 
         self.hardware = hardware
 
+        self.reset_from_snapshot = reset_from_snapshot
+        self._context_snapshot = None
+
+        self.fast_step = fast_step
+        self._fixed_action = None
+        self._observation = None
+
+        assert action_repeat >= 1
+        self.action_repeat = action_repeat
+
         if self.simulator:
             self._setup()
 
@@ -196,6 +234,7 @@ class DrakeGymEnv(gym.Env):
             assert np.array_equal(
                 self.action_space.shape, [self.action_port.size()]
             )
+        self._fixed_action = None
 
         def get_output_port(id):
             if isinstance(id, OutputPortIndex):
@@ -209,6 +248,11 @@ class DrakeGymEnv(gym.Env):
             assert np.array_equal(
                 self.observation_space.shape, [self.observation_port.size()]
             )
+            if self.fast_step:
+                self._observation = np.empty(
+                    self.observation_space.shape,
+                    dtype=self.observation_space.dtype,
+                )
 
         # Note: We require that there is no direct feedthrough action_port to
         # observation_port.  Unfortunately, HasDirectFeedthrough returns false
@@ -217,7 +261,12 @@ class DrakeGymEnv(gym.Env):
         # Setup reward.
         if self.reward_port_id:
             reward_port = get_output_port(self.reward_port_id)
-            self.reward = lambda system, context: reward_port.Eval(context)[0]
+            if self.fast_step:
+                # Read the cached value in place, without copying it out.
+                eval_reward = reward_port.EvalBasicVector
+            else:
+                eval_reward = reward_port.Eval
+            self.reward = lambda system, context: eval_reward(context)[0]
 
         # Setup rendering port.
         if self.render_rgb_port_id:
@@ -230,10 +279,70 @@ class DrakeGymEnv(gym.Env):
                 self.render_rgb_port.Allocate().get_value(), ImageRgba8U
             )
 
+        # Take a pristine snapshot to be restored by reset().
+        if self.reset_from_snapshot:
+            self._context_snapshot = self.simulator.get_context().Clone()
+
+    def _fix_action(self, context, action):
+        """Writes ``action`` into the action input port."""
+        if not self.fast_step:
+            self.action_port.FixValue(context, action)
+        elif self._fixed_action is None:
+            self._fixed_action = self.action_port.FixValue(context, action)
+        elif self.action_port.get_data_type() == PortDataType.kVectorValued:
+            # GetMutableData() notifies the port's dependents of the change.
+            self._fixed_action.GetMutableData().get_mutable_value().set_value(
+                action
+            )
+        else:
+            self._fixed_action.GetMutableData().set_value(action)
+
+    def _eval_observation(self, context):
+        """Returns the value of the observation output port."""
+        if self._observation is None:
+            return self.observation_port.Eval(context)
+        np.copyto(
+            self._observation,
+            self.observation_port.EvalBasicVector(context).get_value(),
+        )
+        return self._observation
+
+    def _advance(self, context, action):
+        """Holds ``action`` for ``self.action_repeat`` time steps and returns
+        the tuple (reward, terminated, truncated).
+        """
+        self._fix_action(context, action)
+        system = self.simulator.get_system()
+        time = context.get_time()
+        reward = 0
+        for i in range(1, self.action_repeat + 1):
+            try:
+                status = self.simulator.AdvanceTo(time + i * self.time_step)
+            except RuntimeError as e:
+                # TODO(JoseBarreiros-TRI) We don't currently check for the
+                # error coming from the solver failing to converge.
+                warnings.warn("Calling Done after catching RuntimeError:")
+                warnings.warn(e.args[0])
+                # Truncated is used when the solver failed to converge.
+                # Note: this is different than the official use of truncated
+                # in Gymnasium:
+                # "Whether the truncation condition outside the scope of the
+                # MDP is satisfied. Typically, this is a timelimit, but
+                # could also be used to indicate an agent physically going out
+                # of bounds."
+                # We handle the solver failure to converge by returning
+                # zero reward and the previous observation since the action
+                # was not successfully applied.
+                return 0, False, True
+            reward += self.reward(system, context)
+            if _reached_termination(status):
+                return reward, True, False
+        return reward, False, False
+
     def step(self, action):
         """
         Implements ``gym.Env.step`` to advance the simulation forward by one
-        ``self.time_step``.
+        ``self.time_step`` (times ``self.action_repeat``).
 
         Args:
             action: an element from ``self.action_space``.
@@ -241,50 +350,100 @@ class DrakeGymEnv(gym.Env):
         assert self.simulator, "You must call reset() first"
 
         context = self.simulator.get_context()
-        time = context.get_time()
 
-        self.action_port.FixValue(context, action)
-        truncated = False
-        # Observation prior to advancing the simulation.
-        prev_observation = self.observation_port.Eval(context)
-        try:
-            status = self.simulator.AdvanceTo(time + self.time_step)
-        except RuntimeError as e:
-            # TODO(JoseBarreiros-TRI) We don't currently check for the
-            # error coming from the solver failing to converge.
-            warnings.warn("Calling Done after catching RuntimeError:")
-            warnings.warn(e.args[0])
-            # Truncated is used when the solver failed to converge.
-            # Note: this is different than the official use of truncated
-            # in Gymnasium:
-            # "Whether the truncation condition outside the scope of the MDP
-            # is satisfied. Typically, this is a timelimit, but
-            # could also be used to indicate an agent physically going out
-            # of bounds."
-            # We handle the solver failure to converge by returning
-            # zero reward and the previous observation since the action
-            # was not successfully applied. This comes at a cost of
-            # an extra evaluation of the observation port.
-            truncated = True
-            terminated = False
-            reward = 0
+        # Observation prior to advancing the simulation, in case of failure.
+        # On the fast path, the preallocated buffer still holds it (the action
+        # port must not feed through to the observation port); otherwise, this
+        # comes at a cost of an extra evaluation of the observation port.
+        if self._observation is None:
+            prev_observation = self.observation_port.Eval(context)
+        else:
+            prev_observation = self._observation
+
+        reward, terminated, truncated = self._advance(context, action)
+        if truncated:
             # Do not call info handler, as the simulator has faulted.
             info = dict()
-
             return prev_observation, reward, terminated, truncated, info
 
-        observation = self.observation_port.Eval(context)
-        reward = self.reward(self.simulator.get_system(), context)
-        terminated = not truncated and _reached_termination(status)
+        observation = self._eval_observation(context)
         info = self.info_handler(self.simulator)
 
         return observation, reward, terminated, truncated, info
 
+    def rollout(self, actions, *, record: bool = True):
+        """
+        Applies a sequence of actions, as if by calling ``step()`` with each
+        one in turn, but within a single call. This avoids the per-step
+        overhead of the Gym API (including any wrappers around this env);
+        the ``info_handler()`` is only called once, at the end. The rollout
+        stops early after the first step that terminates or truncates.
+
+        Args:
+            actions: An array whose first dimension is the number of steps
+                ``T`` and whose rows are elements of ``self.action_space``.
+            record: If True, then the observation after each step is
+                evaluated and returned. If False, then the observations are
+                not evaluated (e.g., when only the rewards are needed) and
+                ``None`` is returned in their place.
+
+        Returns:
+            The tuple ``(observations, rewards, terminated, truncated, info)``
+            where ``observations`` is an array whose first dimension (like
+            that of the three arrays of per-step ``step()`` results that
+            follow it) is the number of steps that were taken, and ``info``
+            is the ``info_handler()`` result after the final step.
+        """
+        assert self.simulator, "You must call reset() first"
+
+        context = self.simulator.get_context()
+        num_steps = len(actions)
+        rewards = np.zeros(num_steps)
+        terminated = np.zeros(num_steps, dtype=bool)
+        truncated = np.zeros(num_steps, dtype=bool)
+        observations = None
+        if record:
+            observation = self._eval_observation(context)
+            observations = np.empty(
+                (num_steps,) + np.shape(observation),
+                dtype=np.asarray(observation).dtype,
+            )
+
+        for i, action in enumerate(actions):
+            rewards[i], terminated[i], truncated[i] = self._advance(
+                context, action
+            )
+            if record:
+                # Upon failure, repeat the previous observation (as per step).
+                if not truncated[i]:
+                    observation = self._eval_observation(context)
+                observations[i] = observation
+            if terminated[i] or truncated[i]:
+                num_steps = i + 1
+                break
+
+        if record:
+            observations = observations[:num_steps]
+        if num_steps > 0 and truncated[num_steps - 1]:
+            # Do not call info handler, as the simulator has faulted.
+            info = {}
+        else:
+            info = self.info_handler(self.simulator)
+
+        return (
+            observations,
+            rewards[:num_steps],
+            terminated[:num_steps],
+            truncated[:num_steps],
+            info,
+        )
+
     def reset(self, *, seed: int | None = None, options: dict | None = None):
         """
         If a callable "simulator factory" was passed to the constructor, then a
-        new simulator is created.  Otherwise this method simply resets the
-        ``simulator`` and its Context.
+        new simulator is created (unless ``reset_from_snapshot`` is set and a
+        simulator was already created).  Otherwise this method simply resets
+        the ``simulator`` and its Context.
         """
         super().reset(seed=seed)
         assert options is None or options == dict(), (
@@ -297,16 +456,21 @@ class DrakeGymEnv(gym.Env):
             # check that at the moment.
             self.generator = RandomGenerator(seed)
 
-        if self.make_simulator:
+        if self.make_simulator and (
+            self._context_snapshot is None or not self.reset_from_snapshot
+        ):
             self.simulator = self.make_simulator(self.generator)
             self._setup()
 
         context = self.simulator.get_mutable_context()
+        if self._context_snapshot is not None:
+            context.SetTimeStateAndParametersFrom(self._context_snapshot)
         context.SetTime(0)
         self.simulator.Initialize()
         if self.reset_handler is not None:
             # The initial state is set by reset_handler().
-            self.simulator.get_system().SetDefaultContext(context)
+            if self._context_snapshot is None:
+                self.simulator.get_system().SetDefaultContext(context)
             self.reset_handler(self.simulator, context, seed)
         else:
             if not self.hardware:
@@ -316,7 +480,7 @@ class DrakeGymEnv(gym.Env):
 
         # Note: The output port will be evaluated without fixing the input
         # port.
-        observations = self.observation_port.Eval(context)
+        observations = self._eval_observation(context)
         info = self.info_handler(self.simulator)
 
         return observations, info
@@ -0,0 +1,264 @@
+from concurrent.futures import ThreadPoolExecutor
+import types
+
+import gymnasium as gym
+from gymnasium.vector import AutoresetMode
+from gymnasium.vector.utils import (
+    batch_space,
+    concatenate,
+    create_empty_array,
+    iterate,
+)
+import numpy as np
+
+from pydrake.common import Parallelism
+from pydrake.gym._drake_gym_env import DrakeGymEnv
+from pydrake.systems.analysis import (
+    ApplySimulatorConfig,
+    ExtractSimulatorConfig,
+    Simulator,
+)
+from pydrake.systems.framework import Diagram, System
+
+
+def _is_python_system(system: System):
+    """Returns true iff the given system's class (or one of its bases) is
+    implemented in Python, i.e., evaluating it requires the GIL.
+    """
+    return any(
+        isinstance(vars(cls).get("__init__"), types.FunctionType)
+        for cls in type(system).__mro__
+    )
+
+
+def _has_python_systems(system: System):
+    """Returns true iff the given system or any of its subsystems is
+    implemented in Python.
+    """
+    if _is_python_system(system):
+        return True
+    if isinstance(system, Diagram):
+        return any(_has_python_systems(x) for x in system.GetSystems())
+    return False
+
+
+def _make_sibling_env(env: DrakeGymEnv):
+    """Returns a new DrakeGymEnv with the same settings as the given ``env``.
+    When ``env`` wraps a single Simulator, the new env's Simulator shares the
+    same System (but has its own Context).
+    """
+    if env.make_simulator is not None:
+        simulator = env.make_simulator
+    else:
+        prototype = env.simulator
+        simulator = Simulator(prototype.get_system())
+        ApplySimulatorConfig(ExtractSimulatorConfig(prototype), simulator)
+        monitor = prototype.get_monitor()
+        if monitor is not None:
+            simulator.set_monitor(monitor)
+    if env.reward_port_id is not None:
+        reward = env.reward_port_id
+    else:
+        reward = env.reward
+    return DrakeGymEnv(
+        simulator=simulator,
+        time_step=env.time_step,
+        action_space=env.action_space,
+        observation_space=env.observation_space,
+        reward=reward,
+        action_port_id=env.action_port_id,
+        observation_port_id=env.observation_port_id,
+        render_rgb_port_id=env.render_rgb_port_id,
+        render_mode=env.render_mode,
+        reset_handler=env.reset_handler,
+        info_handler=env.info_handler,
+        hardware=env.hardware,
+        reset_from_snapshot=env.reset_from_snapshot,
+        fast_step=env.fast_step,
+        action_repeat=env.action_repeat,
+    )
+
+
+class DrakeVectorEnv(gym.vector.VectorEnv):
+    """
+    DrakeVectorEnv provides a ``gym.vector.VectorEnv`` interface for
+    ``num_envs`` copies of a DrakeGymEnv, all running in the same process.
+
+    The copies share the DrakeGymEnv's System (e.g., its Diagram), but each
+    one has its own Simulator and Context. Each call to ``step()`` advances
+    all of the copies, potentially in parallel on multiple threads, and
+    returns the batched (stacked) observations, rewards, terminations, and
+    truncations.
+
+    Sub-environments are reset automatically using Gymnasium's "next-step"
+    mode: after a sub-environment terminates or truncates, the next call to
+    ``step()`` resets it (ignoring its action) instead of stepping it.
+    """
+
+    def __init__(
+        self,
+        env: DrakeGymEnv,
+        num_envs: int,
+        parallelism: Parallelism | None = None,
+    ):
+        """
+        Args:
+            env: The environment to replicate. It is used as the first
+                sub-environment. When ``env`` was created using a simulator
+                factory, then each sub-environment calls the factory (and so
+                will have its own System); otherwise, the sub-environments
+                share the ``env.simulator``'s System and copy its monitor and
+                integrator settings.
+            num_envs: The number of sub-environments.
+            parallelism: How many threads to use when stepping the
+                sub-environments. Simulator.AdvanceTo releases the GIL, so the
+                sub-environments can run concurrently; however, any systems
+                (or monitors) implemented in Python must still take turns
+                holding the GIL. Passing ``None`` (the default) uses as many
+                threads as there are sub-environments (up to the hardware
+                concurrency) when the System has no Python subsystems, or
+                else a single thread.
+        """
+        super().__init__()
+        env = env.unwrapped
+        assert isinstance(env, DrakeGymEnv)
+        assert num_envs >= 1
+        self.num_envs = num_envs
+        self.envs = [env] + [
+            _make_sibling_env(env) for _ in range(num_envs - 1)
+        ]
+
+        self.single_action_space = env.action_space
+        self.single_observation_space = env.observation_space
+        self.action_space = batch_space(env.action_space, num_envs)
+        self.observation_space = batch_space(env.observation_space, num_envs)
+        self.render_mode = env.render_mode
+        # The metadata is per-instance (not a class attribute) so that editing
+        # one vector env's metadata (as DrakeGymEnv does to its own when
+        # adding render modes) never leaks into any other env.
+        self.metadata = {"autoreset_mode": AutoresetMode.NEXT_STEP}
+
+        if parallelism is None:
+            if env.simulator is not None and not _has_python_systems(
+                env.simulator.get_system()
+            ):
+                num_threads = min(num_envs, Parallelism.Max().num_threads())
+            else:
+                num_threads = 1
+        else:
+            num_threads = min(num_envs, parallelism.num_threads())
+        self._executor = None
+        if num_threads > 1:
+            self._executor = ThreadPoolExecutor(max_workers=num_threads)
+
+        self._observations = create_empty_array(
+            env.observation_space, n=num_envs, fn=np.zeros
+        )
+        self._env_obs = [None] * num_envs
+        self._rewards = np.zeros((num_envs,), dtype=np.float64)
+        self._terminations = np.zeros((num_envs,), dtype=np.bool_)
+        self._truncations = np.zeros((num_envs,), dtype=np.bool_)
+        self._autoreset_envs = np.zeros((num_envs,), dtype=np.bool_)
+
+    def _map(self, function, *args):
+        """Returns ``list(map(function, *args))``, using the thread pool (if
+        any) to call the function for many arguments concurrently.
+        """
+        if self._executor is None:
+            return list(map(function, *args))
+        return list(self._executor.map(function, *args))
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict | None = None,
+    ):
+        """
+        Resets all of the sub-environments.
+
+        Args:
+            seed: Either ``None`` (no seed), an ``int`` (the sub-environments
+                are seeded using ``seed``, ``seed + 1``, etc.) or a list with
+                one seed per sub-environment.
+            options: Not supported; must be ``None`` or empty.
+        """
+        super().reset(seed=seed)
+        if seed is None:
+            seeds = [None] * self.num_envs
+        elif isinstance(seed, int):
+            seeds = [seed + i for i in range(self.num_envs)]
+        else:
+            seeds = list(seed)
+            assert len(seeds) == self.num_envs
+        self._terminations[:] = False
+        self._truncations[:] = False
+        self._autoreset_envs[:] = False
+        results = self._map(
+            lambda env, one_seed: env.reset(seed=one_seed, options=options),
+            self.envs,
+            seeds,
+        )
+        infos = {}
+        for i, (observation, info) in enumerate(results):
+            self._env_obs[i] = observation
+            infos = self._add_info(infos, info, i)
+        self._observations = concatenate(
+            self.single_observation_space, self._env_obs, self._observations
+        )
+        return np.copy(self._observations), infos
+
+    def _step_one(self, i, action):
+        """Steps (or auto-resets) the i'th sub-environment."""
+        env = self.envs[i]
+        if self._autoreset_envs[i]:
+            observation, info = env.reset()
+            return observation, 0.0, False, False, info
+        return env.step(action)
+
+    def step(self, actions):
+        """
+        Advances each sub-environment by one ``time_step``, or resets it when
+        its previous episode has ended.
+
+        Args:
+            actions: an element of ``self.action_space``, i.e., a batch of
+                one action per sub-environment.
+        """
+        results = self._map(
+            self._step_one,
+            range(self.num_envs),
+            iterate(self.action_space, actions),
+        )
+        infos = {}
+        for i, (observation, reward, terminated, truncated, info) in enumerate(
+            results
+        ):
+            self._env_obs[i] = observation
+            self._rewards[i] = reward
+            self._terminations[i] = terminated
+            self._truncations[i] = truncated
+            infos = self._add_info(infos, info, i)
+        self._observations = concatenate(
+            self.single_observation_space, self._env_obs, self._observations
+        )
+        self._autoreset_envs = np.logical_or(
+            self._terminations, self._truncations
+        )
+        return (
+            np.copy(self._observations),
+            np.copy(self._rewards),
+            np.copy(self._terminations),
+            np.copy(self._truncations),
+            infos,
+        )
+
+    def render(self):
+        """Returns a tuple of each sub-environment's ``render()`` result."""
+        return tuple(env.render() for env in self.envs)
+
+    def close_extras(self, **kwargs):
+        """Shuts down the thread pool (if any)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
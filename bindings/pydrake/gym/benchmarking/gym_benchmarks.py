@@ -0,0 +1,200 @@
+"""Benchmarks for the throughput of pydrake.gym environments.
+
+The benchmarks cover the per-call overhead of DrakeGymEnv itself (using a
+trivial System) as well as the step, rollout, reset, render (``rgb_array``),
+and vectorized-env throughput of the bundled cart_pole example.
+
+The command-line flags mimic (a subset of) those of a Google Benchmark
+program (see tools/performance/py_benchmark.py), e.g.,
+``--benchmark_filter=REGEX`` selects which benchmarks to run. This means that
+the program can be run under the //tools/performance:benchmark_tool (see the
+``gym_experiment`` target).
+"""
+
+import functools
+
+import gymnasium as gym
+import numpy as np
+
+from pydrake.examples.gym.envs.cart_pole import DrakeCartPoleEnv
+from pydrake.gym import DrakeGymEnv, DrakeVectorEnv
+from pydrake.systems.analysis import (
+    ApplySimulatorConfig,
+    ExtractSimulatorConfig,
+    Simulator,
+)
+from pydrake.systems.framework import DiagramBuilder
+from pydrake.systems.primitives import LinearSystem, MatrixGain
+from tools.performance import py_benchmark
+
+# The list of (name, setup, items_per_iteration) for all benchmarks, in the
+# order they are run. The setup is a function that performs any setup given
+# the command-line arguments, and then returns the (no-argument) function to
+# be timed. The items are the number of env steps (or resets, etc.) per call.
+_BENCHMARKS = []
+
+
+def _benchmark(name, *, items_per_iteration=1, **kwargs):
+    """Decorator that registers a benchmark setup function (with the given
+    keyword arguments bound), under the given name.
+    """
+
+    def decorator(setup):
+        _BENCHMARKS.append(
+            (name, functools.partial(setup, **kwargs), items_per_iteration)
+        )
+        return setup
+
+    return decorator
+
+
+def _make_integrator_env(*, fast_step):
+    """Returns an env whose System is a trivial discrete-time integrator
+    (with no Python-implemented systems), so that the time spent in step() is
+    dominated by the DrakeGymEnv's own per-step overhead.
+    """
+    time_step = 0.001
+    builder = DiagramBuilder()
+    integrator = builder.AddSystem(
+        LinearSystem(
+            A=[[1.0]],
+            B=[[time_step]],
+            C=[[1.0]],
+            D=[[0.0]],
+            time_period=time_step,
+        )
+    )
+    cost = builder.AddSystem(MatrixGain(D=[[-1.0]]))
+    builder.Connect(integrator.get_output_port(), cost.get_input_port())
+    builder.ExportInput(integrator.get_input_port(), "actions")
+    builder.ExportOutput(integrator.get_output_port(), "observations")
+    builder.ExportOutput(cost.get_output_port(), "reward")
+    return DrakeGymEnv(
+        simulator=Simulator(builder.Build()),
+        time_step=time_step,
+        action_space=gym.spaces.Box(
+            low=-1.0, high=1.0, shape=(1,), dtype=np.float64
+        ),
+        observation_space=gym.spaces.Box(
+            low=-np.inf, high=np.inf, shape=(1,), dtype=np.float64
+        ),
+        reward="reward",
+        action_port_id="actions",
+        observation_port_id="observations",
+        fast_step=fast_step,
+    )
+
+
+@_benchmark("IntegratorStep/default", fast_step=False)
+@_benchmark("IntegratorStep/fast_step", fast_step=True)
+def _integrator_step(args, *, fast_step):
+    env = _make_integrator_env(fast_step=fast_step)
+    env.reset(seed=0)
+    action = np.ones(env.action_space.shape)
+    return functools.partial(env.step, action)
+
+
+def _make_cart_pole_env(args, **kwargs):
+    """Returns the (unwrapped) cart_pole env, adjusted per the command-line
+    arguments.
+    """
+    env = DrakeCartPoleEnv(**kwargs)
+    if args.time_step is not None:
+        env.time_step = args.time_step
+    if args.integrator is not None:
+        config = ExtractSimulatorConfig(env.simulator)
+        config.integration_scheme = args.integrator
+        ApplySimulatorConfig(config, env.simulator)
+    return env
+
+
+@_benchmark("CartPoleStep")
+def _cart_pole_step(args):
+    env = _make_cart_pole_env(args)
+    env.reset(seed=0)
+    action = np.zeros(env.action_space.shape)
+
+    def step():
+        # Episodes are long compared to a single step, so the occasional
+        # reset() only slightly inflates the per-step time.
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+
+    return step
+
+
+@_benchmark("CartPoleRollout/length:20", items_per_iteration=20, length=20)
+def _cart_pole_rollout(args, *, length):
+    env = _make_cart_pole_env(args)
+    actions = np.zeros((length,) + env.action_space.shape)
+
+    def rollout():
+        # Always start from the same state, so that no episode ends early.
+        # (The time spent in reset() is measured by CartPoleReset.)
+        env.reset(seed=0)
+        env.rollout(actions)
+
+    return rollout
+
+
+@_benchmark("CartPoleReset")
+def _cart_pole_reset(args):
+    env = _make_cart_pole_env(args)
+    return env.reset
+
+
+@_benchmark("CartPoleRenderRgbArray")
+def _cart_pole_render_rgb_array(args):
+    env = _make_cart_pole_env(args, monitoring_camera=True)
+    assert env.render_mode == "rgb_array"
+    env.reset(seed=0)
+    context = env.simulator.get_mutable_context()
+
+    def render():
+        # Mark the state as modified, so that the image is re-rendered instead
+        # of being fetched from the cache.
+        context.get_mutable_state()
+        env.render()
+
+    return render
+
+
+@_benchmark("CartPoleVectorStep/num_envs:4", items_per_iteration=4, num_envs=4)
+def _cart_pole_vector_step(args, *, num_envs):
+    env = DrakeVectorEnv(_make_cart_pole_env(args), num_envs=num_envs)
+    env.reset(seed=0)
+    actions = np.zeros(env.action_space.shape)
+    # The vector env automatically resets any finished episodes.
+    return functools.partial(env.step, actions)
+
+
+def _add_arguments(parser):
+    parser.add_argument(
+        "--time_step",
+        metavar="SECONDS",
+        type=float,
+        help="override the cart_pole env's time_step",
+    )
+    parser.add_argument(
+        "--integrator",
+        metavar="SCHEME",
+        help="override the cart_pole simulator's integration_scheme",
+    )
+
+
+def _get_context(args):
+    return {"time_step": args.time_step, "integrator": args.integrator}
+
+
+def main():
+    py_benchmark.main(
+        description=__doc__,
+        benchmarks=_BENCHMARKS,
+        add_arguments=_add_arguments,
+        get_context=_get_context,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 import unittest
 
 import gymnasium as gym
+import numpy as np
 import stable_baselines3.common.env_checker
 
+from pydrake.common import Parallelism
+from pydrake.examples.gym.envs import cart_pole
+from pydrake.gym import DrakeGymEnv, DrakeVectorEnv
+
 
 class DrakeGymTest(unittest.TestCase):
     """
@@ -65,3 +70,187 @@ class DrakeGymTest(unittest.TestCase):
         dut.reset()
         observation, _, _, _, _ = dut.step(dut.action_space.sample())
         self.assertTrue(dut.observation_space.contains(observation))
+
+    def test_reset_from_snapshot(self):
+        prototype = self.make_env().unwrapped
+        factory_calls = []
+
+        def make_simulator(generator):
+            factory_calls.append(generator)
+            return cart_pole.make_sim()
+
+        dut = DrakeGymEnv(
+            simulator=make_simulator,
+            time_step=prototype.time_step,
+            action_space=prototype.action_space,
+            observation_space=prototype.observation_space,
+            reward="reward",
+            action_port_id="actions",
+            observation_port_id="observations",
+            reset_handler=cart_pole.reset_handler,
+            reset_from_snapshot=True,
+        )
+        self.assertEqual(len(factory_calls), 0)
+        obs1, _ = dut.reset(seed=7)
+        simulator = dut.simulator
+        for _ in range(3):
+            dut.step(dut.action_space.sample())
+        obs2, _ = dut.reset(seed=7)
+        obs3, _ = dut.reset(seed=8)
+
+        # The simulator was only built once, but each reset() restored (and
+        # then re-randomized) its context.
+        self.assertEqual(len(factory_calls), 1)
+        self.assertIs(dut.simulator, simulator)
+        self.assertEqual(dut.simulator.get_context().get_time(), 0.0)
+        np.testing.assert_equal(obs1, obs2)
+        self.assertFalse((obs1 == obs3).all())
+
+    def test_fast_step(self):
+        prototype = self.make_env().unwrapped
+
+        def make_env(fast_step):
+            return DrakeGymEnv(
+                simulator=cart_pole.make_sim(),
+                time_step=prototype.time_step,
+                action_space=prototype.action_space,
+                observation_space=prototype.observation_space,
+                reward="reward",
+                action_port_id="actions",
+                observation_port_id="observations",
+                reset_handler=cart_pole.reset_handler,
+                fast_step=fast_step,
+            )
+
+        # The fast path produces the same results as the default path.
+        default_env = make_env(fast_step=False)
+        fast_env = make_env(fast_step=True)
+        default_obs, _ = default_env.reset(seed=7)
+        fast_obs, _ = fast_env.reset(seed=7)
+        np.testing.assert_equal(fast_obs, default_obs)
+        for _ in range(5):
+            action = prototype.action_space.sample()
+            default_result = default_env.step(action)
+            fast_result = fast_env.step(action)
+            np.testing.assert_equal(fast_result[0], default_result[0])
+            self.assertEqual(fast_result[1:4], default_result[1:4])
+
+            # The observation is written into a preallocated buffer.
+            self.assertIs(fast_result[0], fast_obs)
+
+    def test_rollout(self):
+        prototype = self.make_env().unwrapped
+
+        def make_env(action_repeat=1):
+            return DrakeGymEnv(
+                simulator=cart_pole.make_sim(),
+                time_step=prototype.time_step,
+                action_space=prototype.action_space,
+                observation_space=prototype.observation_space,
+                reward="reward",
+                action_port_id="actions",
+                observation_port_id="observations",
+                reset_handler=cart_pole.reset_handler,
+                action_repeat=action_repeat,
+            )
+
+        num_steps = 5
+        actions = np.zeros((num_steps,) + prototype.action_space.shape)
+        actions[:, 0] = np.linspace(-1.0, 1.0, num_steps)
+
+        # A rollout matches a sequence of calls to step().
+        dut = make_env()
+        dut.reset(seed=7)
+        observations, rewards, terminated, truncated, info = dut.rollout(
+            actions
+        )
+        self.assertEqual(observations.shape[0], num_steps)
+        self.assertEqual(rewards.shape, (num_steps,))
+        self.assertFalse(terminated.any())
+        self.assertFalse(truncated.any())
+        self.assertIsInstance(info, dict)
+        expected = make_env()
+        expected.reset(seed=7)
+        for i, action in enumerate(actions):
+            observation, reward, _, _, _ = expected.step(action)
+            np.testing.assert_equal(observations[i], observation)
+            self.assertEqual(rewards[i], reward)
+
+        # Without recording, only the rewards (and flags) are returned.
+        dut.reset(seed=7)
+        observations, no_record_rewards, _, _, _ = dut.rollout(
+            actions, record=False
+        )
+        self.assertIsNone(observations)
+        np.testing.assert_equal(no_record_rewards, rewards)
+
+        # The rollout stops early upon termination.
+        dut.reset(seed=7)
+        observations, rewards, terminated, truncated, _ = dut.rollout(
+            np.ones((1000,) + prototype.action_space.shape)
+        )
+        self.assertLess(len(rewards), 1000)
+        self.assertEqual(len(observations), len(rewards))
+        self.assertTrue(terminated[-1] or truncated[-1])
+        self.assertFalse(terminated[:-1].any())
+
+        # Repeating an action advances multiple time steps per step().
+        dut = make_env(action_repeat=3)
+        dut.reset(seed=7)
+        dut.step(actions[0])
+        self.assertAlmostEqual(
+            dut.simulator.get_context().get_time(), 3 * prototype.time_step
+        )
+
+    def test_vector_env_seed(self):
+        # The cart_pole reset handler uses the process-global np.random, so
+        # the sub-environments must be reset serially to be deterministic.
+        dut = DrakeVectorEnv(
+            self.make_env(), num_envs=3, parallelism=Parallelism(1)
+        )
+
+        # reset(int) seeds each sub-environment differently.
+        observations, infos = dut.reset(seed=7)
+        self.assertIsInstance(infos, dict)
+        self.assertFalse((observations[0] == observations[1]).all())
+        again, _ = dut.reset(seed=7)
+        np.testing.assert_equal(observations, again)
+        dut.close()
+
+    def test_vector_env(self):
+        num_envs = 3
+        dut = DrakeVectorEnv(
+            self.make_env(), num_envs=num_envs, parallelism=Parallelism(2)
+        )
+        self.assertEqual(len(dut.envs), num_envs)
+        self.assertEqual(
+            dut.observation_space.shape,
+            (num_envs,) + dut.single_observation_space.shape,
+        )
+
+        observations, infos = dut.reset(seed=7)
+        self.assertIsInstance(infos, dict)
+        self.assertTrue(dut.observation_space.contains(observations))
+
+        observations, rewards, terminated, truncated, _ = dut.step(
+            dut.action_space.sample()
+        )
+        self.assertTrue(dut.observation_space.contains(observations))
+        self.assertEqual(rewards.shape, (num_envs,))
+        self.assertEqual(terminated.shape, (num_envs,))
+        self.assertEqual(truncated.shape, (num_envs,))
+
+        # Once a sub-environment's episode ends, the next step resets it.
+        for _ in range(1000):
+            _, _, terminated, truncated, _ = dut.step(dut.action_space.sample())
+            done = np.logical_or(terminated, truncated)
+            if done.any():
+                break
+        self.assertTrue(done.any())
+        _, rewards, terminated, truncated, _ = dut.step(
+            dut.action_space.sample()
+        )
+        np.testing.assert_equal(rewards[done], 0.0)
+        self.assertFalse(terminated[done].any())
+        self.assertFalse(truncated[done].any())
+        dut.close()
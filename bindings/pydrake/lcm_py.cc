@@ -7,6 +7,7 @@
 #include "drake/bindings/pydrake/pydrake_pybind.h"
 #include "drake/lcm/drake_lcm.h"
 #include "drake/lcm/drake_lcm_interface.h"
+#include "drake/lcm/drake_lcm_log.h"
 
 namespace drake {
 namespace pydrake {
@@ -115,6 +116,23 @@ PYBIND11_MODULE(lcm, m) {
         .def_static("available", &Class::available, cls_doc.available.doc);
   }
 
+  {
+    using Class = DrakeLcmLog;
+    constexpr auto& cls_doc = doc.DrakeLcmLog;
+    py::class_<Class, DrakeLcmInterface> cls(m, "DrakeLcmLog", cls_doc.doc);
+    cls  // BR
+        .def(py::init<std::string, bool, bool>(), py::arg("file_name"),
+            py::arg("is_write"),
+            py::arg("overwrite_publish_time_with_system_clock") = false,
+            cls_doc.ctor.doc)
+        .def("GetNextMessageTime", &Class::GetNextMessageTime,
+            cls_doc.GetNextMessageTime.doc)
+        .def("DispatchMessageAndAdvanceLog",
+            &Class::DispatchMessageAndAdvanceLog, py::arg("current_time"),
+            cls_doc.DispatchMessageAndAdvanceLog.doc)
+        .def("is_write", &Class::is_write, cls_doc.is_write.doc);
+  }
+
   ExecuteExtraPythonCode(m);
 }
 
@@ -1,11 +1,15 @@
+#include <optional>
 #include <string>
+#include <vector>
 
 #include "drake/bindings/generated_docstrings/perception.h"
 #include "drake/bindings/pydrake/common/cpp_param_pybind.h"
 #include "drake/bindings/pydrake/common/value_pybind.h"
 #include "drake/bindings/pydrake/pydrake_pybind.h"
 #include "drake/perception/depth_image_to_point_cloud.h"
+#include "drake/perception/fused_depth_image_to_point_cloud.h"
 #include "drake/perception/point_cloud.h"
+#include "drake/perception/point_cloud_index.h"
 #include "drake/perception/point_cloud_to_lcm.h"
 
 namespace drake {
@@ -85,6 +89,10 @@ void init_perception(py::module m) {
             "resize",
             [](PointCloud* self, int new_size) { self->resize(new_size); },
             py::arg("new_size"), cls_doc.resize.doc)
+        .def(
+            "Expand",
+            [](PointCloud* self, int add_size) { self->Expand(add_size); },
+            py::arg("add_size"), cls_doc.Expand.doc)
         // XYZs
         .def("has_xyzs", &Class::has_xyzs, cls_doc.has_xyzs.doc)
         .def("xyzs", &Class::xyzs, py_rvp::reference_internal, cls_doc.xyzs.doc)
@@ -138,6 +146,30 @@ void init_perception(py::module m) {
 
   m.def("Concatenate", &Concatenate, py::arg("clouds"), doc.Concatenate.doc);
 
+  {
+    using Class = PointCloudIndex;
+    constexpr auto& cls_doc = doc.PointCloudIndex;
+    py::class_<Class> cls(m, "PointCloudIndex", cls_doc.doc);
+    cls  // BR
+        .def(py::init<const PointCloud&, double, Parallelism>(),
+            py::arg("cloud"), py::arg("voxel_size"),
+            py::arg("parallelize") = false,
+            py::call_guard<py::gil_scoped_release>(), cls_doc.ctor.doc)
+        .def("voxel_size", &Class::voxel_size, cls_doc.voxel_size.doc)
+        .def("size", &Class::size, cls_doc.size.doc)
+        .def("Update", &Class::Update, py::arg("cloud"),
+            py::arg("parallelize") = false,
+            py::call_guard<py::gil_scoped_release>(), cls_doc.Update.doc)
+        .def("FindNearest", &Class::FindNearest, py::arg("queries"),
+            py::arg("k"), py::arg("parallelize") = false,
+            py::call_guard<py::gil_scoped_release>(), cls_doc.FindNearest.doc)
+        .def("FindWithinRadius", &Class::FindWithinRadius, py::arg("queries"),
+            py::arg("radius"), py::arg("parallelize") = false,
+            py::call_guard<py::gil_scoped_release>(),
+            cls_doc.FindWithinRadius.doc);
+    DefCopyAndDeepCopy(&cls);
+  }
+
   {
     using Class = DepthImageToPointCloud;
     constexpr auto& cls_doc = doc.DepthImageToPointCloud;
@@ -159,6 +191,32 @@ void init_perception(py::module m) {
             py_rvp::reference_internal, cls_doc.point_cloud_output_port.doc);
   }
 
+  {
+    using Class = FusedDepthImageToPointCloud;
+    constexpr auto& cls_doc = doc.FusedDepthImageToPointCloud;
+    py::class_<Class, LeafSystem<double>>(
+        m, "FusedDepthImageToPointCloud", cls_doc.doc)
+        .def(py::init<std::vector<CameraInfo>, PixelType, float,
+                 pc_flags::BaseFieldT, std::optional<double>, Parallelism>(),
+            py::arg("camera_infos"),
+            py::arg("pixel_type") = PixelType::kDepth32F,
+            py::arg("scale") = 1.0, py::arg("fields") = pc_flags::kXYZs,
+            py::arg("voxel_size") = std::nullopt,
+            py::arg("parallelize") = false, cls_doc.ctor.doc)
+        .def("num_cameras", &Class::num_cameras, cls_doc.num_cameras.doc)
+        .def("depth_image_input_port", &Class::depth_image_input_port,
+            py::arg("camera_index"), py_rvp::reference_internal,
+            cls_doc.depth_image_input_port.doc)
+        .def("color_image_input_port", &Class::color_image_input_port,
+            py::arg("camera_index"), py_rvp::reference_internal,
+            cls_doc.color_image_input_port.doc)
+        .def("camera_pose_input_port", &Class::camera_pose_input_port,
+            py::arg("camera_index"), py_rvp::reference_internal,
+            cls_doc.camera_pose_input_port.doc)
+        .def("point_cloud_output_port", &Class::point_cloud_output_port,
+            py_rvp::reference_internal, cls_doc.point_cloud_output_port.doc);
+  }
+
   {
     using Class = PointCloudToLcm;
     constexpr auto& cls_doc = doc.PointCloudToLcm;
@@ -6,37 +6,52 @@ from pydrake.perception import BaseField, Fields, PointCloud
 from pydrake.systems.framework import LeafSystem
 
 
-def _TransformPoints(points_Ci, X_CiSi):
-    # Make homogeneous copy of points.
-    points_h_Ci = np.vstack((points_Ci, np.ones((1, points_Ci.shape[1]))))
-
-    return X_CiSi.dot(points_h_Ci)[:3, :]
+def _TransformPoints(points_Ci, X_CiSi, out=None):
+    # Rotate and then translate the points, without making a homogeneous copy.
+    result = np.matmul(X_CiSi[:3, :3], points_Ci, out=out)
+    result += X_CiSi[:3, 3:]
+    return result
 
 
 def _TileColors(color, dim):
-    # Need manual broadcasting.
-    return np.tile(np.array([color]).T, (1, dim))
+    # Broadcast (as a read-only view) rather than copy the color.
+    return np.broadcast_to(np.array([color]).T, (3, dim))
 
 
-def _ConcatenatePointClouds(points_dict, colors_dict):
-    scene_points = None
-    scene_colors = None
+def _ValidPoints(points):
+    # Returns the mask of points whose x coordinate is not NaN.
+    return np.logical_not(np.isnan(points[0, :]))
 
-    for id in points_dict:
-        if scene_points is None:
-            scene_points = points_dict[id]
-        else:
-            scene_points = np.hstack((points_dict[id], scene_points))
 
-        if scene_colors is None:
-            scene_colors = colors_dict[id]
-        else:
-            scene_colors = np.hstack((colors_dict[id], scene_colors))
+def _SelectPoints(values, mask, count):
+    # Returns the columns of `values` that are selected by the mask (which has
+    # `count` true entries), avoiding a copy when all of them are selected.
+    if count == values.shape[1]:
+        return values
+    return values[:, mask]
 
-    valid_indices = np.logical_not(np.isnan(scene_points))
 
-    scene_points = scene_points[:, valid_indices[0, :]]
-    scene_colors = scene_colors[:, valid_indices[0, :]]
+def _ConcatenatePointClouds(points_dict, colors_dict):
+    masks = {id: _ValidPoints(points) for id, points in points_dict.items()}
+    counts = {id: np.count_nonzero(mask) for id, mask in masks.items()}
+    num_points = sum(counts.values())
+
+    scene_points = np.empty(
+        (3, num_points), dtype=np.result_type(*points_dict.values())
+    )
+    scene_colors = np.empty(
+        (3, num_points), dtype=np.result_type(*colors_dict.values())
+    )
+    start = 0
+    for id, mask in masks.items():
+        end = start + counts[id]
+        scene_points[:, start:end] = _SelectPoints(
+            points_dict[id], mask, counts[id]
+        )
+        scene_colors[:, start:end] = _SelectPoints(
+            colors_dict[id], mask, counts[id]
+        )
+        start = end
 
     return scene_points, scene_colors
 
@@ -99,10 +114,11 @@ class PointCloudConcatenation(LeafSystem):
             self.DoCalcOutput,
         )
 
-    def _AlignPointClouds(self, context):
-        points = {}
-        colors = {}
-
+    def DoCalcOutput(self, context, output):
+        point_clouds = []
+        transforms = []
+        masks = []
+        counts = []
         for id in self._id_list:
             point_cloud = self.EvalAbstractInput(
                 context, self._point_cloud_ports[id].get_index()
@@ -110,23 +126,33 @@ class PointCloudConcatenation(LeafSystem):
             X_CiSi = self.EvalAbstractInput(
                 context, self._transform_ports[id].get_index()
             ).get_value()
-
-            points[id] = _TransformPoints(
-                point_cloud.xyzs(), X_CiSi.GetAsMatrix4()
+            mask = _ValidPoints(point_cloud.xyzs())
+            point_clouds.append(point_cloud)
+            transforms.append(X_CiSi)
+            masks.append(mask)
+            counts.append(np.count_nonzero(mask))
+
+        # Size the output once (which is a no-op when the number of points is
+        # unchanged since the prior calculation), and then write each of the
+        # transformed point clouds directly into its slice of the output.
+        scene = output.get_mutable_value()
+        scene.resize(sum(counts))
+        scene_xyzs = scene.mutable_xyzs()
+        scene_rgbs = scene.mutable_rgbs()
+        start = 0
+        for point_cloud, X_CiSi, mask, count in zip(
+            point_clouds, transforms, masks, counts
+        ):
+            end = start + count
+            _TransformPoints(
+                _SelectPoints(point_cloud.xyzs(), mask, count),
+                X_CiSi.GetAsMatrix4(),
+                out=scene_xyzs[:, start:end],
             )
-
             if point_cloud.has_rgbs():
-                colors[id] = point_cloud.rgbs()
-            else:
-                colors[id] = _TileColors(
-                    self._default_rgb, point_cloud.xyzs().shape[1]
+                scene_rgbs[:, start:end] = _SelectPoints(
+                    point_cloud.rgbs(), mask, count
                 )
-
-        return _ConcatenatePointClouds(points, colors)
-
-    def DoCalcOutput(self, context, output):
-        scene_points, scene_colors = self._AlignPointClouds(context)
-
-        output.get_mutable_value().resize(scene_points.shape[1])
-        output.get_mutable_value().mutable_xyzs()[:] = scene_points
-        output.get_mutable_value().mutable_rgbs()[:] = scene_colors
+            else:
+                scene_rgbs[:, start:end] = _TileColors(self._default_rgb, count)
+            start = end
@@ -15,12 +15,60 @@ from pydrake.geometry import (
     Rgba,
     Role,
     Sphere,
-    optimization,
 )
-from pydrake.math import RigidTransform
 from pydrake.systems.pyplot_visualizer import PyPlotVisualizer
 
 
+def _convex_hull_indices(points):
+    """
+    Returns the indices of the vertices of the convex hull of the given 2xN
+    points, in counter-clockwise order, using Andrew's monotone chain
+    algorithm.
+    """
+    num_points = points.shape[1]
+    if num_points <= 3:
+        return np.arange(num_points)
+    x, y = points
+    # Discard (all at once) the points that are strictly inside the
+    # quadrilateral formed by the extreme points, which can't be vertices of
+    # the hull. Its corners are ordered counter-clockwise, so the inside is to
+    # the left of every edge.
+    corners = points[
+        :, [np.argmin(x), np.argmin(y), np.argmax(x), np.argmax(y)]
+    ]
+    edges = np.roll(corners, -1, axis=1) - corners
+    offsets = points[:, np.newaxis, :] - corners[:, :, np.newaxis]
+    is_inside = np.all(
+        edges[0][:, np.newaxis] * offsets[1]
+        - edges[1][:, np.newaxis] * offsets[0]
+        > 0,
+        axis=0,
+    )
+    candidates = np.flatnonzero(~is_inside)
+    candidates = candidates[np.lexsort((y[candidates], x[candidates]))]
+    xs = x.tolist()
+    ys = y.tolist()
+
+    def half_hull(indices):
+        hull = []
+        for k in indices:
+            while len(hull) >= 2:
+                i, j = hull[-2], hull[-1]
+                cross = (xs[j] - xs[i]) * (ys[k] - ys[i]) - (ys[j] - ys[i]) * (
+                    xs[k] - xs[i]
+                )
+                if cross > 0:
+                    break
+                hull.pop()
+            hull.append(k)
+        return hull
+
+    candidates = candidates.tolist()
+    lower = half_hull(candidates)
+    upper = half_hull(reversed(candidates))
+    return np.array(lower[:-1] + upper[:-1])
+
+
 class PlanarSceneGraphVisualizer(PyPlotVisualizer):
     """
     Given a SceneGraph and a view plane, provides a view of the robot by
@@ -56,6 +104,11 @@ class PlanarSceneGraphVisualizer(PyPlotVisualizer):
     T_VW can be any valid view projection matrix. If the bottom row is
     [0, 0, 0, 1], the view projection will be an orthographic projection.
 
+    For an orthographic projection, the convex hull of each projected patch
+    only depends on the direction of view in the body frame, so the hull is
+    computed once and then reused for as long as that direction is unchanged
+    (e.g., always, for a robot that moves in the view plane).
+
     xlim and ylim don't technically provide extra functionality, but it's
     easier to keep handling scaling with xlim, ylim, and view plane selection
     and *maybe* offsetting with the projection matrix.
@@ -79,6 +132,7 @@ class PlanarSceneGraphVisualizer(PyPlotVisualizer):
         substitute_collocated_mesh_files=True,
         ax=None,
         show=None,
+        blit=False,
     ):
         """
         Args:
@@ -104,6 +158,9 @@ class PlanarSceneGraphVisualizer(PyPlotVisualizer):
             show: Opens a window during initialization / publish iff True.
                 Default is None, which implies show=True unless
                 matplotlib.get_backend() is 'template'.
+            blit: If True, each publish only redraws the body patches and the
+                title (when the matplotlib backend supports blitting). Set
+                this when the axes have no other changing content.
         """
         default_size = matplotlib.rcParams["figure.figsize"]
         scalefactor = (ylim[1] - ylim[0]) / (xlim[1] - xlim[0])
@@ -116,11 +173,15 @@ class PlanarSceneGraphVisualizer(PyPlotVisualizer):
             ax=ax,
             draw_period=draw_period,
             show=show,
+            blit=blit,
         )
         self.set_name("planar_scenegraph_visualizer")
 
         self._scene_graph = scene_graph
-        self._T_VW = T_VW
+        self._T_VW = np.asarray(T_VW, dtype=float)
+        self._is_orthographic = np.array_equal(self._T_VW[2], [0, 0, 0, 1])
+        view_dir = np.cross(self._T_VW[0, :3], self._T_VW[1, :3])
+        self._view_dir = view_dir / np.linalg.norm(view_dir)
 
         self._geometry_query_input_port = self.DeclareAbstractInputPort(
             "geometry_query", Value(QueryObject())
@@ -142,25 +203,58 @@ class PlanarSceneGraphVisualizer(PyPlotVisualizer):
             scene_graph.model_inspector(),
         )
 
-        # Populate the body fill list -- which requires doing most of a draw
-        # pass, but with an ax.fill() command to initialize the draw patches.
-        # After initialization, we can then use in-place replacement of vertex
-        # positions. The body fill list stores the ax patch objects in the
-        # order they were spawned (i.e. by body, and then by order of view_
-        # patches). Drawing the tree should update them by iterating over
-        # bodies and patches in the same order.
+        # Stack the homogeneous vertices of all of the patches (in their body
+        # frames) into a single 4xN array, so that each draw projects them all
+        # with one batched matrix multiply into preallocated arrays.
+        self._body_index = {
+            name: i for i, name in enumerate(self._patch_Blist.keys())
+        }
+        patch_Blist = [
+            patch_B
+            for patches in self._patch_Blist.values()
+            for patch_B in patches
+        ]
+        num_verts = [patch_B.shape[1] for patch_B in patch_Blist]
+        ends = np.cumsum(num_verts, dtype=int)
+        self._patch_slices = [
+            slice(end - n, end) for n, end in zip(num_verts, ends)
+        ]
+        self._patch_body_index = [
+            self._body_index[name]
+            for name, patches in self._patch_Blist.items()
+            for _ in patches
+        ]
+        self._vert_body_index = np.repeat(
+            np.array(self._patch_body_index, dtype=int), num_verts
+        )
+        self._verts_B = np.ones((4, sum(num_verts)))
+        if patch_Blist:
+            self._verts_B[:3] = np.hstack(patch_Blist)
+        self._T_VB_per_vert = np.empty((sum(num_verts), 3, 4))
+        self._verts_V = np.empty((3, sum(num_verts)))
+        # For orthographic projections, the hull of each patch along with the
+        # view direction in the body frame that it was computed for.
+        self._hull_cache = [(None, None)] * len(patch_Blist)
+
+        # Populate the body fill list, with an ax.fill() command to initialize
+        # the draw patches. After initialization, we can then use in-place
+        # replacement of vertex positions. The body fill list stores the ax
+        # patch objects in the order they were spawned (i.e. by body, and then
+        # by order of view_patches). Drawing the tree should update them by
+        # iterating over bodies and patches in the same order.
         self._body_fill_dict = {}
-        X_WB_initial = RigidTransform.Identity()
-        for full_name in self._patch_Blist.keys():
-            patch_Wlist, view_colors = self._get_view_patches(
-                full_name, X_WB_initial
-            )
+        self._body_fill_list = []
+        self._project_verts(
+            np.tile(np.eye(3, 4), (len(self._patch_Blist), 1, 1))
+        )
+        patch_index = 0
+        for full_name, view_colors in self._patch_Blist_colors.items():
             self._body_fill_dict[full_name] = []
-            for patch_W, color in zip(patch_Wlist, view_colors):
-                # Project the full patch the first time, to initialize a vertex
+            for color in view_colors:
+                # Use the full patch the first time, to initialize a vertex
                 # list with enough space for any possible convex hull of this
                 # vertex set.
-                patch_V = self._project_patch(patch_W)
+                patch_V = self._verts_V[:2, self._patch_slices[patch_index]]
                 body_fill = self.ax.fill(
                     patch_V[0, :],
                     patch_V[1, :],
@@ -170,8 +264,12 @@ class PlanarSceneGraphVisualizer(PyPlotVisualizer):
                     closed=True,
                 )[0]
                 self._body_fill_dict[full_name].append(body_fill)
+                self._body_fill_list.append(body_fill)
                 # Then update the vertices for a more accurate initial draw.
-                self._update_body_fill_verts(body_fill, patch_V)
+                self._update_body_fill_verts(
+                    body_fill, patch_V[:, _convex_hull_indices(patch_V)]
+                )
+                patch_index += 1
 
     def get_geometry_query_input_port(self):
         return self._geometry_query_input_port
@@ -378,79 +476,119 @@ class PlanarSceneGraphVisualizer(PyPlotVisualizer):
                 patch_count = len(self._patch_Blist[name])
                 self._patch_Blist_colors[name] = [this_color] * patch_count
 
-    def _get_view_patches(self, full_name, X_WB):
+    def _project_verts(self, X_WB_list):
         """
-        Pulls out the view patch verts for the given body index after applying
-        the appropriate transform, X_WB. X_WB needs to be a RigidTransform.
+        Projects the vertices of all patches from 3d in their body frames B to
+        2d in view frame V, given the poses X_WB of all bodies (as returned by
+        _get_body_poses), and stores them into the first two rows of
+        self._verts_V.
         """
-        patch_Wlist = []
-        for patch_B in self._patch_Blist[full_name]:
-            patch_W = X_WB @ patch_B
-            # Add homogeneous row.
-            patch_W = np.vstack((patch_W, np.ones((1, patch_W.shape[1]))))
-            patch_Wlist.append(patch_W)
-
-        colors = self._patch_Blist_colors[full_name]
-        return (patch_Wlist, colors)
+        # Combine the view projection with each body pose, and then apply each
+        # body's projection to its vertices.
+        T_VB_list = self._T_VW[:, :3] @ X_WB_list
+        T_VB_list[:, :, 3] += self._T_VW[:, 3]
+        np.take(
+            T_VB_list, self._vert_body_index, axis=0, out=self._T_VB_per_vert
+        )
+        np.einsum(
+            "nij,jn->in", self._T_VB_per_vert, self._verts_B, out=self._verts_V
+        )
+        if not self._is_orthographic:
+            # Applies normalization in the perspective transformation to make
+            # each projected point have z = 1.
+            self._verts_V[:2] /= self._verts_V[2]
 
-    def _project_patch(self, patch_W):
+    def _get_patch_hull(self, patch_index, patch_V, X_WB):
         """
-        Project the object vertices from 3d in world frame W to 2d in view
-        frame V.
+        Returns the indices of the convex hull vertices of the given projected
+        patch.
         """
-        patch_V = self._T_VW @ patch_W
-        # Applies normalization in the perspective transformation
-        # to make each projected point have z = 1. If the bottom row
-        # of T_VW is [0, 0, 0, 1], this will result in an
-        # orthographic projection.
-        patch_V[0, :] /= patch_V[2, :]
-        patch_V[1, :] /= patch_V[2, :]
-        # Cut patch_V down to 2xN.
-        patch_V = patch_V[:2, :]
-        return patch_V
+        if not self._is_orthographic:
+            return _convex_hull_indices(patch_V)
+        # Orthographic projections of the patch whose view directions agree
+        # (in the body frame) differ by an affine map of the view plane, which
+        # preserves the hull's vertices.
+        view_dir_B = X_WB[:, :3].T @ self._view_dir
+        cached_view_dir_B, hull = self._hull_cache[patch_index]
+        if cached_view_dir_B is None or (
+            abs(view_dir_B @ cached_view_dir_B) < 1 - 1e-12
+        ):
+            hull = _convex_hull_indices(patch_V)
+            self._hull_cache[patch_index] = (view_dir_B, hull)
+        return hull
 
     def _update_body_fill_verts(self, body_fill, patch_V):
         """
-        Takes a convex hull if necessary and uses in-place replacement of
-        vertices to update the fill.
+        Uses in-place replacement of vertices to update the fill with the
+        vertices of a convex hull.
         """
-
-        # Take a convex hull to get an accurate shape for drawing, with verts
-        # coming out in ccw order.
-        if patch_V.shape[1] > 3:
-            vpoly = optimization.VPolytope(patch_V)
-            patch_V = vpoly.GetMinimalRepresentation().vertices()
-
         # Update the verts, padding out to the appropriate full # of verts by
         # replicating the final vertex.
-        n_verts = body_fill.get_path().vertices.shape[0]
-        patch_V = np.pad(
-            patch_V, ((0, 0), (0, n_verts - patch_V.shape[1])), mode="edge"
-        )
-        body_fill.get_path().vertices[:, :] = patch_V.T
+        verts = body_fill.get_path().vertices
+        num_hull_verts = patch_V.shape[1]
+        verts[:num_hull_verts] = patch_V.T
+        verts[num_hull_verts:] = patch_V[:, -1]
 
-    def draw(self, context):
-        """Overrides base with the implementation."""
+    def _get_body_poses(self, context):
+        """
+        Returns the poses X_WB of the bodies with patches, as an array of
+        3x4 matrices in the order of self._patch_Blist. The poses of bodies
+        that are not in the scene are NaN.
+        """
         query_object = self._geometry_query_input_port.Eval(context)
         inspector = query_object.inspector()
-
-        view_dir = np.cross(self._T_VW[0, :3], self._T_VW[1, :3])
+        X_WB_list = np.full((len(self._patch_Blist), 3, 4), np.nan)
         for frame_id in inspector.GetAllFrameIds():
-            frame_name = self.frame_name(frame_id, inspector)
-            if frame_name not in self._patch_Blist:
+            body_index = self._body_index.get(
+                self.frame_name(frame_id, inspector)
+            )
+            if body_index is None:
+                continue
+            X_WB_list[body_index] = query_object.GetPoseInWorld(
+                frame_id
+            ).GetAsMatrix34()
+        return X_WB_list
+
+    def _draw_body_poses(self, time, X_WB_list):
+        """
+        Draws the bodies at the given poses (as returned by _get_body_poses),
+        and returns the artists that changed.
+        """
+        self._project_verts(X_WB_list)
+        is_posed = ~np.isnan(X_WB_list).any(axis=(1, 2))
+        zorders = X_WB_list[:, :, 3] @ self._view_dir
+        for patch_index, (body_fill, body_index, patch_slice) in enumerate(
+            zip(
+                self._body_fill_list,
+                self._patch_body_index,
+                self._patch_slices,
+            )
+        ):
+            if not is_posed[body_index]:
                 continue
-            X_WB = query_object.GetPoseInWorld(frame_id)
-
-            patch_Wlist, _ = self._get_view_patches(frame_name, X_WB)
-            for i, patch_W in enumerate(patch_Wlist):
-                # Project the object vertices from 3d in world frame W to 2d in
-                # view frame V (keeps homogeneous portion, removing it later).
-                patch_V = self._project_patch(patch_W)
-                body_fill = self._body_fill_dict[frame_name][i]
-                # Use the latest vertices to update the body_fill.
-                self._update_body_fill_verts(body_fill, patch_V)
-                body_fill.zorder = X_WB.translation() @ view_dir
-        self.ax.set_title("t = {:.1f}".format(context.get_time()))
+            patch_V = self._verts_V[:2, patch_slice]
+            hull = self._get_patch_hull(
+                patch_index, patch_V, X_WB_list[body_index]
+            )
+            # Use the latest vertices to update the body_fill.
+            self._update_body_fill_verts(body_fill, patch_V[:, hull])
+            body_fill.zorder = zorders[body_index]
+        self.ax.set_title("t = {:.1f}".format(time))
+        return self._body_fill_list + [self.ax.title]
+
+    def draw(self, context):
+        """Overrides base with the implementation."""
+        return self._draw_body_poses(
+            context.get_time(), self._get_body_poses(context)
+        )
+
+    def _get_recorded_values(self, context):
+        """Overrides base to record only the body poses."""
+        return self._get_body_poses(context).reshape(-1)
+
+    def _draw_recorded_values(self, time, values):
+        """Overrides base to draw the recorded body poses."""
+        return self._draw_body_poses(time, values.reshape(-1, 3, 4))
 
 
 def ConnectPlanarSceneGraphVisualizer(
@@ -2,11 +2,104 @@ import matplotlib
 import numpy as np
 
 from pydrake.systems._resample_interp1d import _resample_interp1d
-from pydrake.systems.framework import LeafSystem
+from pydrake.systems.framework import LeafSystem, PortDataType
 from pydrake.systems.primitives import VectorLog
 from pydrake.trajectories import Trajectory
 
 
+class _RecordingBuffer:
+    """
+    Stores the frames of a compact recording (see
+    PyPlotVisualizer.start_recording) as a time and a 1-D array of values per
+    frame, where every frame has the same number of values.
+
+    The frames are kept in preallocated NumPy arrays whose capacity doubles as
+    needed. When max_bytes is not None, the capacity is limited to what fits in
+    max_bytes; once the buffer is full, it acts as a ring buffer and each new
+    frame overwrites the oldest one.
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self, max_bytes=None):
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, not {max_bytes}")
+        self.max_bytes = max_bytes
+        self._max_capacity = None
+        self._times = None
+        self._values = None
+        # The index of the oldest frame, and the number of frames.
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, i):
+        """Returns the (time, values) of the i'th oldest frame."""
+        if not 0 <= i < self._size:
+            raise IndexError(f"frame index {i} is out of range")
+        j = (self._start + i) % len(self._times)
+        return self._times[j], self._values[j]
+
+    @property
+    def nbytes(self):
+        """The number of bytes allocated for the frames."""
+        if self._times is None:
+            return 0
+        return self._times.nbytes + self._values.nbytes
+
+    def append(self, time, values):
+        values = np.asarray(values, dtype=float).reshape(-1)
+        if self._times is None:
+            self._allocate(values.size)
+        elif values.size != self._values.shape[1]:
+            raise ValueError(
+                f"Expected {self._values.shape[1]} values per frame, but got "
+                f"{values.size}"
+            )
+        capacity = len(self._times)
+        if self._size == capacity:
+            if self._max_capacity is None or capacity < self._max_capacity:
+                self._reserve(2 * capacity)
+                capacity = len(self._times)
+            else:
+                # The buffer is full; drop the oldest frame.
+                self._start = (self._start + 1) % capacity
+                self._size -= 1
+        j = (self._start + self._size) % capacity
+        self._times[j] = time
+        self._values[j] = values
+        self._size += 1
+
+    def _allocate(self, num_values):
+        capacity = self._INITIAL_CAPACITY
+        if self.max_bytes is not None:
+            frame_bytes = np.dtype(float).itemsize * (1 + num_values)
+            self._max_capacity = self.max_bytes // frame_bytes
+            if self._max_capacity < 1:
+                raise ValueError(
+                    f"max_bytes={self.max_bytes} is too small to hold a "
+                    f"single frame ({frame_bytes} bytes)"
+                )
+            capacity = min(capacity, self._max_capacity)
+        self._times = np.empty(capacity)
+        self._values = np.empty((capacity, num_values))
+
+    def _reserve(self, capacity):
+        if self._max_capacity is not None:
+            capacity = min(capacity, self._max_capacity)
+        # The buffer only wraps around once it has reached its maximum
+        # capacity, so the frames here are stored in order starting at 0.
+        assert self._start == 0
+        times = np.empty(capacity)
+        times[: self._size] = self._times[: self._size]
+        values = np.empty((capacity, self._values.shape[1]))
+        values[: self._size] = self._values[: self._size]
+        self._times = times
+        self._values = values
+
+
 class PyPlotVisualizer(LeafSystem):
     """
     Base class from planar visualization that relies on pyplot.
@@ -21,6 +114,16 @@ class PyPlotVisualizer(LeafSystem):
     with the appropriate message type.
     - Override the draw method to parse the input and draw the robot in the
     appropriate state.
+
+    When constructed with blit=True, each publish only redraws the artists
+    that draw() returns (if any), over a cached background, when the
+    matplotlib backend supports it. The artists that draw() returns are also
+    what FuncAnimation(blit=True) expects, e.g., when passing blit=True to
+    get_recording_as_animation or animate.
+
+    Subclasses with abstract-valued input ports that want to support compact
+    recording (see start_recording) must also override _get_recorded_values
+    and _draw_recorded_values.
     """
 
     def __init__(
@@ -30,6 +133,7 @@ class PyPlotVisualizer(LeafSystem):
         figsize=None,
         ax=None,
         show=None,
+        blit=False,
     ):
         LeafSystem.__init__(self)
 
@@ -76,6 +180,11 @@ class PyPlotVisualizer(LeafSystem):
         if show is None:
             show = matplotlib.get_backend().lower() != "template"
         self._show = show
+        self._blit = blit
+        self._blit_background = None
+        if blit:
+            # Any full redraw (e.g., after a resize) refreshes the background.
+            self.fig.canvas.mpl_connect("draw_event", self._on_canvas_draw)
 
         self.ax.axis("equal")
         self.ax.axis("off")
@@ -88,6 +197,7 @@ class PyPlotVisualizer(LeafSystem):
 
         self._is_recording = False
         self._recorded_contexts = []
+        self._recording_buffer = None
 
         def on_initialize(context):
             if self._show:
@@ -98,32 +208,131 @@ class PyPlotVisualizer(LeafSystem):
 
     def _on_any_publish(self, context):
         if self._show:
-            self.draw(context)
-            self.fig.canvas.draw()
+            artists = self.draw(context)
+            if (
+                self._blit
+                and artists is not None
+                and self.fig.canvas.supports_blit
+            ):
+                self._blit_artists(artists)
+            else:
+                self.fig.canvas.draw()
             self._plt.pause(1e-10)
-        if self._is_recording:
+        if self._is_recording and self._recording_buffer is not None:
+            self._recording_buffer.append(
+                context.get_time(), self._get_recorded_values(context)
+            )
+        elif self._is_recording:
             snapshot = self.AllocateContext()
             snapshot.SetTimeStateAndParametersFrom(context)
             self.FixInputPortsFrom(self, context, snapshot)
             self._recorded_contexts.append(snapshot)
 
+    def _on_canvas_draw(self, event):
+        canvas = self.fig.canvas
+        self._blit_background = canvas.copy_from_bbox(self.fig.bbox)
+
+    def _blit_artists(self, artists):
+        """Redraws only the given artists, over the cached background."""
+        canvas = self.fig.canvas
+        new_artists = [
+            artist for artist in artists if not artist.get_animated()
+        ]
+        for artist in new_artists:
+            artist.set_animated(True)
+        if new_artists or self._blit_background is None:
+            # Redraw the full figure without the animated artists, which
+            # captures a new background via _on_canvas_draw.
+            canvas.draw()
+        canvas.restore_region(self._blit_background)
+        for artist in sorted(artists, key=lambda artist: artist.get_zorder()):
+            self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+
     def draw(self, context):
         """Draws a single frame.
         `context` can either be a Context object, or a raw vector (for ease of
         interpolation).
+        Optionally returns the artists that changed, to support blitting.
         """
         raise NotImplementedError
 
-    def start_recording(self):
+    def _get_recorded_values(self, context):
+        """Returns the values that draw() consumes from `context`, as a 1-D
+        array of floats, for compact recording. By default, this is the
+        concatenation of the values of the vector-valued input ports.
+        """
+        values = []
+        for i in range(self.num_input_ports()):
+            port = self.get_input_port(i)
+            if port.get_data_type() != PortDataType.kVectorValued:
+                raise NotImplementedError(
+                    f"Compact recording is not supported by "
+                    f"{type(self).__name__}, because its input port "
+                    f"'{port.get_name()}' is abstract-valued."
+                )
+            if port.HasValue(context):
+                values.append(port.Eval(context))
+            else:
+                values.append(np.full(port.size(), np.nan))
+        return np.concatenate(values) if values else np.empty(0)
+
+    def _draw_recorded_values(self, time, values):
+        """Draws a single frame from the result of _get_recorded_values. By
+        default, this passes the values to draw() as a raw vector.
+        """
+        return self.draw(values)
+
+    def _num_recorded_frames(self):
+        if self._recording_buffer is not None:
+            return len(self._recording_buffer)
+        return len(self._recorded_contexts)
+
+    def start_recording(self, compact=False, max_bytes=None):
+        """Starts recording a frame each time the visualizer publishes, for
+        playback via get_recording_as_animation().
+
+        Args:
+            compact: When False, each frame is a full snapshot of the Context.
+                When True, each frame stores only the time and the input
+                values that draw() consumes, as NumPy arrays in a growable
+                ring buffer, which uses far less memory for large diagrams.
+            max_bytes: (Only for compact recording.) When not None, limits the
+                memory used by the recorded frames; once the limit is reached,
+                each new frame replaces the oldest one.
+
+        To change `compact` or `max_bytes` once frames have been recorded,
+        call reset_recording() first.
+        """
+        if max_bytes is not None and not compact:
+            raise ValueError("max_bytes requires compact=True")
+        if self._num_recorded_frames() == 0:
+            self._recording_buffer = (
+                _RecordingBuffer(max_bytes) if compact else None
+            )
+        elif compact != (self._recording_buffer is not None) or (
+            compact and max_bytes != self._recording_buffer.max_bytes
+        ):
+            raise RuntimeError(
+                "Call reset_recording() before changing the recording options"
+            )
         self._is_recording = True
 
     def stop_recording(self):
         self._is_recording = False
 
     def reset_recording(self):
-        self._recorded_contexts = []  # Reset recorded data.
+        # Reset recorded data.
+        self._recorded_contexts = []
+        if self._recording_buffer is not None:
+            self._recording_buffer = _RecordingBuffer(
+                self._recording_buffer.max_bytes
+            )
 
     def _draw_recorded_frame(self, i):
+        if self._recording_buffer is not None:
+            time, values = self._recording_buffer[i]
+            return self._draw_recorded_values(time, values)
         return self.draw(self._recorded_contexts[i])
 
     def get_recording_as_animation(self, **kwargs):
@@ -134,7 +343,7 @@ class PyPlotVisualizer(LeafSystem):
         ani = animation.FuncAnimation(
             fig=self.fig,
             func=self._draw_recorded_frame,
-            frames=len(self._recorded_contexts),
+            frames=self._num_recorded_frames(),
             interval=1000 * self.time_step,
             **kwargs,
         )
@@ -163,7 +372,7 @@ class PyPlotVisualizer(LeafSystem):
             x = np.hstack([log.value(time) for time in t])
 
         def animate_update(i):
-            self.draw(x[:, i])
+            return self.draw(x[:, i])
 
         # We defer this import to this call site to prevent the import
         # from hanging. See #18323.
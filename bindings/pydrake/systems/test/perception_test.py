@@ -220,3 +220,34 @@ class TestPointCloudConcatenation(unittest.TestCase):
         self.assertTrue(
             (rgb_first and no_rgb_last) or (no_rgb_first and rgb_last)
         )
+
+    def test_nan_points(self):
+        pc_with_nans = PointCloud(self.pc)
+        pc_with_nans.mutable_xyzs()[:, :10] = np.nan
+        self.pc_concat.GetInputPort("point_cloud_CiSi_0").FixValue(
+            self.context, pc_with_nans
+        )
+        self.pc_concat.GetInputPort("point_cloud_CiSi_1").FixValue(
+            self.context, self.pc_no_rgbs
+        )
+
+        fused_pc = self.pc_concat.GetOutputPort("point_cloud_FS").Eval(
+            self.context
+        )
+
+        # The NaN points are removed, and the others are transformed.
+        self.assertEqual(fused_pc.size(), 2 * self.num_points - 10)
+        self.assertFalse(np.isnan(fused_pc.xyzs()).any())
+        np.testing.assert_allclose(
+            fused_pc.xyzs()[:, : self.num_points - 10],
+            self.pc.xyzs()[:, 10:],
+        )
+        np.testing.assert_allclose(
+            fused_pc.rgbs()[:, : self.num_points - 10],
+            self.pc.rgbs()[:, 10:],
+        )
+        np.testing.assert_allclose(
+            fused_pc.xyzs()[:, self.num_points - 10 :],
+            self.pc_no_rgbs.xyzs() + np.array([[1.0], [0.0], [0.0]]),
+            rtol=1e-6,
+        )
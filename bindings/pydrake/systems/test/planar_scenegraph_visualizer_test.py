@@ -62,14 +62,39 @@ class TestPlanarSceneGraphVisualizer(unittest.TestCase):
         cart_slider.set_translation(context=cart_pole_context, translation=0.0)
         pole_pin.set_angle(context=cart_pole_context, angle=2.0)
 
+        visualizer.start_recording(compact=True)
         simulator = Simulator(diagram, diagram_context)
         simulator.AdvanceTo(0.1)
+        visualizer.ForcedPublish(vis_context)
+        visualizer.stop_recording()
 
         visualizer.draw(vis_context)
         self.assertEqual(
             visualizer.ax.get_title(),
             "t = 0.1",
         )
+        verts = [
+            fill.get_path().vertices.copy()
+            for fills in visualizer._body_fill_dict.values()
+            for fill in fills
+        ]
+
+        # The compact recording only stores the body poses, which are enough
+        # to redraw the final state. This uses private API for testing.
+        num_frames = len(visualizer._recording_buffer)
+        self.assertGreater(num_frames, 1)
+        default_context = diagram.CreateDefaultContext()
+        visualizer.draw(visualizer.GetMyContextFromRoot(default_context))
+        visualizer._draw_recorded_frame(num_frames - 1)
+        self.assertEqual(visualizer.ax.get_title(), "t = 0.1")
+        recorded_verts = [
+            fill.get_path().vertices
+            for fills in visualizer._body_fill_dict.values()
+            for fill in fills
+        ]
+        for expected, actual in zip(verts, recorded_verts):
+            np.testing.assert_allclose(actual, expected, atol=1e-12)
+        self.assertIsNotNone(visualizer.get_recording_as_animation())
 
     def test_kuka(self):
         """Kuka IIWA with mesh geometry."""
@@ -362,6 +387,60 @@ class TestPlanarSceneGraphVisualizer(unittest.TestCase):
         self.assertTrue(np.any(np.not_equal(viz_reference, viz_arbitrary)))
         np.testing.assert_array_equal(viz_reference, viz_scaled)
 
+    def test_projection(self):
+        """Checks the drawn convex hull of a box, for both orthographic and
+        perspective views."""
+        builder = DiagramBuilder()
+        mbp, scene_graph = AddMultibodyPlantSceneGraph(builder, 0.0)
+        box_body = mbp.AddRigidBody("box")
+        mbp.RegisterVisualGeometry(
+            box_body,
+            RigidTransform(),
+            Box(1.0, 2.0, 3.0),
+            "box_vis",
+            np.array([0.5, 0.5, 0.5, 1.0]),
+        )
+        mbp.Finalize()
+
+        def draw_box(T_VW, blit):
+            visualizer = builder.AddSystem(
+                PlanarSceneGraphVisualizer(scene_graph, T_VW=T_VW, blit=blit)
+            )
+            builder.Connect(
+                scene_graph.get_query_output_port(),
+                visualizer.get_geometry_query_input_port(),
+            )
+            return visualizer
+
+        # The default view projects onto the x-z plane.
+        orthographic = draw_box(
+            T_VW=np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]),
+            blit=False,
+        )
+        # This view is along +y, with the box's nearest face at distance 4.
+        perspective = draw_box(
+            T_VW=np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 5]]),
+            blit=True,
+        )
+        diagram = builder.Build()
+        context = diagram.CreateDefaultContext()
+
+        for visualizer, half_size in (
+            (orthographic, [0.5, 1.5]),
+            (perspective, [0.5 / 4, 1.5 / 4]),
+        ):
+            artists = visualizer.draw(visualizer.GetMyContextFromRoot(context))
+            self.assertIn(visualizer.ax.title, artists)
+            (body_fill,) = visualizer._body_fill_dict["plant::box"]
+            self.assertIn(body_fill, artists)
+            verts = np.unique(
+                body_fill.get_path().vertices.round(decimals=12), axis=0
+            )
+            expected = np.array(
+                [[x, y] for x in (-1, 1) for y in (-1, 1)]
+            ) * np.array(half_size)
+            np.testing.assert_allclose(verts, expected, atol=1e-12)
+
     def testConnectPlanarSceneGraphVisualizer(self):
         """Cart-Pole with simple geometry."""
         file_name = FindResourceOrThrow(
@@ -4,6 +4,7 @@ import matplotlib.animation as animation
 import matplotlib.pyplot as plt
 import numpy as np
 
+from pydrake.common.value import Value
 from pydrake.systems.analysis import Simulator
 from pydrake.systems.framework import (
     DiagramBuilder,
@@ -133,3 +134,71 @@ class TestPyplotVisualizer(unittest.TestCase):
 
         visualizer.reset_recording()
         self.assertEqual(len(visualizer._recorded_contexts), 0)
+
+    def test_compact_recording(self):
+        visualizer = TestVisualizer(2)
+        visualizer.start_recording(compact=True)
+
+        times = np.arange(40) * 0.1
+        context = visualizer.AllocateContext()
+        for time in times:
+            context.SetTime(time)
+            visualizer.get_input_port().FixValue(context, [time, -time])
+            visualizer.ForcedPublish(context)
+        visualizer.stop_recording()
+
+        # Only the times and the input values are recorded. This uses private
+        # API for testing and should not be used publicly.
+        self.assertEqual(len(visualizer._recorded_contexts), 0)
+        buffer = visualizer._recording_buffer
+        self.assertEqual(len(buffer), len(times))
+        for i, time in enumerate(times):
+            recorded_time, values = buffer[i]
+            self.assertEqual(recorded_time, time)
+            np.testing.assert_equal(values, [time, -time])
+
+        # Playback draws the recorded values.
+        visualizer._draw_recorded_frame(5)
+        self.assertEqual(visualizer.patch.get_x(), times[5] - 2.5)
+        ani = visualizer.get_recording_as_animation()
+        self.assertIsInstance(ani, animation.FuncAnimation)
+
+        # The recording options can only change after a reset.
+        with self.assertRaises(RuntimeError):
+            visualizer.start_recording()
+        with self.assertRaises(ValueError):
+            visualizer.start_recording(max_bytes=1000)
+        visualizer.reset_recording()
+        self.assertEqual(len(visualizer._recording_buffer), 0)
+
+        # With a memory cap, only the newest frames are kept. Each frame uses
+        # 24 bytes (the time and two values).
+        visualizer.start_recording(compact=True, max_bytes=10 * 24)
+        for time in times:
+            context.SetTime(time)
+            visualizer.get_input_port().FixValue(context, [time, -time])
+            visualizer.ForcedPublish(context)
+        buffer = visualizer._recording_buffer
+        self.assertEqual(len(buffer), 10)
+        self.assertLessEqual(buffer.nbytes, 10 * 24)
+        for i, time in enumerate(times[-10:]):
+            recorded_time, values = buffer[i]
+            self.assertEqual(recorded_time, time)
+            np.testing.assert_equal(values, [time, -time])
+        with self.assertRaises(IndexError):
+            buffer[10]
+
+        # The cap must fit at least one frame.
+        visualizer.reset_recording()
+        visualizer.start_recording(compact=True, max_bytes=16)
+        with self.assertRaises(ValueError):
+            visualizer.ForcedPublish(context)
+
+    def test_compact_recording_abstract_input(self):
+        visualizer = PyPlotVisualizer()
+        visualizer.DeclareAbstractInputPort("value", Value[object]())
+        visualizer.start_recording(compact=True)
+        context = visualizer.AllocateContext()
+        visualizer.get_input_port().FixValue(context, Value[object]("foo"))
+        with self.assertRaisesRegex(NotImplementedError, ".*abstract.*"):
+            visualizer.ForcedPublish(context)
@@ -1,8 +1,15 @@
 import copy
+import os
 import unittest
 
 from drake import lcmt_quaternion
-from pydrake.lcm import DrakeLcm, DrakeLcmInterface, DrakeLcmParams, Subscriber
+from pydrake.lcm import (
+    DrakeLcm,
+    DrakeLcmInterface,
+    DrakeLcmLog,
+    DrakeLcmParams,
+    Subscriber,
+)
 
 
 class TestLcm(unittest.TestCase):
@@ -37,6 +44,23 @@ class TestLcm(unittest.TestCase):
         self.assertIn("lcm_url", repr(dut))
         copy.copy(dut)
 
+    def test_log(self):
+        filename = os.path.join(os.environ["TEST_TMPDIR"], "test.lcmlog")
+        writer = DrakeLcmLog(file_name=filename, is_write=True)
+        self.assertIsInstance(writer, DrakeLcmInterface)
+        self.assertTrue(writer.is_write())
+        writer.Publish(channel="CHANNEL", buffer=self.quat.encode(), time_sec=1)
+        del writer
+
+        reader = DrakeLcmLog(file_name=filename, is_write=False)
+        self.assertFalse(reader.is_write())
+        received = []
+        reader.Subscribe(channel="CHANNEL", handler=received.append)
+        self.assertEqual(reader.GetNextMessageTime(), 1.0)
+        reader.DispatchMessageAndAdvanceLog(current_time=1.0)
+        self.assertEqual(received, [self.quat.encode()])
+        self.assertEqual(reader.GetNextMessageTime(), float("inf"))
+
     def _handler(self, raw):
         quat = lcmt_quaternion.decode(raw)
         self.assertTupleEqual((quat.w, quat.x, quat.y, quat.z), self.wxyz)
@@ -6,8 +6,9 @@ import unittest
 import numpy as np
 
 from pydrake.common.value import Value
+from pydrake.math import RigidTransform
 from pydrake.systems.framework import InputPort, OutputPort
-from pydrake.systems.sensors import CameraInfo, PixelType
+from pydrake.systems.sensors import CameraInfo, ImageDepth32F, PixelType
 
 
 class TestPerception(unittest.TestCase):
@@ -133,6 +134,35 @@ class TestPerception(unittest.TestCase):
         pc_merged_2.EstimateNormals(radius=1, num_closest=50, parallelize=False)
         self.assertTrue(pc_merged_2.has_normals())
 
+    def test_point_cloud_index_api(self):
+        pc = mut.PointCloud(new_size=3, fields=mut.Fields(mut.BaseField.kXYZs))
+        pc.mutable_xyzs()[:] = [[0.0, 1.0, 5.0], [0.0, 0.0, 0.0], [0, 0, 0]]
+        dut = mut.PointCloudIndex(cloud=pc, voxel_size=0.5, parallelize=False)
+        self.assertEqual(dut.voxel_size(), 0.5)
+        self.assertEqual(dut.size(), 3)
+        queries = np.array([[0.9, 4.0], [0.0, 0.0], [0.0, 0.0]])
+        indices, distances = dut.FindNearest(queries=queries, k=2)
+        np.testing.assert_equal(indices, [[1, 2], [0, 1]])
+        np.testing.assert_allclose(
+            distances, [[0.1, 1.0], [0.9, 3.0]], rtol=1e-6
+        )
+        within = dut.FindWithinRadius(
+            queries=queries, radius=1.5, parallelize=False
+        )
+        self.assertEqual(len(within), 2)
+        np.testing.assert_equal(within[0], [1, 0])
+        np.testing.assert_equal(within[1], [2])
+
+        # Points appended to the cloud can be added to the index.
+        pc.Expand(add_size=1)
+        self.assertEqual(pc.size(), 4)
+        pc.mutable_xyzs()[:, 3] = [4.0, 0.0, 0.0]
+        dut.Update(cloud=pc, parallelize=False)
+        self.assertEqual(dut.size(), 4)
+        indices, _ = dut.FindNearest(queries=queries, k=1, parallelize=False)
+        np.testing.assert_equal(indices, [[1, 3]])
+        copy.copy(dut)
+
     def test_depth_image_to_point_cloud_api(self):
         camera_info = CameraInfo(width=640, height=480, fov_y=np.pi / 4)
         dut = mut.DepthImageToPointCloud(camera_info=camera_info)
@@ -147,6 +177,51 @@ class TestPerception(unittest.TestCase):
             fields=mut.BaseField.kXYZs | mut.BaseField.kRGBs,
         )
 
+    def test_fused_depth_image_to_point_cloud_api(self):
+        camera_info = CameraInfo(width=4, height=3, fov_y=np.pi / 4)
+        dut = mut.FusedDepthImageToPointCloud(
+            camera_infos=[camera_info, camera_info],
+            pixel_type=PixelType.kDepth32F,
+            scale=1.0,
+            fields=mut.BaseField.kXYZs | mut.BaseField.kRGBs,
+            voxel_size=None,
+            parallelize=False,
+        )
+        self.assertEqual(dut.num_cameras(), 2)
+        for i in range(2):
+            self.assertIsInstance(
+                dut.depth_image_input_port(camera_index=i), InputPort
+            )
+            self.assertIsInstance(
+                dut.color_image_input_port(camera_index=i), InputPort
+            )
+            self.assertIsInstance(
+                dut.camera_pose_input_port(camera_index=i), InputPort
+            )
+        self.assertIsInstance(dut.point_cloud_output_port(), OutputPort)
+
+        # Each camera's valid depths produce points in the output.
+        depth = ImageDepth32F(width=4, height=3, initial_value=1.0)
+        depth.mutable_data[0, 0] = np.nan
+        context = dut.CreateDefaultContext()
+        for i in range(2):
+            dut.depth_image_input_port(i).FixValue(context, depth)
+        dut.camera_pose_input_port(1).FixValue(
+            context, RigidTransform([0.0, 0.0, 1.0])
+        )
+        cloud = dut.point_cloud_output_port().Eval(context)
+        self.assertEqual(cloud.size(), 2 * (4 * 3 - 1))
+        np.testing.assert_allclose(cloud.xyzs()[2, :11], 1.0)
+        np.testing.assert_allclose(cloud.xyzs()[2, 11:], 2.0)
+
+        dut = mut.FusedDepthImageToPointCloud(
+            camera_infos=[camera_info],
+            pixel_type=PixelType.kDepth16U,
+            scale=0.001,
+            voxel_size=0.01,
+        )
+        self.assertEqual(dut.num_cameras(), 1)
+
     def test_point_cloud_to_lcm(self):
         dut = mut.PointCloudToLcm(frame_name="world")
         dut.get_input_port()
@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import base64
+import collections
+from concurrent.futures import ThreadPoolExecutor, wait
 import copy
+import functools
 import hashlib
 import json
 import logging
+import math
+import operator
 from pathlib import Path
 import re
+import struct
 import sys
+import threading
 import time
 
 import numpy as np
@@ -43,6 +50,7 @@ from pydrake.geometry import (
 )
 from pydrake.lcm import (
     DrakeLcm,
+    DrakeLcmLog,
 )
 from pydrake.math import (
     RigidTransform,
@@ -63,6 +71,10 @@ from pydrake.perception import (
 
 _logger = logging.getLogger("drake")
 
+# The pending data of a channel whose messages are being decoded by a worker
+# thread; see Meldis._on_message().
+_DECODING = object()
+
 _DEFAULT_MESHCAT_PARAMS = MeshcatParams(
     host="localhost",
     show_stats_plot=True,
@@ -74,6 +86,79 @@ def _to_pose(position, quaternion):
     return RigidTransform(Quaternion(wxyz=quaternion), p=position)
 
 
+def _to_transform_matrices(positions, quaternions):
+    """Given N positions and N (not necessarily unit) wxyz quaternions, returns
+    an N x 4 x 4 array of homogeneous transforms. This is the vectorized
+    equivalent of calling _to_pose(...).GetAsMatrix4() on each pair.
+    """
+    p = np.asarray(positions, dtype=float).reshape(-1, 3)
+    q = np.asarray(quaternions, dtype=float).reshape(-1, 4)
+    q = q / np.linalg.norm(q, axis=1, keepdims=True)
+    w, x, y, z = q.T
+    result = np.zeros((len(q), 4, 4))
+    result[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    result[:, 0, 1] = 2 * (x * y - w * z)
+    result[:, 0, 2] = 2 * (x * z + w * y)
+    result[:, 1, 0] = 2 * (x * y + w * z)
+    result[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    result[:, 1, 2] = 2 * (y * z - w * x)
+    result[:, 2, 0] = 2 * (x * z - w * y)
+    result[:, 2, 1] = 2 * (y * z + w * x)
+    result[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    result[:, 0:3, 3] = p
+    result[:, 3, 3] = 1
+    return result
+
+
+class _ViewerLinkDataBuffer:
+    """A drop-in replacement for lcmt_viewer_link_data when used as the
+    message_type of a Meldis subscription. Its decode() function returns an
+    lcmt_viewer_link_data, except that each geometry's float_data is a
+    read-only numpy view (of big-endian float32) into the message bytes
+    instead of a list of Python floats. Deformable meshes send their entire
+    vertex block in float_data, so this avoids boxing every coordinate.
+    """
+
+    @staticmethod
+    def decode(data):
+        if data[:8] != lcmt_viewer_link_data._get_packed_fingerprint():
+            raise ValueError("Decode error")
+        offset = 8
+
+        def unpack(fmt):
+            nonlocal offset
+            result = struct.unpack_from(fmt, data, offset)
+            offset += struct.calcsize(fmt)
+            return result
+
+        def unpack_string():
+            nonlocal offset
+            (size,) = unpack(">i")
+            # The encoded size includes the nul terminator.
+            result = data[offset : offset + size - 1]
+            offset += size
+            return bytes(result).decode("utf-8", "replace")
+
+        message = lcmt_viewer_link_data()
+        message.name = unpack_string()
+        message.robot_num, message.num_geom = unpack(">ii")
+        message.geom = []
+        for _ in range(message.num_geom):
+            geom = lcmt_viewer_geometry_data()
+            (geom.type,) = unpack(">b")
+            geom.position = list(unpack(">3f"))
+            geom.quaternion = list(unpack(">4f"))
+            geom.color = list(unpack(">4f"))
+            geom.string_data = unpack_string()
+            (geom.num_float_data,) = unpack(">i")
+            geom.float_data = np.frombuffer(
+                data, dtype=">f4", count=geom.num_float_data, offset=offset
+            )
+            offset += 4 * geom.num_float_data
+            message.geom.append(geom)
+        return message
+
+
 class _Slider:
     """A slider with range [small-positive-value to 1.0]."""
 
@@ -104,6 +189,53 @@ class _Slider:
         return value, value_changed
 
 
+class _RecordingMeshcat:
+    """A stand-in for a Meshcat instance that the applets draw into. Normally
+    it simply forwards every call to Meshcat. While recording (see
+    start_recording), the transforms and properties set by the applets are
+    also saved into Meshcat's animation at the current `time`.
+    """
+
+    def __init__(self, meshcat):
+        self.meshcat = meshcat
+        self.time = None
+
+    def __getattr__(self, name):
+        # Cache the bound method, so that later lookups are just as fast as
+        # calling Meshcat directly.
+        value = getattr(self.meshcat, name)
+        setattr(self, name, value)
+        return value
+
+    def start_recording(self, frames_per_second):
+        self.meshcat.StartRecording(frames_per_second=frames_per_second)
+        self.time = 0.0
+        self.SetTransform = self._record_transform
+        self.SetProperty = self._record_property
+
+    def stop_recording(self):
+        self.meshcat.StopRecording()
+        self.time = None
+        del self.SetTransform
+        del self.SetProperty
+
+    def _record_transform(self, path, X_ParentPath=None, *, matrix=None):
+        # Only the RigidTransform overload of SetTransform supports recording.
+        if matrix is not None:
+            X_ParentPath = RigidTransform.MakeUnchecked(pose=matrix)
+        self.meshcat.SetTransform(
+            path=path, X_ParentPath=X_ParentPath, time_in_recording=self.time
+        )
+
+    def _record_property(self, path, property, value):
+        self.meshcat.SetProperty(
+            path=path,
+            property=property,
+            value=value,
+            time_in_recording=self.time,
+        )
+
+
 def _json_to_memory_file(json):
     """Converts a json representation of a MemoryFile to an instance of
     same."""
@@ -153,6 +285,137 @@ def _make_mesh_source_from_json(json_str):
     )
 
 
+class _FileDigestCache:
+    """Remembers the SHA-256 digest of files read by _GeometryFileHasher,
+    along with any file references that were parsed out of their content.
+    Entries are keyed by path and validated against the file's stat signature
+    (size, mtime_ns, inode), so an unchanged file is never re-read.
+
+    A single instance (_FILE_DIGEST_CACHE) is shared by all applets in the
+    process. Optionally, the entries can be persisted to a JSON index file so
+    that restarting Meldis does not rehash everything.
+    """
+
+    # Files modified this recently (relative to when we hashed them) are not
+    # remembered, because a same-size rewrite within the filesystem's
+    # timestamp granularity would not change the stat signature.
+    _RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self):
+        # Maps str(path) => (signature, digest, references).
+        self._entries = {}
+        self._index_path = None
+        self._dirty = False
+
+    def read(self, path: Path, parse=None):
+        """Returns a pair (digest, references) for the given file, or None if
+        the file cannot be read. When `parse` is given, it is called with the
+        file content (as ``bytes``) and must return a list of ``str``; that
+        list is returned as the references (and cached alongside the digest).
+        """
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        key = str(path)
+        signature = [
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            stat_result.st_ino,
+        ]
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == signature:
+            _, digest, references = cached
+            if parse is None or references is not None:
+                return (digest, references)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        digest = hashlib.sha256(content).hexdigest()
+        references = parse(content) if parse is not None else None
+        if time.time_ns() - stat_result.st_mtime_ns > self._RACY_WINDOW_NS:
+            self._entries[key] = (signature, digest, references)
+            self._dirty = True
+        return (digest, references)
+
+    def load_index(self, index_path: Path):
+        """Loads previously-persisted entries from the given JSON file (if it
+        exists), and arranges for save_index() to write back to it.
+        """
+        self._index_path = Path(index_path)
+        try:
+            document = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _logger.warning(
+                f"Ignoring malformed mesh checksum cache {index_path}: {e}"
+            )
+            return
+        entries = self._parse_index(document)
+        if entries is None:
+            _logger.warning(
+                f"Ignoring malformed mesh checksum cache {index_path}"
+            )
+            return
+        self._entries.update(entries)
+
+    @staticmethod
+    def _parse_index(document):
+        """Returns the entries of a loaded index document, or None if the
+        document does not have the shape that save_index() writes.
+        """
+        if not isinstance(document, dict):
+            return None
+        entries = {}
+        for key, value in document.items():
+            if not (isinstance(value, list) and len(value) == 3):
+                return None
+            signature, digest, references = value
+            if not (
+                isinstance(signature, list)
+                and len(signature) == 3
+                and all(type(x) is int for x in signature)
+                and isinstance(digest, str)
+                and (
+                    references is None
+                    or (
+                        isinstance(references, list)
+                        and all(isinstance(x, str) for x in references)
+                    )
+                )
+            ):
+                return None
+            entries[key] = (signature, digest, references)
+        return entries
+
+    def save_index(self):
+        """Writes the entries to the index file given to load_index(), if any
+        entries have changed since the last save.
+        """
+        if self._index_path is None or not self._dirty:
+            return
+        document = {
+            key: [signature, digest, references]
+            for key, (signature, digest, references) in self._entries.items()
+        }
+        temp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        try:
+            temp_path.write_text(json.dumps(document), encoding="utf-8")
+            temp_path.replace(self._index_path)
+        except OSError as e:
+            _logger.warning(
+                f"Could not write mesh checksum cache {self._index_path}: {e}"
+            )
+            return
+        self._dirty = False
+
+
+_FILE_DIGEST_CACHE = _FileDigestCache()
+
+
 class _GeometryFileHasher:
     """Calculates a checksum of external file(s) referenced by geometry
     messages such as lcmt_viewer_load_robot or similar.
@@ -160,29 +423,33 @@ class _GeometryFileHasher:
     Each "on_..." method incorporates all of the external files cited by the
     given argument (of a specific type) into the current hash. Files that are
     named but cannot be opened are silently skipped.
+
+    The per-file digests come from the given cache (by default, the
+    process-wide _FILE_DIGEST_CACHE), so unchanged files are not re-read.
     """
 
-    def __init__(self):
+    def __init__(self, *, cache: _FileDigestCache | None = None):
         self._paths = []
         self._hasher = hashlib.sha256()
+        self._cache = cache if cache is not None else _FILE_DIGEST_CACHE
 
     def value(self):
         return self._hasher.hexdigest()
 
-    def _read_file(self, path: Path):
-        """Reads the given file and adds its content to the current hash.
-        Returns the file content (as ``bytes``, not ``str``).
+    def _read_file(self, path: Path, parse=None):
+        """Adds the given file's content digest to the current hash.
+        Returns the list of file references that `parse` found in the content
+        (see _FileDigestCache.read), or an empty list when `parse` is None.
         Remembers the filename (for unit testing).
-        If the file is missing, silently returns an empty ``bytes``.
+        If the file is missing, silently returns an empty list.
         """
-        try:
-            with open(path, "rb") as f:
-                content = f.read()
-            self._hasher.update(content)
-            self._paths.append(path)
-            return content
-        except OSError:
-            return b""
+        result = self._cache.read(path, parse)
+        if result is None:
+            return []
+        digest, references = result
+        self._hasher.update(digest.encode())
+        self._paths.append(path)
+        return references or []
 
     def on_viewer_load_robot(self, message: lcmt_viewer_load_robot):
         assert isinstance(message, lcmt_viewer_load_robot)
@@ -225,53 +492,73 @@ class _GeometryFileHasher:
                 self._read_file(file_source)
 
     def on_mesh_from_disk(self, path: Path):
-        # Hash the file contents, even if we don't know how to interpret it.
-        content = self._read_file(path)
         if path.suffix.lower() == ".obj":
-            self.on_obj_from_disk(path, content)
+            self.on_obj_from_disk(path)
         elif path.suffix.lower() == ".gltf":
-            self.on_gltf_from_disk(path, content)
+            self.on_gltf_from_disk(path)
         else:
+            # Hash the file contents, even if we don't know how to interpret
+            # it.
+            self._read_file(path)
             _logger.warning(
                 f"Unsupported mesh file: '{path}'\n"
                 "Update Meldis's hasher to trigger reloads on this kind of "
                 "file."
             )
 
-    def on_obj_from_disk(self, path: Path, content: bytes):
+    def on_obj_from_disk(self, path: Path):
         assert isinstance(path, Path)
-        for mtl_names in re.findall(
-            rb"^\s*mtllib\s+(.*?)\s*$", content, re.MULTILINE
-        ):
-            for mtl_name in mtl_names.decode("utf-8").split():
-                self.on_mtl_from_disk(path.parent / mtl_name)
+
+        def parse(content):
+            result = []
+            for mtl_names in re.findall(
+                rb"^\s*mtllib\s+(.*?)\s*$", content, re.MULTILINE
+            ):
+                result.extend(mtl_names.decode("utf-8").split())
+            return result
+
+        for mtl_name in self._read_file(path, parse):
+            self.on_mtl_from_disk(path.parent / mtl_name)
 
     def on_mtl_from_disk(self, path: Path):
         assert isinstance(path, Path)
-        content = self._read_file(path)
-        for tex_name in re.findall(
-            rb"^\s*map_.*?\s+(\S+)\s*$", content, re.MULTILINE
-        ):
-            self.on_texture_from_disk(path.parent / tex_name.decode("utf-8"))
+
+        def parse(content):
+            return [
+                tex_name.decode("utf-8")
+                for tex_name in re.findall(
+                    rb"^\s*map_.*?\s+(\S+)\s*$", content, re.MULTILINE
+                )
+            ]
+
+        for tex_name in self._read_file(path, parse):
+            self.on_texture_from_disk(path.parent / tex_name)
 
     def on_texture_from_disk(self, path: Path):
         assert isinstance(path, Path)
         self._read_file(path)
 
-    def on_gltf_from_disk(self, path: Path, content: bytes):
+    def on_gltf_from_disk(self, path: Path):
         assert isinstance(path, Path)
-        try:
-            document = json.loads(content.decode(encoding="utf-8"))
-        except json.JSONDecodeError:
-            _logger.warning(f"glTF file is not valid JSON: {path}")
-            return
 
-        # Handle images and .bin files cited via URIs.
-        for array_property in ("images", "buffers"):
-            for item in document.get(array_property, []):
-                uri = item.get("uri", None)
-                if uri and not uri.startswith("data:"):
-                    self._read_file(path.parent / uri)
+        def parse(content):
+            try:
+                document = json.loads(content.decode(encoding="utf-8"))
+            except json.JSONDecodeError:
+                _logger.warning(f"glTF file is not valid JSON: {path}")
+                return []
+
+            # Handle images and .bin files cited via URIs.
+            result = []
+            for array_property in ("images", "buffers"):
+                for item in document.get(array_property, []):
+                    uri = item.get("uri", None)
+                    if uri and not uri.startswith("data:"):
+                        result.append(uri)
+            return result
+
+        for uri in self._read_file(path, parse):
+            self._read_file(path.parent / uri)
 
 
 class _ViewerApplet:
@@ -308,6 +595,23 @@ class _ViewerApplet:
         self._start_visible = start_visible
         self._geom_paths = []
 
+        # The link table used by on_viewer_draw, precomputed for the most
+        # recent (link_name, robot_num) lists seen in a draw message.
+        self._draw_table_link_names = None
+        self._draw_table_robot_nums = None
+        self._draw_table_indices = None
+        self._draw_table_paths = None
+
+        # Per-geometry caches for deformable meshes, keyed by meshcat path.
+        # The topology cache maps to (face_data, faces) so that unchanged
+        # faces are only decoded once; the sent cache maps to the (vertices,
+        # faces, rgba) most recently given to Meshcat. The topology cache is
+        # used by the converter (which may run on a worker thread), so it is
+        # guarded by the _deformable_topology_lock.
+        self._deformable_topology_lock = threading.Lock()
+        self._deformable_topology = {}
+        self._deformable_sent = {}
+
         # Initialize ourself with an empty load message.
         self.on_viewer_load(message=lcmt_viewer_load_robot())
 
@@ -320,6 +624,7 @@ class _ViewerApplet:
         hasher = _GeometryFileHasher()
         hasher.on_viewer_load_robot(message)
         mesh_checksum = hasher.value()
+        _FILE_DIGEST_CACHE.save_index()
         if self._load_message is not None:
             if (
                 message.num_links == self._load_message.num_links
@@ -333,6 +638,9 @@ class _ViewerApplet:
 
         # The semantics of a load message is to reset the entire scene.
         self._meshcat.Delete(path=self._path)
+        with self._deformable_topology_lock:
+            self._deformable_topology.clear()
+        self._deformable_sent = {}
 
         self._waiting_for_first_draw_message = True
         self._load_message = message
@@ -352,9 +660,7 @@ class _ViewerApplet:
         for link in message.link:
             if not self._should_accept_link(link.name):
                 continue
-            robot_num = link.robot_num
-            link_name = link.name.replace("::", "/")
-            link_path = f"{self._path}/{robot_num}/{link_name}"
+            link_path = self._link_path(link.robot_num, link.name)
             for j, geom in enumerate(link.geom):
                 geom_path = f"{link_path}/{j}"
                 shape, rgba, pose = self._convert_geom(geom)
@@ -369,16 +675,46 @@ class _ViewerApplet:
                 self._meshcat.SetObject(**set_object_kwargs)
                 self._meshcat.SetTransform(path=geom_path, X_ParentPath=pose)
 
+    def _link_path(self, robot_num, link_name):
+        """Returns the meshcat path for the given link."""
+        return f"{self._path}/{robot_num}/{link_name.replace('::', '/')}"
+
+    def _update_draw_table(self, message):
+        """Ensures that the draw table matches the given lcmt_viewer_draw
+        message. The table lists the indices of the message's links that we
+        accept, along with their meshcat paths. Simulations send the same
+        links in the same order in every draw message, so this is usually
+        computed only once per load message.
+        """
+        if (
+            message.link_name == self._draw_table_link_names
+            and message.robot_num == self._draw_table_robot_nums
+        ):
+            return
+        indices = []
+        paths = []
+        for i, (link_name, robot_num) in enumerate(
+            zip(message.link_name, message.robot_num)
+        ):
+            if self._should_accept_link(link_name):
+                indices.append(i)
+                paths.append(self._link_path(robot_num, link_name))
+        self._draw_table_link_names = list(message.link_name)
+        self._draw_table_robot_nums = list(message.robot_num)
+        self._draw_table_indices = np.array(indices, dtype=int)
+        self._draw_table_paths = paths
+
     def on_viewer_draw(self, message):
         """Handler for lcmt_viewer_draw."""
-        for i in range(message.num_links):
-            if not self._should_accept_link(message.link_name[i]):
-                continue
-            link_name = message.link_name[i].replace("::", "/")
-            robot_num = message.robot_num[i]
-            link_path = f"{self._path}/{robot_num}/{link_name}"
-            pose = _to_pose(message.position[i], message.quaternion[i])
-            self._meshcat.SetTransform(path=link_path, X_ParentPath=pose)
+        self._update_draw_table(message)
+        if self._draw_table_paths:
+            indices = self._draw_table_indices
+            matrices = _to_transform_matrices(
+                np.asarray(message.position)[indices],
+                np.asarray(message.quaternion)[indices],
+            )
+            for path, matrix in zip(self._draw_table_paths, matrices):
+                self._meshcat.SetTransform(path=path, matrix=matrix)
         self._meshcat.SetSimulationTime(sim_time=message.timestamp * 1e-3)
         if self._waiting_for_first_draw_message:
             self._waiting_for_first_draw_message = False
@@ -411,40 +747,95 @@ class _ViewerApplet:
 
     def on_viewer_draw_deformable(self, message):
         """Handler for lcmt_viewer_link_data."""
+        self.show_viewer_draw_deformable(
+            self.convert_viewer_draw_deformable(message)
+        )
+
+    def convert_viewer_draw_deformable(self, message):
+        """Converts an lcmt_viewer_link_data into a tuple of (link_path, geoms)
+        where geoms is a list of (geom_path, vertices, faces, rgba, pose). This
+        does not call into Meshcat, so it may be run on a worker thread.
+        """
         link_name = message.name
         robot = message.robot_num
         link_path = f"{self._path}/{robot}/{link_name}"
-        for i, geom in enumerate(message.geom):
+        geoms = []
+        for geom in message.geom:
             geom_name = geom.string_data
             geom_path = f"{link_path}/{geom_name}"
-            vertices, faces, rgba, pose = self._convert_deformable_geom(geom)
-            self._meshcat.SetTriangleMesh(
-                path=geom_path, vertices=vertices, faces=faces, rgba=rgba
+            geoms.append(
+                (geom_path, *self._convert_deformable_geom(geom, geom_path))
             )
+        with self._deformable_topology_lock:
+            self._evict_deformable(self._deformable_topology, link_path, geoms)
+        return (link_path, geoms)
+
+    def show_viewer_draw_deformable(self, converted):
+        """Displays the result of convert_viewer_draw_deformable."""
+        link_path, geoms = converted
+        self._evict_deformable(self._deformable_sent, link_path, geoms)
+        for geom_path, vertices, faces, rgba, pose in geoms:
+            # Meshcat can only replace a mesh wholesale, so skip it entirely
+            # when nothing about it has changed since it was last sent.
+            sent = self._deformable_sent.get(geom_path)
+            if (
+                sent is None
+                or sent[1] is not faces
+                or sent[2] != rgba
+                or not np.array_equal(sent[0], vertices)
+            ):
+                self._meshcat.SetTriangleMesh(
+                    path=geom_path, vertices=vertices, faces=faces, rgba=rgba
+                )
+                self._deformable_sent[geom_path] = (vertices, faces, rgba)
             self._meshcat.SetTransform(path=link_path, X_ParentPath=pose)
         if self._waiting_for_first_draw_message:
             self._waiting_for_first_draw_message = False
             self._set_visible(True)
 
+    @staticmethod
+    def _evict_deformable(cache, link_path, geoms):
+        """Removes the cache entries for any of link_path's geometries that
+        are not among the given (geom_path, ...) tuples, so that the deformable
+        caches only ever hold the meshes that are currently being drawn.
+        """
+        prefix = f"{link_path}/"
+        current = {geom[0] for geom in geoms}
+        for geom_path in list(cache):
+            if geom_path.startswith(prefix) and geom_path not in current:
+                cache.pop(geom_path, None)
+
     def _set_visible(self, value):
         self._meshcat.SetProperty(self._path, property="visible", value=value)
 
-    def _convert_deformable_geom(self, geom):
+    def _convert_deformable_geom(self, geom, geom_path):
         """Given an lcmt_viewer_geometry_data, parses it into a tuple of
         (vertices, faces, Rgba, RigidTransform) if the geometry type is a
-        MESH.
+        MESH. When the faces match those previously seen for geom_path, the
+        previous faces array object is returned.
         """
         assert geom.type == lcmt_viewer_geometry_data.MESH
-        num_verts = int(geom.float_data[0])
-        num_faces = int(geom.float_data[1])
+        # Convert the float_data in a single pass; the vertices and faces are
+        # then views into that one array.
+        data = np.asarray(geom.float_data, dtype=float)
         # The first two floats encode the number of vertices and number of
         # triangles.
+        num_verts = int(data[0])
+        num_faces = int(data[1])
         v_start_index = 2
         f_start_index = v_start_index + 3 * num_verts
-        vertices = np.array(geom.float_data[v_start_index:f_start_index])
-        faces = np.array(geom.float_data[f_start_index:]).astype(int)
-        vertices = np.reshape(vertices, (3, num_verts), order="F")
-        faces = np.reshape(faces, (3, num_faces), order="F")
+        vertices = data[v_start_index:f_start_index].reshape(
+            (3, num_verts), order="F"
+        )
+        face_data = data[f_start_index:]
+        with self._deformable_topology_lock:
+            cached = self._deformable_topology.get(geom_path)
+        if cached is not None and np.array_equal(cached[0], face_data):
+            faces = cached[1]
+        else:
+            faces = face_data.astype(int).reshape((3, num_faces), order="F")
+            with self._deformable_topology_lock:
+                self._deformable_topology[geom_path] = (face_data, faces)
         rgba = Rgba(*geom.color)
         pose = _to_pose(geom.position, geom.quaternion)
         return (vertices, faces, rgba, pose)
@@ -526,6 +917,13 @@ class _ContactApplet:
     """Displays lcmt_contact_results_for_viz into Meshcat."""
 
     def __init__(self, *, meshcat):
+        # The C++ helpers need the actual Meshcat object. When recording, they
+        # save their changes at the time passed to Update().
+        self._recording = None
+        if isinstance(meshcat, _RecordingMeshcat):
+            self._recording = meshcat
+            meshcat = meshcat.meshcat
+
         # By default, don't show any contact illustrations.
         meshcat.SetProperty("/CONTACT_RESULTS", "visible", True)
 
@@ -539,35 +937,51 @@ class _ContactApplet:
         params.prefix = "/CONTACT_RESULTS/hydroelastic"
         self._hydro_helper = _HydroelasticContactVisualizer(meshcat, params)
 
-    # Converts poly_data from a hydro lcm message to numpy array.
-    def convert_faces(self, poly_data):
-        poly_index = 0
-        faces = []
-        while poly_index < len(poly_data):
-            poly_i_num_vertices = poly_data[poly_index]
-            vertex_0_index = poly_index + 1
-            vertex_0_global_index = poly_data[vertex_0_index]
-            for i in range(1, poly_i_num_vertices - 1):
-                vertex_1_global_index = poly_data[vertex_0_index + i]
-                vertex_2_global_index = poly_data[vertex_0_index + i + 1]
-                faces.append(
-                    [
-                        vertex_0_global_index,
-                        vertex_1_global_index,
-                        vertex_2_global_index,
-                    ]
-                )
-            poly_index += poly_i_num_vertices + 1
-        return np.array(faces).transpose()
-
-    # Converts verts from hydro lcm message to numpy array
-    def convert_verts(self, p_WV):
-        verts = np.empty((3, len(p_WV)))
-        for i in range(len(p_WV)):
-            verts[0, i] = p_WV[i].x
-            verts[1, i] = p_WV[i].y
-            verts[2, i] = p_WV[i].z
-        return verts
+    @staticmethod
+    def convert_faces(poly_data):
+        """Converts poly_data from a hydro lcm message to a 3xT numpy array of
+        triangle vertex indices, by fan-triangulating each polygon.
+
+        The poly_data is encoded as a sequence of polygons, each one given by
+        its vertex count followed by that many vertex indices.
+        """
+        data = np.asarray(poly_data, dtype=int)
+        if data.size == 0:
+            return np.empty((3, 0), dtype=int)
+
+        # Find where each polygon starts. In the common case where all of the
+        # polygons have the same vertex count, we can do this without a loop.
+        n = data[0]
+        if data.size % (n + 1) == 0 and np.all(data[:: n + 1] == n):
+            starts = np.arange(0, data.size, n + 1)
+        else:
+            starts = []
+            poly_index = 0
+            while poly_index < len(poly_data):
+                starts.append(poly_index)
+                poly_index += poly_data[poly_index] + 1
+            starts = np.array(starts, dtype=int)
+
+        # A polygon with N vertices yields N - 2 triangles. For each triangle,
+        # find the start of its polygon and its index within the fan.
+        num_triangles = np.maximum(data[starts] - 2, 0)
+        triangle_starts = np.repeat(starts, num_triangles)
+        fan_index = np.arange(triangle_starts.size) - np.repeat(
+            np.cumsum(num_triangles) - num_triangles, num_triangles
+        )
+        return np.stack(
+            [
+                data[triangle_starts + 1],
+                data[triangle_starts + 2 + fan_index],
+                data[triangle_starts + 3 + fan_index],
+            ]
+        )
+
+    @staticmethod
+    def convert_verts(p_WV):
+        """Converts verts from a hydro lcm message to a 3xN numpy array."""
+        xyzs = list(map(operator.attrgetter("x", "y", "z"), p_WV))
+        return np.array(xyzs, dtype=float).reshape(-1, 3).T
 
     def get_full_names(self, item):
         name1 = []
@@ -593,15 +1007,19 @@ class _ContactApplet:
         return (".".join(name1), ".".join(name2))
 
     def on_contact_results(self, message):
-        """Handler for lcmt_contact_results_for_viz. Note that only point
-        hydroelastic contact force and moment vectors are shown; contact
-        surface and pressure are not shown.
+        """Handler for lcmt_contact_results_for_viz."""
+        self.show_contact_results(self.convert_contact_results(message))
+
+    def convert_contact_results(self, message):
+        """Converts an lcmt_contact_results_for_viz into a pair of lists of
+        point and hydroelastic visualizer items. This does not call into
+        Meshcat, so it may be run on a worker thread.
         """
 
         # Handle point contact pairs
-        viz_items = []
+        point_items = []
         for lcm_item in message.point_pair_contact_info:
-            viz_items.append(
+            point_items.append(
                 _PointContactVisualizerItem(
                     body_A=lcm_item.body1_name,
                     body_B=lcm_item.body2_name,
@@ -609,13 +1027,12 @@ class _ContactApplet:
                     contact_point=lcm_item.contact_point,
                 )
             )
-        self._point_helper.Update(0, viz_items)
 
         # Handle hydroelastic contact pairs
-        viz_items = []
+        hydro_items = []
         for lcm_item in message.hydroelastic_contacts:
             (name1, name2) = self.get_full_names(lcm_item)
-            viz_items.append(
+            hydro_items.append(
                 _HydroelasticContactVisualizerItem(
                     body_A=name1,
                     body_B=name2,
@@ -627,7 +1044,16 @@ class _ContactApplet:
                     pressure=lcm_item.pressure,
                 )
             )
-        self._hydro_helper.Update(0, viz_items)
+        return (point_items, hydro_items)
+
+    def show_contact_results(self, converted):
+        """Displays the result of convert_contact_results."""
+        point_items, hydro_items = converted
+        time = 0
+        if self._recording is not None and self._recording.time is not None:
+            time = self._recording.time
+        self._point_helper.Update(time, point_items)
+        self._hydro_helper.Update(time, hydro_items)
 
 
 class _PointCloudApplet:
@@ -648,9 +1074,32 @@ class _PointCloudApplet:
     all the fields in this particular order.
     """
 
-    def __init__(self, *, meshcat):
+    def __init__(self, *, meshcat, max_points=None, voxel_size=None):
+        """Constructs an applet.
+
+        The optional max_points and voxel_size are dicts keyed by channel name
+        (where the key "*" applies to all channels not otherwise listed). A
+        cloud with more than max_points points is uniformly subsampled down to
+        that budget; a cloud with a voxel_size is then downsampled using
+        PointCloud.VoxelizedDownSample.
+        """
         self._meshcat = meshcat
+        self._max_points = max_points or {}
+        self._voxel_size = voxel_size or {}
         self._already_warned_channel_names = set()
+        # A PointCloud per channel whose storage can be reused by the next
+        # message on that channel. A buffer is only ever in this dict while
+        # nobody else is using it (see convert_point_cloud). The converter may
+        # run on a worker thread, so the dict is guarded by the
+        # _spare_clouds_lock.
+        self._spare_clouds_lock = threading.Lock()
+        self._spare_clouds = {}
+
+    @staticmethod
+    def _lookup(per_channel, channel):
+        """Returns the per_channel setting for the given channel (or else the
+        "*" setting, or else None)."""
+        return per_channel.get(channel, per_channel.get("*"))
 
     def _validate_and_get_fields(self, message):
         """Checks the point cloud LCM message and returns the corresponding
@@ -697,21 +1146,45 @@ class _PointCloudApplet:
         Validates and converts the lcmt_point_cloud message to a PointCloud
         object for display.
         """
+        cloud = self.convert_point_cloud(channel, message)
+        self.show_point_cloud(channel, cloud)
+
+    def convert_point_cloud(self, channel, message):
+        """Validates and converts the lcmt_point_cloud message to a PointCloud
+        object, or returns None when the message is not supported. This does
+        not call into Meshcat, so it may be run on a worker thread.
+        """
         cloud_fields = self._validate_and_get_fields(message)
         if cloud_fields is None:
             # Throttle warning messages to one per channel.
             if channel not in self._already_warned_channel_names:
                 self._already_warned_channel_names.add(channel)
                 _logger.warning(f"Unsupported point cloud data from {channel}.")
-            return
+            return None
 
         # Transform the raw data into an N x num_fields array.
         raw_data = np.frombuffer(message.data, dtype=np.float32).reshape(
             -1, message.num_fields
         )
+
+        # Apply the point budget (if any) using evenly-spaced points, so that
+        # the subset is stable from one message to the next.
+        max_points = self._lookup(self._max_points, channel)
+        if max_points is not None and raw_data.shape[0] > max_points:
+            indices = np.linspace(0, raw_data.shape[0] - 1, max_points)
+            raw_data = raw_data[indices.astype(int)]
         num_points = raw_data.shape[0]
 
-        cloud = PointCloud(num_points, cloud_fields)
+        # Reuse the prior message's buffer when it has the same shape. We take
+        # ownership of it by removing it from the dict.
+        with self._spare_clouds_lock:
+            cloud = self._spare_clouds.pop(channel, None)
+        if (
+            cloud is None
+            or cloud.size() != num_points
+            or cloud.fields() != cloud_fields
+        ):
+            cloud = PointCloud(num_points, cloud_fields)
         xyzs = raw_data[:, 0:3]
         cloud.mutable_xyzs()[:] = xyzs.transpose()
         if message.num_fields > 3:
@@ -724,21 +1197,42 @@ class _PointCloudApplet:
             normals = raw_data[:, 4:]
             cloud.mutable_normals()[:] = normals.transpose()
 
+        voxel_size = self._lookup(self._voxel_size, channel)
+        if voxel_size is not None:
+            # The full-size buffer is no longer needed, so it's spare again.
+            downsampled = cloud.VoxelizedDownSample(voxel_size=voxel_size)
+            with self._spare_clouds_lock:
+                self._spare_clouds[channel] = cloud
+            cloud = downsampled
+        return cloud
+
+    def show_point_cloud(self, channel, cloud):
+        """Displays the result of convert_point_cloud."""
+        if cloud is None:
+            return
         self._meshcat.SetObject(
             path=self._channel_to_meshcat_path(channel),
             cloud=cloud,
             point_size=0.01,
         )
+        # Meshcat has copied the data, so the buffer may be reused (unless a
+        # full-size buffer was already returned by the voxel downsampling).
+        with self._spare_clouds_lock:
+            self._spare_clouds.setdefault(channel, cloud)
 
 
 class _DrawFrameApplet:
     """Applet to visualize triads in meshcat"""
 
-    def __init__(self, *, meshcat):
+    def __init__(self, *, meshcat, triad_length=0.25, triad_radius=0.01):
         """Constructs an applet."""
         self._meshcat = meshcat
+        self._triad_length = triad_length
+        self._triad_radius = triad_radius
         # previously published link names
         self._channel_link_map = {}
+        # the triad paths for those link names (in the same order)
+        self._channel_link_paths = {}
 
     def _channel_to_meshcat_path(self, channel):
         assert channel.startswith("DRAKE_DRAW_FRAMES")
@@ -749,52 +1243,117 @@ class _DrawFrameApplet:
             suffix = channel[len("DRAKE_DRAW_FRAMES_") :]
             return f"/DRAKE_DRAW_FRAMES/{suffix}"
 
-    def _add_meshcat_triad(self, path, X_PT):
-        length = 0.25
-        radius = 0.01
+    def set_triad_size(self, *, length, radius):
+        """Changes the length and radius of all triads, including the ones
+        that have already been added to meshcat (without re-creating them).
+        """
+        self._triad_length = length
+        self._triad_radius = radius
+        for link_paths in self._channel_link_paths.values():
+            for path in link_paths:
+                self._resize_meshcat_triad(path)
+
+    def _add_meshcat_triad(self, path):
+        """Adds the triad geometry at the given path. The cylinders are unit
+        sized; _resize_meshcat_triad scales them to the current size.
+        """
         opacity = 1.0
-        self._meshcat.SetTransform(path, X_PT)
+        for axis, rgba in (
+            ("x-axis", Rgba(1, 0, 0, opacity)),
+            ("y-axis", Rgba(0, 1, 0, opacity)),
+            ("z-axis", Rgba(0, 0, 1, opacity)),
+        ):
+            self._meshcat.SetObject(
+                f"{path}/{axis}/cylinder", Cylinder(1.0, 1.0), rgba
+            )
+        self._resize_meshcat_triad(path)
+
+    def _resize_meshcat_triad(self, path):
+        length = self._triad_length
+        radius = self._triad_radius
         # x-axis
         X_TG = RigidTransform(
             RotationMatrix.MakeYRotation(np.pi / 2), [length / 2.0, 0, 0]
         )
         self._meshcat.SetTransform(path + "/x-axis", X_TG)
-        self._meshcat.SetObject(
-            path + "/x-axis", Cylinder(radius, length), Rgba(1, 0, 0, opacity)
-        )
         # y-axis
         X_TG = RigidTransform(
             RotationMatrix.MakeXRotation(np.pi / 2), [0, length / 2.0, 0]
         )
         self._meshcat.SetTransform(path + "/y-axis", X_TG)
-        self._meshcat.SetObject(
-            path + "/y-axis", Cylinder(radius, length), Rgba(0, 1, 0, opacity)
-        )
         # z-axis
         X_TG = RigidTransform([0, 0, length / 2.0])
         self._meshcat.SetTransform(path + "/z-axis", X_TG)
-        self._meshcat.SetObject(
-            path + "/z-axis", Cylinder(radius, length), Rgba(0, 0, 1, opacity)
-        )
+        # Note: Meshcat does not fully support non-uniform scaling (see
+        # #18095). We get away with it here since the cylinders have no
+        # children in the kinematic tree.
+        for axis in ("x-axis", "y-axis", "z-axis"):
+            self._meshcat.SetProperty(
+                f"{path}/{axis}/cylinder", "scale", [radius, radius, length]
+            )
 
     def on_frame_update(self, channel, message):
         """Handler to update triads in meshcat. It updates poses sent using
-        the lcmt_viewer_draw message."""
+        the lcmt_viewer_draw message. The triad geometry is only re-created
+        when the link names have changed; otherwise, only the triad poses are
+        sent."""
         channel_path = self._channel_to_meshcat_path(channel)
 
-        # delete old frames if the link names have changed
-        link_names = set(message.link_name)
-        if self._channel_link_map.get(channel) != link_names:
-            self._meshcat.Delete(path=channel_path)
-        self._channel_link_map[channel] = link_names
-
-        for i in range(message.num_links):
-            link_name = message.link_name[i].replace("::", "/")
-            link_path = f"{channel_path}/{link_name}"
-            self._add_meshcat_triad(
-                path=link_path,
-                X_PT=_to_pose(message.position[i], message.quaternion[i]),
-            )
+        link_names = list(message.link_name)
+        old_link_names = self._channel_link_map.get(channel)
+        if link_names != old_link_names:
+            link_paths = [
+                f"{channel_path}/{link_name.replace('::', '/')}"
+                for link_name in link_names
+            ]
+            # delete old frames and add new ones if the link names have
+            # changed (a mere reordering keeps the existing geometry)
+            if old_link_names is None or set(old_link_names) != set(link_names):
+                self._meshcat.Delete(path=channel_path)
+                for link_path in link_paths:
+                    self._add_meshcat_triad(link_path)
+            self._channel_link_map[channel] = link_names
+            self._channel_link_paths[channel] = link_paths
+
+        link_paths = self._channel_link_paths[channel]
+        matrices = _to_transform_matrices(message.position, message.quaternion)
+        for link_path, matrix in zip(link_paths, matrices):
+            self._meshcat.SetTransform(path=link_path, matrix=matrix)
+
+
+class _ChannelStatistics:
+    """Throughput and latency counters for one LCM channel in Meldis."""
+
+    def __init__(self):
+        # The number of messages received, and how many of those were
+        # discarded because a newer message arrived before the next update.
+        self.received = 0
+        self.dropped = 0
+        self.received_bytes = 0
+        # The number of messages passed to the handlers, along with the
+        # cumulative time spent decoding and handling them.
+        self.handled = 0
+        self.decode_seconds = 0.0
+        self.handler_seconds = 0.0
+        # The time from a message's receipt until its handlers finished.
+        self.total_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    def summary(self, channel):
+        """Returns a one-line human-readable summary."""
+        n = max(self.handled, 1)
+        return (
+            f"Meldis {channel}: {self.received} received,"
+            f" {self.dropped} dropped,"
+            f" {self.received_bytes / 1e6:.1f} MB,"
+            f" decode {1e3 * self.decode_seconds / n:.2f} ms/msg,"
+            f" handle {1e3 * self.handler_seconds / n:.2f} ms/msg,"
+            f" lag {1e3 * self.total_lag_seconds / n:.2f} ms avg"
+            f" / {1e3 * self.max_lag_seconds:.2f} ms max"
+        )
 
 
 class Meldis:
@@ -817,14 +1376,70 @@ class Meldis:
         meshcat_port: int | None = None,
         meshcat_params: MeshcatParams | None = None,
         environment_map: Path | None = None,
+        lcm_url: str | None = None,
+        max_update_hz: float = 40.0,
+        min_update_hz: float = 1.0,
+        mesh_checksum_cache: Path | None = None,
+        frame_triad_length: float = 0.25,
+        frame_triad_radius: float = 0.01,
+        decode_workers: int = 0,
+        point_cloud_max_points: dict[str, int] | None = None,
+        point_cloud_voxel_size: dict[str, float] | None = None,
+        stats_period: float | None = None,
+        stats_json: Path | None = None,
     ):
         """Constructs a new Meldis instance. The meshcat_host (when given)
         takes precedence over meshcat_params.host. The meshcat_post (when
         given) takes precedence over meshcat_params.port.
+
+        The lcm_url (when given) overrides the default LCM URL. Use "memq://"
+        with export_lcm_log().
+
+        The max_update_hz limits how often LCM-driven updates are posted to
+        MeshCat while messages are arriving. The min_update_hz sets how often
+        Meldis wakes up when no messages are arriving at all (to check the
+        sliders and the idle timeout).
+
+        If mesh_checksum_cache is given, the checksums of mesh files used to
+        detect duplicate load messages are persisted to (and reloaded from)
+        that JSON file, so that restarting Meldis does not rehash everything.
+
+        The frame_triad_length and frame_triad_radius set the size of the
+        triads drawn for the DRAKE_DRAW_FRAMES channels.
+
+        When decode_workers is positive, a pool of that many threads decodes
+        and pre-converts the messages on heavy channels (point clouds,
+        deformable meshes, and contact results) in the background; only the
+        Meshcat calls remain on the thread that runs serve_forever(). At most
+        one message per channel is decoded at a time.
+
+        The point_cloud_max_points and point_cloud_voxel_size limit the size of
+        the point clouds sent to Meshcat. Each is a dict keyed by LCM channel
+        name; the key "*" applies to all channels not otherwise listed.
+
+        When stats_period or stats_json is given, Meldis keeps per-channel
+        statistics (messages received and dropped, decode and handler time,
+        bytes received, and the lag from receipt to display). They are logged
+        every stats_period seconds (default 10) and, if stats_json is given,
+        also written to that file as JSON.
         """
+        if not max_update_hz > 0.0:
+            raise ValueError(
+                f"The max_update_hz ({max_update_hz}) must be positive"
+            )
+        if not 0.0 < min_update_hz <= max_update_hz:
+            raise ValueError(
+                f"The min_update_hz ({min_update_hz}) must be positive and no"
+                f" greater than max_update_hz ({max_update_hz})"
+            )
 
         # Bookkeeping for update throttling.
         self._last_update_time = time.time()
+        self._busy_update_period = 1.0 / max_update_hz
+        self._idle_update_period = 1.0 / min_update_hz
+
+        if mesh_checksum_cache is not None:
+            _FILE_DIGEST_CACHE.load_index(mesh_checksum_cache)
 
         # Bookkeeping for subscriptions, keyed by LCM channel name.
         self._message_types = {}
@@ -833,7 +1448,35 @@ class Meldis:
 
         self._poll_handlers = []
 
-        self._lcm = DrakeLcm()
+        # Bookkeeping for instrumentation (disabled when _stats is None).
+        self._stats = None
+        self._stats_period = stats_period
+        self._stats_json = Path(stats_json) if stats_json is not None else None
+        self._last_stats_report = time.time()
+        self._message_receipt_time = {}
+        if stats_period is not None or stats_json is not None:
+            self._stats = collections.defaultdict(_ChannelStatistics)
+            if self._stats_period is None:
+                self._stats_period = 10.0
+
+        # Bookkeeping for the decode workers, guarded by the _decode_lock and
+        # keyed by LCM channel name: the future of the decode that is running,
+        # the newest data waiting for that decode to finish, and the newest
+        # finished decode that has not yet been handled.
+        self._decode_pool = None
+        self._decode_lock = threading.RLock()
+        self._decode_running = {}
+        self._decode_waiting = {}
+        self._decode_finished = {}
+        if decode_workers > 0:
+            self._decode_pool = ThreadPoolExecutor(
+                max_workers=decode_workers, thread_name_prefix="meldis_decode"
+            )
+
+        if lcm_url is not None:
+            self._lcm = DrakeLcm(lcm_url=lcm_url)
+        else:
+            self._lcm = DrakeLcm()
         lcm_url = self._lcm.get_lcm_url()
         _logger.info(f"Meldis is listening for LCM messages at {lcm_url}")
 
@@ -849,6 +1492,10 @@ class Meldis:
         if environment_map is not None:
             self.meshcat.SetEnvironmentMap(environment_map)
 
+        # The applets draw via this wrapper so that export_lcm_log() can
+        # record what they draw.
+        self._recording_meshcat = _RecordingMeshcat(self.meshcat)
+
         def is_inertia_link(link_name):
             return "::InertiaVisualizer::" in link_name
 
@@ -856,7 +1503,7 @@ class Meldis:
             return not is_inertia_link(link_name)
 
         default_viewer = _ViewerApplet(
-            meshcat=self.meshcat,
+            meshcat=self._recording_meshcat,
             path="/DRAKE_VIEWER",
             alpha_slider_name="Viewer",
             should_accept_link=is_not_inertia_link,
@@ -873,13 +1520,14 @@ class Meldis:
         )
         self._subscribe(
             channel="DRAKE_VIEWER_DEFORMABLE",
-            message_type=lcmt_viewer_link_data,
-            handler=default_viewer.on_viewer_draw_deformable,
+            message_type=_ViewerLinkDataBuffer,
+            handler=default_viewer.show_viewer_draw_deformable,
+            converter=default_viewer.convert_viewer_draw_deformable,
         )
         self._poll(handler=default_viewer.on_poll)
 
         inertia_viewer = _ViewerApplet(
-            meshcat=self.meshcat,
+            meshcat=self._recording_meshcat,
             path="/Inertia Visualizer",
             alpha_slider_name="Inertia",
             should_accept_link=is_inertia_link,
@@ -899,7 +1547,7 @@ class Meldis:
         self._poll(handler=inertia_viewer.on_poll)
 
         illustration_viewer = _ViewerApplet(
-            meshcat=self.meshcat,
+            meshcat=self._recording_meshcat,
             path="/Visual Geometry",
             alpha_slider_name="Visual",
         )
@@ -915,13 +1563,14 @@ class Meldis:
         )
         self._subscribe(
             channel="DRAKE_VIEWER_DEFORMABLE_ILLUSTRATION",
-            message_type=lcmt_viewer_link_data,
-            handler=illustration_viewer.on_viewer_draw_deformable,
+            message_type=_ViewerLinkDataBuffer,
+            handler=illustration_viewer.show_viewer_draw_deformable,
+            converter=illustration_viewer.convert_viewer_draw_deformable,
         )
         self._poll(handler=illustration_viewer.on_poll)
 
         proximity_viewer = _ViewerApplet(
-            meshcat=self.meshcat,
+            meshcat=self._recording_meshcat,
             path="/Collision Geometry",
             alpha_slider_name="Collision",
             start_visible=False,
@@ -939,28 +1588,39 @@ class Meldis:
         )
         self._subscribe(
             channel="DRAKE_VIEWER_DEFORMABLE_PROXIMITY",
-            message_type=lcmt_viewer_link_data,
-            handler=proximity_viewer.on_viewer_draw_deformable,
+            message_type=_ViewerLinkDataBuffer,
+            handler=proximity_viewer.show_viewer_draw_deformable,
+            converter=proximity_viewer.convert_viewer_draw_deformable,
         )
         self._poll(handler=proximity_viewer.on_poll)
 
-        contact = _ContactApplet(meshcat=self.meshcat)
+        contact = _ContactApplet(meshcat=self._recording_meshcat)
         self._subscribe(
             channel="CONTACT_RESULTS",
             message_type=lcmt_contact_results_for_viz,
-            handler=contact.on_contact_results,
+            handler=contact.show_contact_results,
+            converter=contact.convert_contact_results,
         )
 
         # Subscribe to all the point-cloud-related channels.
-        point_cloud = _PointCloudApplet(meshcat=self.meshcat)
+        point_cloud = _PointCloudApplet(
+            meshcat=self._recording_meshcat,
+            max_points=point_cloud_max_points,
+            voxel_size=point_cloud_voxel_size,
+        )
         self._subscribe_multichannel(
             regex="DRAKE_POINT_CLOUD.*",
             message_type=lcmt_point_cloud,
-            handler=point_cloud.on_point_cloud,
+            handler=point_cloud.show_point_cloud,
+            converter=point_cloud.convert_point_cloud,
         )
 
         # Subscribe to all the frame display channels.
-        draw_frame = _DrawFrameApplet(meshcat=self.meshcat)
+        draw_frame = _DrawFrameApplet(
+            meshcat=self._recording_meshcat,
+            triad_length=frame_triad_length,
+            triad_radius=frame_triad_radius,
+        )
         self._subscribe_multichannel(
             regex="DRAKE_DRAW_FRAMES.*",
             message_type=lcmt_viewer_draw,
@@ -971,22 +1631,40 @@ class Meldis:
         self._last_poll = None
         self._last_active = None
 
-    def _subscribe(self, channel, message_type, handler):
+    def _subscribe(self, channel, message_type, handler, converter=None):
         """Subscribes the handler to the given channel, using message_type to
         pass in a decoded message object (not the raw bytes). The handler will
         only be called at some maximum frequency. Messages on the same channel
         that arrive too quickly will be discarded.
+
+        If a converter is given, the handler is passed `converter(message)`
+        instead of the message itself. The converter must not call into
+        Meshcat, because when decode workers are enabled it runs on a worker
+        thread (along with the message decoding).
         """
         # Record this channel's type and handler.
         assert self._message_types.get(channel, message_type) == message_type
         self._message_types[channel] = message_type
 
-        # A wrapper to discard `channel` information as it's not used in the
-        # actual handler.
+        # Wrappers to discard `channel` information as it's not used in the
+        # actual handler or converter.
         def _multi_handler(*, channel, message):
             handler(message)
 
-        self._message_handlers.setdefault(channel, []).append(_multi_handler)
+        _multi_converter = None
+        if converter is not None:
+
+            def _multi_converter(*, channel, message):
+                return converter(message)
+
+        # Only the first handler on a channel needs an LCM subscription; the
+        # others are served by the same one.
+        is_first_handler = channel not in self._message_handlers
+        self._message_handlers.setdefault(channel, []).append(
+            (_multi_converter, _multi_handler)
+        )
+        if not is_first_handler:
+            return
 
         # Subscribe using an internal function that implements "last one wins".
         # It's important to service the LCM queue as frequently as possible:
@@ -998,24 +1676,113 @@ class Meldis:
         # flooding it. The handler merely records the message data; we'll
         # pass it along to MeshCat using our `self._should_update()` timer.
         def _on_message(data):
-            self._message_pending_data[channel] = data
+            self._on_message(channel, data)
 
         self._lcm.Subscribe(channel=channel, handler=_on_message)
 
-    def _subscribe_multichannel(self, regex, message_type, handler):
+    def _subscribe_multichannel(
+        self, regex, message_type, handler, converter=None
+    ):
         """Subscribes the handler to a group of channels filtered by regex. How
         this function handles messages is the same as _subscribe() except that
-        the channel name is only known when invoking the callback.
+        the channel name is only known when invoking the callback (or the
+        converter, if any).
         """
 
+        def _multi_handler(*, channel, message):
+            handler(channel, message)
+
+        _multi_converter = None
+        if converter is not None:
+
+            def _multi_converter(*, channel, message):
+                return converter(channel, message)
+
         def _on_message(channel, data):
             if channel not in self._message_types:
                 self._message_types[channel] = message_type
-                self._message_handlers.setdefault(channel, []).append(handler)
-            self._message_pending_data[channel] = data
+                self._message_handlers.setdefault(channel, []).append(
+                    (_multi_converter, _multi_handler)
+                )
+            self._on_message(channel, data)
 
         self._lcm.SubscribeMultichannel(regex=regex, handler=_on_message)
 
+    def _on_message(self, channel, data):
+        """Records the given data as the newest message on the channel. When
+        decode workers are enabled and the channel has a converter, decoding
+        and conversion start immediately on a worker thread.
+        """
+        if self._stats is not None:
+            stats = self._stats[channel]
+            stats.received += 1
+            stats.received_bytes += len(data)
+            if channel in self._message_pending_data:
+                stats.dropped += 1
+            self._message_receipt_time[channel] = time.time()
+        if self._decode_pool is not None and any(
+            converter is not None
+            for converter, _ in self._message_handlers[channel]
+        ):
+            with self._decode_lock:
+                if channel in self._decode_running:
+                    # Only one decode per channel may run at a time, so that
+                    # a channel's converters never race with themselves. The
+                    # newest data waits for the running decode (last one
+                    # wins; older waiting data is moot).
+                    self._decode_waiting[channel] = data
+                else:
+                    self._submit_decode(channel, data)
+            data = _DECODING
+        self._message_pending_data[channel] = data
+
+    def _submit_decode(self, channel, data):
+        """Starts decoding the data on a worker thread. The caller must hold
+        the _decode_lock.
+        """
+        future = self._decode_pool.submit(
+            self._decode_and_convert, channel, data
+        )
+        self._decode_running[channel] = future
+        future.add_done_callback(functools.partial(self._on_decoded, channel))
+
+    def _on_decoded(self, channel, future):
+        """Records the finished decode of the given channel, and then starts
+        decoding the channel's waiting data (if any). This is called on the
+        worker thread that finished the decode.
+        """
+        with self._decode_lock:
+            del self._decode_running[channel]
+            self._decode_finished[channel] = future
+            data = self._decode_waiting.pop(channel, None)
+            if data is not None:
+                self._submit_decode(channel, data)
+
+    def _wait_for_decoding(self):
+        """Blocks until no decodes are running or waiting."""
+        while True:
+            with self._decode_lock:
+                futures = list(self._decode_running.values())
+            if not futures:
+                return
+            wait(futures)
+
+    def _decode_and_convert(self, channel, data):
+        """Decodes the data and returns a pair of the list of arguments to pass
+        to each of the channel's handlers, and the time spent (in seconds).
+        """
+        start = time.perf_counter()
+        message = self._message_types[channel].decode(data)
+        arguments = [
+            (
+                converter(channel=channel, message=message)
+                if converter is not None
+                else message
+            )
+            for converter, _ in self._message_handlers[channel]
+        ]
+        return (arguments, time.perf_counter() - start)
+
     def _poll(self, handler):
         self._poll_handlers.append(handler)
 
@@ -1025,14 +1792,40 @@ class Meldis:
 
     def _invoke_subscriptions(self):
         """Posts any unhandled messages to their handlers and clears the
-        collection of unhandled messages.
+        collection of unhandled messages. Messages still being decoded by a
+        worker thread remain pending until the next call, so that they don't
+        hold up the messages on other channels.
         """
+        still_pending = {}
         for channel, data in self._message_pending_data.items():
-            message = self._message_types[channel].decode(data)
-            for function in self._message_handlers[channel]:
-                function(channel=channel, message=message)
+            if data is _DECODING:
+                with self._decode_lock:
+                    future = self._decode_finished.pop(channel, None)
+                    if channel in self._decode_running:
+                        still_pending[channel] = data
+                if future is None:
+                    continue
+                arguments, decode_seconds = future.result()
+            else:
+                arguments, decode_seconds = self._decode_and_convert(
+                    channel, data
+                )
+            start = time.perf_counter()
+            for (_, function), argument in zip(
+                self._message_handlers[channel], arguments
+            ):
+                function(channel=channel, message=argument)
+            if self._stats is not None:
+                stats = self._stats[channel]
+                stats.handled += 1
+                stats.decode_seconds += decode_seconds
+                stats.handler_seconds += time.perf_counter() - start
+                lag = time.time() - self._message_receipt_time[channel]
+                stats.total_lag_seconds += lag
+                stats.max_lag_seconds = max(stats.max_lag_seconds, lag)
 
         self._message_pending_data.clear()
+        self._message_pending_data.update(still_pending)
 
     def serve_forever(self, *, idle_timeout=None):
         """Runs indefinitely, forwarding LCM => MeshCat messages.
@@ -1042,19 +1835,128 @@ class Meldis:
         connections.
         """
         while True:
-            self._lcm.HandleSubscriptions(timeout_millis=1000)
+            # Block on the LCM socket until either a message arrives or our
+            # next update is due, whichever comes first.
+            self._lcm.HandleSubscriptions(
+                timeout_millis=self._wait_timeout_millis()
+            )
             if not self._should_update():
                 continue
             self._invoke_subscriptions()
             self._invoke_poll()
             self.meshcat.Flush()
+            self._report_stats()
             self._check_for_shutdown(idle_timeout=idle_timeout)
 
+    def export_lcm_log(
+        self,
+        *,
+        log_filename: Path,
+        html_filename: Path,
+        frames_per_second: float = 32.0,
+    ):
+        """Replays the LCM log at log_filename as fast as possible (instead of
+        in realtime), records the visualization into a MeshcatAnimation, and
+        writes it to html_filename as a standalone HTML page.
+
+        The log is decimated to frames_per_second (using the log's receive
+        timestamps): for each animation frame, only the newest message on each
+        channel is displayed. Poses, properties (e.g., visibility), and contact
+        results are animated; other geometry (e.g., deformable meshes and
+        point clouds) is shown as of the end of the log.
+
+        This Meldis must have been constructed with lcm_url="memq://", so that
+        the replayed messages are not mixed with (or sent to) live traffic.
+        """
+        if not self._lcm.get_lcm_url().startswith("memq://"):
+            raise ValueError(
+                "Meldis.export_lcm_log() requires lcm_url='memq://', not"
+                f" '{self._lcm.get_lcm_url()}'"
+            )
+        if not frames_per_second > 0.0:
+            raise ValueError(
+                f"The frames_per_second ({frames_per_second}) must be positive"
+            )
+        log = DrakeLcmLog(file_name=str(log_filename), is_write=False)
+        log.SubscribeAllChannels(
+            handler=lambda channel, data: self._lcm.Publish(
+                channel=channel, buffer=data
+            )
+        )
+        recording = self._recording_meshcat
+        recording.start_recording(frames_per_second)
+        start_time = log.GetNextMessageTime()
+        frame = 0
+        while True:
+            log_time = log.GetNextMessageTime()
+            next_frame = None
+            if math.isfinite(log_time):
+                next_frame = math.floor(
+                    (log_time - start_time) * frames_per_second
+                )
+            if next_frame != frame:
+                # Display the newest messages of the frame that just ended. We
+                # record at mid-frame so that round-off can't shift the frame.
+                recording.time = (frame + 0.5) / frames_per_second
+                self._wait_for_decoding()
+                self._invoke_subscriptions()
+                frame = next_frame
+            if next_frame is None:
+                break
+            log.DispatchMessageAndAdvanceLog(current_time=log_time)
+            self._lcm.HandleSubscriptions(timeout_millis=0)
+        recording.stop_recording()
+        self.meshcat.PublishRecording()
+        Path(html_filename).write_text(
+            self.meshcat.StaticHtml(), encoding="utf-8"
+        )
+        _logger.info(f"Meldis exported {log_filename} to {html_filename}")
+
+    def _report_stats(self, *, force=False):
+        """When instrumentation is enabled, logs the per-channel statistics
+        (and writes them to the stats_json file, if any) once per stats_period.
+        """
+        if self._stats is None:
+            return
+        now = time.time()
+        if not force and now < self._last_stats_report + self._stats_period:
+            return
+        self._last_stats_report = now
+        for channel, stats in sorted(self._stats.items()):
+            _logger.info(stats.summary(channel))
+        if self._stats_json is not None:
+            document = {
+                channel: stats.to_dict()
+                for channel, stats in sorted(self._stats.items())
+            }
+            temp_path = self._stats_json.with_name(
+                self._stats_json.name + ".tmp"
+            )
+            temp_path.write_text(json.dumps(document, indent=2) + "\n")
+            temp_path.replace(self._stats_json)
+
+    def _update_period(self):
+        """Returns the update period that applies right now: when messages
+        are pending we update at max_update_hz, otherwise at min_update_hz.
+        """
+        if self._message_pending_data:
+            return self._busy_update_period
+        return self._idle_update_period
+
+    def _wait_timeout_millis(self):
+        """Returns how long we may block while waiting for LCM messages
+        before the next update becomes due.
+        """
+        elapsed = time.time() - self._last_update_time
+        remaining = self._update_period() - elapsed
+        return max(0, math.ceil(remaining * 1000))
+
     def _should_update(self):
-        """Posts LCM-driven updates to MeshCat no faster than 40 Hz."""
+        """Posts LCM-driven updates to MeshCat no faster than max_update_hz,
+        and polls no slower than min_update_hz when idle.
+        """
         now = time.time()
-        update_period = 0.025  # 40 Hz
-        remaining = update_period - (now - self._last_update_time)
+        remaining = self._update_period() - (now - self._last_update_time)
         if remaining > 0.0:
             return False
         else:
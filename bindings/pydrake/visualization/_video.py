@@ -1,4 +1,7 @@
 import copy
+import os
+import queue
+import threading
 
 import numpy as np
 
@@ -45,6 +48,16 @@ class VideoWriter(LeafSystem):
     either "PIL" (aka Pillow) or "cv2". PIL generally only supports image
     formats (e.g., gif, apng, webp) while cv2 also supports movies (e.g., mp4).
 
+    Images are encoded by a background thread, which is fed by a bounded queue
+    of frames. For cv2 and for PIL's gif output, the frames are encoded as
+    they arrive; when the queue is full, the frame_drop_policy chooses between
+    waiting for the encoder to catch up and dropping frames. Either way, the
+    memory used by frames waiting to be encoded stays bounded (although PIL
+    still keeps the encoded gif frames in memory until the file is finished).
+    PIL's other formats (e.g., apng or webp) need all of the frames at once,
+    so every frame is kept in memory until Save(); for those formats the
+    queue never fills, and only the "block" frame_drop_policy is allowed.
+
     Warning:
         Once all images have been published, you must call
         ``video_writer.Save()`` to finish writing to the video file.
@@ -56,7 +69,16 @@ class VideoWriter(LeafSystem):
         depends on either one.
     """
 
-    def __init__(self, *, filename, fps=16.0, backend="PIL", fourcc=None):
+    def __init__(
+        self,
+        *,
+        filename,
+        fps=16.0,
+        backend="PIL",
+        fourcc=None,
+        queue_size=8,
+        frame_drop_policy="block",
+    ):
         """Constructs a VideoWriter system.
 
         In many cases, the AddToBuilder() or ConnectRgbdSensor() methods might
@@ -70,28 +92,57 @@ class VideoWriter(LeafSystem):
             fourcc: when using the cv2 backend, which encoder to use;
                 good choices are "mp4v" or "avc1"; defaults to "mp4v";
                 refer to the OpenCV documentation for details.
+            queue_size: the maximum number of frames waiting to be encoded.
+            frame_drop_policy: what to do with a new frame when the queue is
+                full: "block" waits for the encoder, so no frames are lost;
+                "drop_newest" discards the new frame; "drop_oldest" discards
+                the oldest frame in the queue. Dropping frames keeps a
+                simulation from stalling on the encoder, but the video then
+                plays back faster than the simulation. The PIL backend only
+                supports dropping frames for gif output.
         """
         LeafSystem.__init__(self)
+        if queue_size < 1:
+            raise ValueError(f"The queue_size={queue_size} must be positive")
+        if frame_drop_policy not in ("block", "drop_newest", "drop_oldest"):
+            raise ValueError(f"Invalid frame_drop_policy={frame_drop_policy!r}")
         self._filename = filename
         self._fps = fps
+        self._queue_size = queue_size
+        self._frame_drop_policy = frame_drop_policy
+        self._num_dropped_frames = 0
+        self._queue = None
+        self._encoder = None
+        self._encoder_error = None
         self._input = self.DeclareAbstractInputPort(
             name="color_image", model_value=Value(ImageRgba8U())
         )
         # TODO(jwnimmer-tri) Support forced triggers as well (so users can
         # manually record videos of prescribed motion).
         self.DeclarePeriodicPublishEvent(1.0 / fps, 0.0, self._publish)
-        self._cv2_writer = None
-        self._pil_images = None
         if backend == "PIL":
             from PIL import Image
 
             self._backend = Image
-            self._write = self._write_pil
+            self._prepare = self._prepare_pil
+            self._encode = self._encode_pil
+            # Only the gif encoder makes a single pass over the images, so it
+            # is the only format that can be encoded as the frames arrive.
+            extension = os.path.splitext(filename)[1].lower()
+            self._pil_streaming = (
+                Image.registered_extensions().get(extension) == "GIF"
+            )
+            if not self._pil_streaming and frame_drop_policy != "block":
+                raise ValueError(
+                    f"The frame_drop_policy={frame_drop_policy!r} is only"
+                    " supported for gif output when using the PIL backend"
+                )
         elif backend == "cv2":
             import cv2
 
             self._backend = cv2
-            self._write = self._write_cv2
+            self._prepare = self._prepare_cv2
+            self._encode = self._encode_cv2
             self._fourcc = fourcc or "mp4v"
             if len(self._fourcc) != 4:
                 raise ValueError(f"The fourcc={fourcc!r} must be 4 characters")
@@ -113,6 +164,8 @@ class VideoWriter(LeafSystem):
         kinds=None,
         backend="PIL",
         fourcc=None,
+        queue_size=8,
+        frame_drop_policy="block",
     ):
         """Adds a RgbdSensor and VideoWriter system to the given builder, using
         a world-fixed pose. Returns the VideoWriter system.
@@ -137,6 +190,10 @@ class VideoWriter(LeafSystem):
             fourcc: when using the cv2 backend, which encoder to use;
                 good choices are "mp4v" or "avc1"; defaults to "mp4v"
                 refer to the OpenCV documentation for details.
+            queue_size: the maximum number of frames waiting to be encoded.
+            frame_drop_policy: what to do with a new frame when the queue is
+                full: "block", "drop_newest", or "drop_oldest"; refer to the
+                constructor for details.
 
         Warning:
             Once all images have been published, you must call
@@ -152,7 +209,12 @@ class VideoWriter(LeafSystem):
             far=far,
         )
         writer = VideoWriter(
-            filename=filename, fps=fps, backend=backend, fourcc=fourcc
+            filename=filename,
+            fps=fps,
+            backend=backend,
+            fourcc=fourcc,
+            queue_size=queue_size,
+            frame_drop_policy=frame_drop_policy,
         )
         builder.AddSystem(writer)
         writer.ConnectRgbdSensor(builder=builder, sensor=sensor, kinds=kinds)
@@ -234,55 +296,146 @@ class VideoWriter(LeafSystem):
         builder.Connect(image_source, self.get_input_port())
 
     def Save(self):
-        """Flushes all images to the video file and closes the file.
+        """Waits for all images to be encoded, and then finishes writing the
+        video file and closes it.
 
         Warning:
             Continuing a simulation after calling Save() will begin to
             overwrite the prior video with a new one.
         """
-        # For PIL.
-        if self._pil_images is not None:
-            images = self._pil_images
-            frame_millis = int(1000.0 / self._fps)
-            images[0].save(
-                self._filename,
-                save_all=True,
-                append_images=images[1:],
-                optimize=True,
-                duration=frame_millis,
-            )
-        self._pil_images = None
-        # For cv2.
-        if self._cv2_writer is not None:
-            self._cv2_writer.release()
-        self._cv2_writer = None
+        if self._encoder is not None:
+            # The end-of-video marker is never dropped.
+            self._queue.put(None)
+            self._encoder.join()
+            self._encoder = None
+            self._queue = None
+        self._raise_encoder_error()
+
+    def num_dropped_frames(self):
+        """Returns the number of frames that were discarded (per the
+        frame_drop_policy) because the encoder fell behind.
+        """
+        return self._num_dropped_frames
 
     def _publish(self, context):
         """The framework event handler that saves one input image."""
         color = self._input.Eval(context)
-        # Call the backend-specific function that was set by our constructor.
         self._write(rgba=color.data)
 
-    def _write_pil(self, *, rgba):
-        """Saves one input image (when we're configured to use PIL)."""
+    def _write(self, *, rgba):
+        """Queues one input image for the encoder thread, which is started
+        upon the first image of each video.
+        """
+        self._raise_encoder_error()
+        if self._encoder is None:
+            self._queue = queue.Queue(maxsize=self._queue_size)
+            self._encoder = threading.Thread(
+                target=self._run_encoder,
+                args=(self._queue,),
+                name="VideoWriter",
+                daemon=True,
+            )
+            self._encoder.start()
+        if self._queue.full():
+            # Only this thread adds frames, so after a frame is removed here
+            # the put() below will not block.
+            if self._frame_drop_policy == "drop_newest":
+                self._num_dropped_frames += 1
+                return
+            if self._frame_drop_policy == "drop_oldest":
+                try:
+                    self._queue.get_nowait()
+                    self._num_dropped_frames += 1
+                except queue.Empty:
+                    pass
+        # Call the backend-specific function that was set by our constructor.
+        self._queue.put(self._prepare(rgba=rgba))
+
+    def _raise_encoder_error(self):
+        """Re-raises (once) any exception from the encoder thread."""
+        error = self._encoder_error
+        self._encoder_error = None
+        if error is not None:
+            raise error
+
+    def _run_encoder(self, frame_queue):
+        """The encoder thread's main loop, which encodes the frames from the
+        given queue until the end-of-video marker.
+        """
+
+        def frames():
+            while (frame := frame_queue.get()) is not None:
+                yield frame
+
+        remaining = frames()
+        try:
+            # Call the backend-specific function that was set by our
+            # constructor.
+            self._encode(remaining)
+        except Exception as e:
+            self._encoder_error = e
+        # In case of an error, keep draining the queue so that _write() never
+        # blocks forever.
+        for _ in remaining:
+            pass
+
+    def _prepare_pil(self, *, rgba):
+        """Returns the frame to queue for one input image (when we're
+        configured to use PIL).
+        """
         # Grab the `from PIL import Image` that we stored at construction-time.
         Image = self._backend
-        image = Image.fromarray(copy.copy(rgba), mode="RGBA")
-        if self._pil_images is None:
-            self._pil_images = [image]
+        # Drake's output ports reuse their image memory from one evaluation to
+        # the next, so the frame needs its own copy of the pixels.
+        return Image.fromarray(copy.copy(rgba), mode="RGBA")
+
+    def _encode_pil(self, images):
+        """Encodes the given images (when we're configured to use PIL)."""
+        first = next(images, None)
+        if first is None:
+            return
+        frame_millis = int(1000.0 / self._fps)
+        if self._pil_streaming:
+            # The gif encoder makes a single pass over the append_images, so
+            # it can pull the images from the queue as they arrive.
+            append_images = images
         else:
-            self._pil_images.append(image)
+            # Other encoders (e.g., apng or webp) iterate over append_images
+            # more than once, or copy them all into a list, so they need all
+            # of the images up front.
+            append_images = list(images)
+        first.save(
+            self._filename,
+            save_all=True,
+            append_images=append_images,
+            optimize=True,
+            duration=frame_millis,
+        )
 
-    def _write_cv2(self, *, rgba):
-        """Saves one input image (when we're configured to use cv2)."""
+    def _prepare_cv2(self, *, rgba):
+        """Returns the frame to queue for one input image (when we're
+        configured to use cv2).
+        """
         # Grab `import cv2` that we stored at construction-time.
         cv2 = self._backend
-        # Open the output file upon the first publish event.
-        if self._cv2_writer is None:
-            fourcc = cv2.VideoWriter.fourcc(*self._fourcc)
-            (height, width, _) = rgba.shape
-            self._cv2_writer = cv2.VideoWriter(
-                self._filename, fourcc, self._fps, (width, height)
-            )
-        bgra = cv2.cvtColor(rgba, cv2.COLOR_RGB2BGR)
-        self._cv2_writer.write(bgra)
+        # The color conversion writes a new array, so it doubles as the copy
+        # of the input image memory (which Drake reuses for the next image).
+        return cv2.cvtColor(rgba, cv2.COLOR_RGB2BGR)
+
+    def _encode_cv2(self, frames):
+        """Encodes the given frames (when we're configured to use cv2)."""
+        cv2 = self._backend
+        writer = None
+        try:
+            for bgr in frames:
+                # Open the output file upon the first frame.
+                if writer is None:
+                    fourcc = cv2.VideoWriter.fourcc(*self._fourcc)
+                    (height, width, _) = bgr.shape
+                    writer = cv2.VideoWriter(
+                        self._filename, fourcc, self._fps, (width, height)
+                    )
+                writer.write(bgr)
+        finally:
+            if writer is not None:
+                writer.release()
@@ -20,6 +20,11 @@ In many cases, passing ``-w`` (i.e., ``--open-window``) to the program will be
 convenient::
 
   bazel run //tools:meldis -- -w &
+
+To turn a recorded LCM log into a standalone HTML animation (without replaying
+it in realtime), pass ``--export-lcm-log`` and ``--export-html``::
+
+  bazel run //tools:meldis -- --export-lcm-log=sim.lcmlog --export-html=sim.html
 """
 
 import argparse
@@ -44,6 +49,19 @@ def _available_browsers():
         return []
 
 
+def _per_channel(value_type):
+    """Returns an argparse type function that parses either ``VALUE`` or
+    ``CHANNEL=VALUE`` into a ``(channel, value)`` pair, where the channel is
+    "*" (meaning all channels) when omitted.
+    """
+
+    def parse(text):
+        channel, _, value = text.rpartition("=")
+        return (channel or "*", value_type(value))
+
+    return parse
+
+
 def _main(args=None):
     # Make cwd be what the user expected, not the runfiles tree.
     if "BUILD_WORKING_DIRECTORY" in os.environ:
@@ -117,7 +135,121 @@ def _main(args=None):
         "It must be an image type normally used by your browser (e.g., "
         ".jpg, .png, etc.). HDR images are not supported yet.",
     )
+    parser.add_argument(
+        "--max-update-hz",
+        metavar="HZ",
+        type=float,
+        default=40.0,
+        help="The maximum rate at which LCM messages are forwarded to MeshCat."
+        " Messages that arrive faster than this are coalesced (the last one on"
+        " each channel wins).",
+    )
+    parser.add_argument(
+        "--min-update-hz",
+        metavar="HZ",
+        type=float,
+        default=1.0,
+        help="The rate at which Meldis wakes up to poll its sliders and check"
+        " the idle timeout when no LCM messages are arriving.",
+    )
+    parser.add_argument(
+        "--mesh-checksum-cache",
+        metavar="PATH",
+        help="Filesystem path to a JSON file used to persist the checksums of"
+        " mesh files across restarts. Meldis uses these checksums to skip"
+        " reloading a scene that has not changed.",
+    )
+    parser.add_argument(
+        "--frame-triad-length",
+        metavar="METERS",
+        type=float,
+        default=0.25,
+        help="The length of the triads drawn for DRAKE_DRAW_FRAMES messages.",
+    )
+    parser.add_argument(
+        "--frame-triad-radius",
+        metavar="METERS",
+        type=float,
+        default=0.01,
+        help="The radius of the triads drawn for DRAKE_DRAW_FRAMES messages.",
+    )
+    parser.add_argument(
+        "--decode-workers",
+        metavar="NUM",
+        type=int,
+        default=0,
+        help="The number of background threads used to decode (and convert)"
+        " large messages such as point clouds, deformable meshes, and contact"
+        " results. By default (0), all decoding happens on the main thread.",
+    )
+    parser.add_argument(
+        "--point-cloud-max-points",
+        metavar="[CHANNEL=]NUM",
+        type=_per_channel(int),
+        action="append",
+        default=[],
+        help="The maximum number of points to send to MeshCat per point cloud"
+        " message; larger clouds are uniformly subsampled. When CHANNEL is"
+        " omitted, applies to all DRAKE_POINT_CLOUD* channels. May be given"
+        " more than once.",
+    )
+    parser.add_argument(
+        "--point-cloud-voxel-size",
+        metavar="[CHANNEL=]METERS",
+        type=_per_channel(float),
+        action="append",
+        default=[],
+        help="When given, point clouds are voxel-downsampled to this"
+        " resolution before being sent to MeshCat. When CHANNEL is omitted,"
+        " applies to all DRAKE_POINT_CLOUD* channels. May be given more than"
+        " once.",
+    )
+    parser.add_argument(
+        "--stats-period",
+        metavar="TIME",
+        type=float,
+        help="When given, Meldis logs per-channel throughput and latency"
+        " statistics every this many seconds.",
+    )
+    parser.add_argument(
+        "--stats-json",
+        metavar="PATH",
+        help="When given, Meldis writes per-channel throughput and latency"
+        " statistics to this file (as JSON) every --stats-period seconds"
+        " (default 10).",
+    )
+    parser.add_argument(
+        "--export-lcm-log",
+        metavar="PATH",
+        help="When given, instead of serving live LCM traffic, Meldis replays"
+        " this LCM log file as fast as possible and writes the result as an"
+        " animation to the --export-html file.",
+    )
+    parser.add_argument(
+        "--export-html",
+        metavar="PATH",
+        help="The output HTML file for --export-lcm-log.",
+    )
+    parser.add_argument(
+        "--export-fps",
+        metavar="HZ",
+        type=float,
+        default=32.0,
+        help="The frame rate of the animation written by --export-lcm-log;"
+        " the log is decimated to this rate.",
+    )
     args = parser.parse_args(args)
+    if (args.export_lcm_log is None) != (args.export_html is None):
+        parser.error(
+            "The --export-lcm-log and --export-html must be given together."
+        )
+    if not args.export_fps > 0.0:
+        parser.error("The --export-fps must be positive.")
+    if not 0.0 < args.min_update_hz <= args.max_update_hz:
+        parser.error(
+            "The --min-update-hz must be positive and no greater than"
+            " --max-update-hz."
+        )
     meshcat_params = None
     if args.meshcat_params is not None:
         meshcat_params = _yaml_load_typed(
@@ -128,7 +260,25 @@ def _main(args=None):
         meshcat_port=args.port,
         meshcat_params=meshcat_params,
         environment_map=args.environment_map,
+        lcm_url="memq://" if args.export_lcm_log is not None else None,
+        max_update_hz=args.max_update_hz,
+        min_update_hz=args.min_update_hz,
+        mesh_checksum_cache=args.mesh_checksum_cache,
+        frame_triad_length=args.frame_triad_length,
+        frame_triad_radius=args.frame_triad_radius,
+        decode_workers=args.decode_workers,
+        point_cloud_max_points=dict(args.point_cloud_max_points),
+        point_cloud_voxel_size=dict(args.point_cloud_voxel_size),
+        stats_period=args.stats_period,
+        stats_json=args.stats_json,
     )
+    if args.export_lcm_log is not None:
+        meldis.export_lcm_log(
+            log_filename=args.export_lcm_log,
+            html_filename=args.export_html,
+            frames_per_second=args.export_fps,
+        )
+        return
     if args.browser is not None and args.browser_new is None:
         args.browser_new = 1
     if args.browser_new is not None:
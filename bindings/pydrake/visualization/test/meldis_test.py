@@ -18,6 +18,7 @@ import json
 import os
 from pathlib import Path
 import tempfile
+import time
 import unittest
 
 import numpy as np
@@ -44,6 +45,7 @@ from pydrake.geometry import (
 )
 from pydrake.lcm import (
     DrakeLcm,
+    DrakeLcmLog,
 )
 from pydrake.math import (
     RigidTransform,
@@ -188,6 +190,129 @@ class TestMeldis(unittest.TestCase):
         self.assertEqual(meshcat.HasPath("/DRAKE_VIEWER"), True)
         self.assertEqual(meshcat.HasPath(link_path), True)
 
+    def test_viewer_applet_draw_table(self):
+        """Checks the precomputed link table and vectorized poses used by
+        _ViewerApplet.on_viewer_draw.
+        """
+        meshcat = mut.Meldis().meshcat
+        dut = mut._meldis._ViewerApplet(
+            meshcat=meshcat,
+            path="/DRAW_TABLE",
+            alpha_slider_name="test",
+            should_accept_link=lambda name: "hidden" not in name,
+        )
+
+        def get_matrix(path):
+            # This uses private API for testing.
+            packed = meshcat._GetPackedTransform(path)
+            matrix = umsgpack.unpackb(packed)["matrix"]
+            return np.array(matrix).reshape((4, 4), order="F")
+
+        message = lcmt_viewer_draw()
+        message.num_links = 3
+        message.link_name = ["base", "hidden", "model::arm"]
+        message.robot_num = [1, 1, 2]
+        message.position = [[0.1, 0.2, 0.3], [1.0, 1.0, 1.0], [-1.0, 0.5, 2.0]]
+        arm_quaternion = np.array([1.0, 2.0, -0.5, 3.0])
+        arm_quaternion /= np.linalg.norm(arm_quaternion)
+        message.quaternion = [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            arm_quaternion.tolist(),
+        ]
+        dut.on_viewer_draw(message)
+
+        # The poses match the per-link conversion, and only the accepted links
+        # are drawn.
+        paths = ["/DRAW_TABLE/1/base", "/DRAW_TABLE/2/model/arm"]
+        self.assertEqual(dut._draw_table_paths, paths)
+        np.testing.assert_equal(dut._draw_table_indices, [0, 2])
+        for path, i in zip(paths, (0, 2)):
+            expected = mut._meldis._to_pose(
+                message.position[i], message.quaternion[i]
+            ).GetAsMatrix4()
+            np.testing.assert_allclose(get_matrix(path), expected, atol=1e-14)
+        self.assertFalse(meshcat.HasPath("/DRAW_TABLE/1/hidden"))
+
+        # When the links are unchanged, the table is reused.
+        table_paths = dut._draw_table_paths
+        message.position[0] = [0.5, 0.5, 0.5]
+        dut.on_viewer_draw(message)
+        self.assertIs(dut._draw_table_paths, table_paths)
+        np.testing.assert_allclose(
+            get_matrix(paths[0])[:3, 3], [0.5, 0.5, 0.5], atol=1e-14
+        )
+
+        # When the link names or their order change, the table is rebuilt.
+        message.link_name = ["model::arm", "hidden", "base"]
+        message.robot_num = [2, 1, 1]
+        dut.on_viewer_draw(message)
+        self.assertIsNot(dut._draw_table_paths, table_paths)
+        self.assertEqual(dut._draw_table_paths, list(reversed(paths)))
+        np.testing.assert_allclose(
+            get_matrix("/DRAW_TABLE/2/model/arm")[:3, 3],
+            [0.5, 0.5, 0.5],
+            atol=1e-14,
+        )
+        message.link_name = ["model::arm", "hidden", "other"]
+        dut.on_viewer_draw(message)
+        self.assertEqual(
+            dut._draw_table_paths,
+            ["/DRAW_TABLE/2/model/arm", "/DRAW_TABLE/1/other"],
+        )
+
+    def test_export_lcm_log(self):
+        """Checks that an LCM log can be exported as a static animation."""
+        test_tmpdir = Path(os.environ["TEST_TMPDIR"])
+        log_filename = test_tmpdir / "export_test.lcmlog"
+        html_filename = test_tmpdir / "export_test.html"
+
+        # Log a few load + draw messages.
+        writer = DrakeLcmLog(file_name=str(log_filename), is_write=True)
+        diagram = self._make_diagram(
+            resource="drake/multibody/benchmarks/acrobot/acrobot.sdf",
+            visualizer_params=DrakeVisualizerParams(),
+            lcm=writer,
+        )
+        context = diagram.CreateDefaultContext()
+        for t in (0.0, 0.5, 1.0):
+            context.SetTime(t)
+            diagram.ForcedPublish(context)
+        del context, diagram, writer
+
+        # Export requires an in-memory LCM.
+        with self.assertRaisesRegex(ValueError, "memq"):
+            mut.Meldis().export_lcm_log(
+                log_filename=log_filename, html_filename=html_filename
+            )
+
+        dut = mut.Meldis(lcm_url="memq://")
+        dut.export_lcm_log(
+            log_filename=log_filename,
+            html_filename=html_filename,
+            frames_per_second=10.0,
+        )
+        link_path = "/DRAKE_VIEWER/2/plant/acrobot/Link2/0"
+        self.assertTrue(dut.meshcat.HasPath(link_path))
+        self.assertGreater(len(html_filename.read_text()), 0)
+
+        # The applets draw directly into Meshcat again after exporting.
+        self.assertIsNone(dut._recording_meshcat.time)
+        self.assertNotIn("SetTransform", vars(dut._recording_meshcat))
+
+    def test_to_transform_matrices(self):
+        """Checks the vectorized pose conversion against _to_pose."""
+        positions = np.random.uniform(-1, 1, (5, 3))
+        quaternions = np.random.uniform(-1, 1, (5, 4))
+        quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+        actual = mut._meldis._to_transform_matrices(positions, quaternions)
+        self.assertEqual(actual.shape, (5, 4, 4))
+        for i in range(5):
+            expected = mut._meldis._to_pose(positions[i], quaternions[i])
+            np.testing.assert_allclose(
+                actual[i], expected.GetAsMatrix4(), atol=1e-14
+            )
+
     def _check_viewer_applet_on_model(self, resource):
         """Checks that _ViewerApplet doesn't crash on the given model file."""
         dut = mut.Meldis()
@@ -529,6 +654,71 @@ class TestMeldis(unittest.TestCase):
         self.assertNotEqual(dut(message), empty_hash)
         self.assertEqual(dut(message), mesh_hash_2)
 
+    def test_file_digest_cache(self):
+        """Checks that _FileDigestCache only re-reads files that changed, and
+        that its index can be persisted across instances.
+        """
+        test_tmpdir = Path(os.environ["TEST_TMPDIR"])
+        obj_filename = test_tmpdir / "digest_cache_test.obj"
+        index_filename = test_tmpdir / "digest_cache_test.json"
+
+        def write_old(content):
+            # Backdate the mtime so that the entry is not considered racy.
+            obj_filename.write_text(content)
+            os.utime(obj_filename, (1e9, 1e9))
+
+        def parse(content):
+            return content.decode().split()
+
+        def no_parse(content):
+            raise RuntimeError("The file should not have been re-read")
+
+        dut = mut._meldis._FileDigestCache()
+        self.assertIsNone(dut.read(test_tmpdir / "no-such-file"))
+
+        # The first read parses the file; the second read is a cache hit.
+        write_old("foo bar")
+        digest_1, references = dut.read(obj_filename, parse)
+        self.assertEqual(references, ["foo", "bar"])
+        self.assertEqual(dut.read(obj_filename, no_parse)[0], digest_1)
+
+        # A change to the file is noticed.
+        write_old("foo bar baz")
+        digest_2, references = dut.read(obj_filename, parse)
+        self.assertNotEqual(digest_2, digest_1)
+        self.assertEqual(references, ["foo", "bar", "baz"])
+
+        # A freshly-modified file is never cached.
+        obj_filename.write_text("quux")
+        dut.read(obj_filename, parse)
+        with self.assertRaisesRegex(RuntimeError, "re-read"):
+            dut.read(obj_filename, no_parse)
+
+        # The persisted index is reused by a new cache.
+        write_old("foo bar baz")
+        dut.load_index(index_filename)
+        dut.read(obj_filename, parse)
+        dut.save_index()
+        self.assertTrue(index_filename.exists())
+        restored = mut._meldis._FileDigestCache()
+        restored.load_index(index_filename)
+        self.assertEqual(restored.read(obj_filename, no_parse)[0], digest_2)
+
+        # A malformed index is ignored (as if it were missing).
+        for malformed in (
+            "not json",
+            "[]",
+            "42",
+            '{"foo": "bar"}',
+            '{"foo": [[1, 2], "digest", null]}',
+            '{"foo": [[1, 2, 3], 4, null]}',
+            '{"foo": [[1, 2, 3], "digest", [5]]}',
+        ):
+            index_filename.write_text(malformed)
+            ignored = mut._meldis._FileDigestCache()
+            ignored.load_index(index_filename)
+            self.assertEqual(ignored._entries, {})
+
     def test_viewer_applet_alpha_slider(self):
         # Create the device under test.
         dut = mut.Meldis()
@@ -806,6 +996,20 @@ Kd 1 1 0
         self.assertEqual(meshcat.HasPath(hydro_path), True)
         self.assertEqual(meshcat.HasPath(hydro_path2), True)
 
+    def test_contact_applet_convert_faces(self):
+        """Checks the fan triangulation of hydroelastic polygons."""
+        dut = mut._meldis._ContactApplet.convert_faces
+        self.assertEqual(dut([]).shape, (3, 0))
+        # All triangles.
+        np.testing.assert_equal(
+            dut([3, 0, 1, 2, 3, 2, 1, 3]), [[0, 2], [1, 1], [2, 3]]
+        )
+        # A quad followed by a triangle.
+        np.testing.assert_equal(
+            dut([4, 0, 1, 2, 3, 3, 4, 5, 6]),
+            [[0, 0, 4], [1, 2, 5], [2, 3, 6]],
+        )
+
     def test_deformable(self):
         """Checks that _ViewerApplet doesn't crash for deformable geometries
         in DRAKE_VIEWER_DEFORMABLE(_{GEOMETRY_ROLE}) channel.
@@ -877,6 +1081,56 @@ Kd 1 1 0
         self.assertEqual(dut.meshcat.HasPath(meshcat_proximity), True)
         self.assertEqual(dut.meshcat.HasPath(meshcat_illustration), True)
 
+        # The faces are only decoded once per geometry, and an unchanged mesh
+        # is not re-sent.
+        applet = mut._meldis._ViewerApplet(
+            meshcat=dut.meshcat, path="/DEFORMABLE", alpha_slider_name="test"
+        )
+        converted = applet.convert_viewer_draw_deformable(message)
+        ((geom_path, vertices, faces, _, _),) = converted[1]
+        np.testing.assert_equal(faces[:, 0], [0, 2, 1])
+        np.testing.assert_equal(vertices[:, 1], [1.0, 0.0, 0.0])
+        applet.show_viewer_draw_deformable(converted)
+        self.assertTrue(dut.meshcat.HasPath(geom_path))
+        # Delete the mesh behind the applet's back to detect a re-send.
+        dut.meshcat.Delete(geom_path)
+        converted = applet.convert_viewer_draw_deformable(message)
+        self.assertIs(converted[1][0][2], faces)
+        applet.show_viewer_draw_deformable(converted)
+        self.assertFalse(dut.meshcat.HasPath(geom_path))
+        geom0.float_data[2] = 0.5
+        applet.show_viewer_draw_deformable(
+            applet.convert_viewer_draw_deformable(message)
+        )
+        self.assertTrue(dut.meshcat.HasPath(geom_path))
+
+        # The buffer-based decoder matches the stock one, with float_data as
+        # a numpy view of the message bytes.
+        decoded = mut._meldis._ViewerLinkDataBuffer.decode(message.encode())
+        expected = lcmt_viewer_link_data.decode(message.encode())
+        self.assertEqual(decoded.name, expected.name)
+        self.assertEqual(decoded.robot_num, expected.robot_num)
+        self.assertEqual(len(decoded.geom), len(expected.geom))
+        self.assertEqual(decoded.geom[0].string_data, geom0.string_data)
+        self.assertEqual(decoded.geom[0].color, expected.geom[0].color)
+        self.assertIsInstance(decoded.geom[0].float_data, np.ndarray)
+        np.testing.assert_equal(
+            decoded.geom[0].float_data, expected.geom[0].float_data
+        )
+        with self.assertRaises(ValueError):
+            mut._meldis._ViewerLinkDataBuffer.decode(b"\0" * 8)
+
+        # When a geometry stops being sent, its cache entries are evicted.
+        self.assertIn(geom_path, applet._deformable_topology)
+        self.assertIn(geom_path, applet._deformable_sent)
+        message.num_geom = 0
+        message.geom = []
+        applet.show_viewer_draw_deformable(
+            applet.convert_viewer_draw_deformable(message)
+        )
+        self.assertEqual(applet._deformable_topology, {})
+        self.assertEqual(applet._deformable_sent, {})
+
     def test_point_cloud(self):
         """Checks that _PointCloudApplet doesn't crash when receiving point
         cloud messages.
@@ -899,6 +1153,106 @@ Kd 1 1 0
                 dut._invoke_subscriptions()
                 self.assertEqual(dut.meshcat.HasPath(meshcat_path), True)
 
+    def test_point_cloud_budget(self):
+        """Checks _PointCloudApplet's point budget, voxel downsampling, and
+        buffer reuse.
+        """
+        # Capture an lcmt_point_cloud message with 10 points.
+        meldis = mut.Meldis()
+        cloud = self._create_point_cloud(num_fields=7)
+        self._publish_lcm_point_cloud(meldis._lcm, "DRAKE_POINT_CLOUD", cloud)
+        meldis._lcm.HandleSubscriptions(timeout_millis=1)
+        data = meldis._message_pending_data["DRAKE_POINT_CLOUD"]
+        message = lcmt_point_cloud.decode(data)
+
+        dut = mut._meldis._PointCloudApplet(
+            meshcat=meldis.meshcat,
+            max_points={"*": 4, "DRAKE_POINT_CLOUD_VOXEL": 100},
+            voxel_size={"DRAKE_POINT_CLOUD_VOXEL": 10.0},
+        )
+
+        # The budget applies to all channels.
+        budgeted = dut.convert_point_cloud("DRAKE_POINT_CLOUD", message)
+        self.assertEqual(budgeted.size(), 4)
+        self.assertTrue(budgeted.has_normals())
+
+        # Once shown, the buffer is reused for the next message.
+        dut.show_point_cloud("DRAKE_POINT_CLOUD", budgeted)
+        again = dut.convert_point_cloud("DRAKE_POINT_CLOUD", message)
+        self.assertIs(again, budgeted)
+
+        # The points (all near the origin) fall into at most 8 large voxels.
+        voxelized = dut.convert_point_cloud("DRAKE_POINT_CLOUD_VOXEL", message)
+        self.assertLessEqual(voxelized.size(), 8)
+
+    def test_decode_workers(self):
+        """Checks that heavy channels are decoded by the worker pool, and are
+        displayed once the decoding finishes.
+        """
+        dut = mut.Meldis(decode_workers=2)
+        cloud = self._create_point_cloud(num_fields=4)
+        self._publish_lcm_point_cloud(dut._lcm, "DRAKE_POINT_CLOUD", cloud)
+        dut._lcm.HandleSubscriptions(timeout_millis=1)
+        (pending,) = dut._message_pending_data.values()
+        self.assertIs(pending, mut._meldis._DECODING)
+        dut._wait_for_decoding()
+        dut._invoke_subscriptions()
+        self.assertEqual(dut._message_pending_data, {})
+        self.assertTrue(dut.meshcat.HasPath("/POINT_CLOUD/default"))
+
+    def test_decode_workers_one_per_channel(self):
+        """Checks that at most one message per channel is decoded at a time,
+        and that the newest message is the one that is displayed.
+        """
+        dut = mut.Meldis(decode_workers=4)
+        active = []
+        max_active = []
+        decoded = []
+        original = dut._decode_and_convert
+
+        def decode_and_convert(channel, data):
+            active.append(channel)
+            max_active.append(len(active))
+            time.sleep(0.05)
+            decoded.append(lcmt_point_cloud.decode(data).num_fields)
+            result = original(channel, data)
+            active.remove(channel)
+            return result
+
+        dut._decode_and_convert = decode_and_convert
+        for num_fields in (3, 4, 7):
+            cloud = self._create_point_cloud(num_fields=num_fields)
+            self._publish_lcm_point_cloud(dut._lcm, "DRAKE_POINT_CLOUD", cloud)
+        dut._lcm.HandleSubscriptions(timeout_millis=1)
+        dut._wait_for_decoding()
+        self.assertEqual(max(max_active), 1)
+        # The first message started decoding right away; the second one was
+        # superseded by the third while it waited.
+        self.assertEqual(decoded, [3, 7])
+        dut._invoke_subscriptions()
+        self.assertEqual(dut._message_pending_data, {})
+        self.assertTrue(dut.meshcat.HasPath("/POINT_CLOUD/default"))
+
+    def test_stats(self):
+        """Checks the per-channel instrumentation counters and report."""
+        stats_json = Path(os.environ["TEST_TMPDIR"]) / "meldis_stats.json"
+        dut = mut.Meldis(stats_json=stats_json)
+        self.assertEqual(dut._stats_period, 10.0)
+        cloud = self._create_point_cloud(num_fields=3)
+        for _ in range(3):
+            self._publish_lcm_point_cloud(dut._lcm, "DRAKE_POINT_CLOUD", cloud)
+        dut._lcm.HandleSubscriptions(timeout_millis=1)
+        dut._invoke_subscriptions()
+        stats = dut._stats["DRAKE_POINT_CLOUD"]
+        self.assertEqual(stats.received, 3)
+        self.assertEqual(stats.dropped, 2)
+        self.assertEqual(stats.handled, 1)
+        self.assertGreater(stats.received_bytes, 0)
+        self.assertGreaterEqual(stats.max_lag_seconds, 0.0)
+        dut._report_stats(force=True)
+        report = json.loads(stats_json.read_text())
+        self.assertEqual(report["DRAKE_POINT_CLOUD"]["received"], 3)
+
     def test_draw_frame_applet(self):
         """Checks that _DrawFrameApplet doesn't crash when frames are sent
         in DRAKE_DRAW_FRAMES channel.
@@ -927,6 +1281,46 @@ Kd 1 1 0
         # After the handlers are called, we have the expected meshcat path.
         self.assertEqual(dut.meshcat.HasPath(meshcat_path), True)
 
+    def test_draw_frame_applet_caching(self):
+        """Checks that _DrawFrameApplet only creates the triad geometry when
+        the link names change.
+        """
+        meshcat = mut.Meldis().meshcat
+        dut = mut._meldis._DrawFrameApplet(meshcat=meshcat)
+        message = lcmt_viewer_draw()
+        message.position = [[0.0, 0.0, 0.1]]
+        message.quaternion = [[1.0, 0.0, 0.0, 0.0]]
+        message.num_links = 1
+        message.link_name = ["0"]
+        message.robot_num = [1]
+        cylinder_path = "/DRAKE_DRAW_FRAMES/default/0/x-axis/cylinder"
+        dut.on_frame_update("DRAKE_DRAW_FRAMES", message)
+        self.assertTrue(meshcat.HasPath(cylinder_path))
+
+        # To detect whether the geometry is re-created, we remove it behind
+        # the applet's back. A new pose does not re-create it.
+        meshcat.Delete(cylinder_path)
+        message.position = [[0.0, 0.0, 0.2]]
+        dut.on_frame_update("DRAKE_DRAW_FRAMES", message)
+        self.assertFalse(meshcat.HasPath(cylinder_path))
+
+        # A new size updates the existing triad's transforms in place. (This
+        # uses private API for testing.)
+        axis_path = "/DRAKE_DRAW_FRAMES/default/0/x-axis"
+        old_transform = meshcat._GetPackedTransform(axis_path)
+        dut.set_triad_size(length=0.5, radius=0.02)
+        self.assertNotEqual(
+            meshcat._GetPackedTransform(axis_path), old_transform
+        )
+
+        # New link names do re-create it.
+        message.link_name = ["1"]
+        dut.on_frame_update("DRAKE_DRAW_FRAMES", message)
+        self.assertFalse(meshcat.HasPath(cylinder_path))
+        self.assertTrue(
+            meshcat.HasPath("/DRAKE_DRAW_FRAMES/default/1/x-axis/cylinder")
+        )
+
     def test_args_precedence(self):
         """Checks that the "kwargs wins" part of our API contract is met."""
         # When bad MeshcatParams are used Meldis rejects them, but good kwargs
@@ -940,6 +1334,29 @@ Kd 1 1 0
         mut.Meldis(meshcat_params=bad_host, meshcat_host="localhost")
         mut.Meldis(meshcat_params=bad_port, meshcat_port=0)
 
+    def test_update_rate(self):
+        """Checks the update scheduling for the busy and idle cases."""
+        with self.assertRaises(ValueError):
+            mut.Meldis(max_update_hz=0.0)
+        with self.assertRaises(ValueError):
+            mut.Meldis(max_update_hz=10.0, min_update_hz=20.0)
+
+        dut = mut.Meldis(max_update_hz=100.0, min_update_hz=2.0)
+        dut._last_update_time = time.time()
+
+        # When idle, we block for (nearly) the whole idle period.
+        self.assertGreater(dut._wait_timeout_millis(), 10)
+        self.assertLessEqual(dut._wait_timeout_millis(), 500)
+        self.assertFalse(dut._should_update())
+
+        # When a message is pending, we only wait out the busy period.
+        dut._message_pending_data["DRAKE_VIEWER_DRAW"] = b""
+        self.assertLessEqual(dut._wait_timeout_millis(), 10)
+        time.sleep(0.011)
+        self.assertEqual(dut._wait_timeout_millis(), 0)
+        self.assertTrue(dut._should_update())
+        dut._message_pending_data.clear()
+
     def test_command_line_browser_names(self):
         """Sanity checks our webbrowser names logic. The objective is to return
         some kind of a list, without crashing.
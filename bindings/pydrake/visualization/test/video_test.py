@@ -9,6 +9,7 @@ from pydrake.multibody.parsing import Parser
 from pydrake.multibody.plant import AddMultibodyPlantSceneGraph
 from pydrake.systems.analysis import Simulator
 from pydrake.systems.framework import DiagramBuilder
+from pydrake.systems.sensors import ImageRgba8U
 from pydrake.visualization import VideoWriter
 
 _PLATFORM_SUPPORTS_CV2 = "darwin" not in sys.platform
@@ -33,7 +34,7 @@ class TestVideoWriter(unittest.TestCase):
         else:
             return None
 
-    def _test_usage(self, filename, backend, kinds):
+    def _test_usage(self, filename, backend, kinds, **kwargs):
         """Runs through the typical usage and checks that a well-formed video
         output file was created on disk.
         """
@@ -69,6 +70,7 @@ class TestVideoWriter(unittest.TestCase):
             fps=fps,
             kinds=kinds,
             backend=backend,
+            **kwargs,
         )
 
         # Simulate for one second (add torque to the plant to make it move).
@@ -81,13 +83,20 @@ class TestVideoWriter(unittest.TestCase):
         )
         simulator.AdvanceTo(1.0)
         writer.Save()
+        self.assertEqual(writer.num_dropped_frames(), 0)
 
         # The video file should have been created, with non-trivial size.
         self.assertGreater(os.path.getsize(filename), 5000)
 
         # Check that the video can be loaded, and has the correct fps and
         # number of frames for a 1-second simulation.
-        if _PLATFORM_SUPPORTS_CV2:
+        if backend == "PIL":
+            from PIL import Image
+
+            with Image.open(filename) as readback:
+                self.assertEqual(readback.n_frames, fps + 1)
+        extension = os.path.splitext(filename)[1]
+        if _PLATFORM_SUPPORTS_CV2 and extension in (".gif", ".mp4"):
             cv2 = self._cv2()
             readback = cv2.VideoCapture(filename)
             self.assertEqual(readback.get(cv2.CAP_PROP_FRAME_COUNT), fps + 1)
@@ -103,6 +112,20 @@ class TestVideoWriter(unittest.TestCase):
         filename = os.environ["TEST_UNDECLARED_OUTPUTS_DIR"] + "/multi.gif"
         self._test_usage(filename, "PIL", ("color", "depth", "label"))
 
+    def test_pil_apng(self):
+        """Tests PIL (apng) output of a color-only camera."""
+        filename = os.environ["TEST_UNDECLARED_OUTPUTS_DIR"] + "/color.png"
+        self._test_usage(filename, "PIL", ("color",))
+
+    def test_pil_webp(self):
+        """Tests PIL (webp) output of a color-only camera."""
+        from PIL import features
+
+        if not features.check("webp"):
+            self.skipTest("PIL was built without webp support")
+        filename = os.environ["TEST_UNDECLARED_OUTPUTS_DIR"] + "/color.webp"
+        self._test_usage(filename, "PIL", ("color",))
+
     @unittest.skipUnless(_PLATFORM_SUPPORTS_CV2, "Not tested on this platform")
     def test_cv2_color_only(self):
         """Tests cv2 (mp4) output of a color-only camera."""
@@ -115,6 +138,46 @@ class TestVideoWriter(unittest.TestCase):
         filename = os.environ["TEST_UNDECLARED_OUTPUTS_DIR"] + "/multi.mp4"
         self._test_usage(filename, "cv2", ("color", "depth", "label"))
 
+    @unittest.skipUnless(_PLATFORM_SUPPORTS_CV2, "Not tested on this platform")
+    def test_cv2_drop_policy(self):
+        """Tests cv2 (mp4) output with a frame drop policy, using a queue that
+        is large enough to never drop any frames.
+        """
+        filename = os.environ["TEST_UNDECLARED_OUTPUTS_DIR"] + "/drop.mp4"
+        self._test_usage(
+            filename,
+            "cv2",
+            ("color",),
+            queue_size=100,
+            frame_drop_policy="drop_oldest",
+        )
+
+    def test_encoder_error(self):
+        """Tests that an error from the encoder thread is reported."""
+        writer = VideoWriter(filename="/no_such_directory/file.gif", fps=10)
+        simulator = Simulator(writer)
+        writer.get_input_port().FixValue(
+            simulator.get_mutable_context(), ImageRgba8U(4, 3)
+        )
+        # Depending on timing, the error is raised either by a later publish
+        # event or by Save().
+        with self.assertRaises(FileNotFoundError):
+            simulator.AdvanceTo(0.5)
+            writer.Save()
+
+    def test_bad_queue_settings(self):
+        """Tests detection of malformed queue settings."""
+        with self.assertRaisesRegex(ValueError, "queue_size"):
+            VideoWriter(filename="file", queue_size=0)
+        with self.assertRaisesRegex(ValueError, "WRONG"):
+            VideoWriter(filename="file", frame_drop_policy="WRONG")
+        # Only gif output can drop frames when using PIL; the other formats
+        # keep all of the frames until Save().
+        for filename in ("file.png", "file.webp"):
+            with self.assertRaisesRegex(ValueError, "only supported for gif"):
+                VideoWriter(filename=filename, frame_drop_policy="drop_oldest")
+        VideoWriter(filename="file.gif", frame_drop_policy="drop_oldest")
+
     @unittest.skipUnless(_PLATFORM_SUPPORTS_CV2, "Not tested on this platform")
     def test_cv2_bad_fourcc(self):
         """Tests cv2 sanity checking of fourcc."""
@@ -944,6 +944,85 @@ doc:
        (Array34d{} << 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12).finished());
 }
 
+// The compact !BinaryArray encoding is what pydrake's yaml_dump_typed emits
+// for large numpy arrays when asked to; it stores row-major float64 data.
+TEST_P(YamlReadArchiveTest, EigenBinaryArray) {
+  // The base64 data here holds the float64 values [1.0, 2.0, 3.0].
+  const std::string vector_doc = R"""(
+doc:
+  value: !BinaryArray
+    dtype: <f8
+    shape: [3]
+    data: !!binary AAAAAAAA8D8AAAAAAAAAQAAAAAAAAAhA
+)""";
+  const auto& x = AcceptNoThrow<EigenVecStruct>(Load(vector_doc));
+  EXPECT_TRUE(drake::CompareMatrices(x.value, Eigen::Vector3d(1.0, 2.0, 3.0)));
+  const auto& x3 = AcceptNoThrow<EigenVec3Struct>(Load(vector_doc));
+  EXPECT_TRUE(drake::CompareMatrices(x3.value, Eigen::Vector3d(1.0, 2.0, 3.0)));
+
+  // The values [0.0, 1.0, ..., 11.0] as a multi-line block, the way pydrake
+  // writes them.
+  const std::string matrix_doc = R"""(
+doc:
+  value: !BinaryArray
+    dtype: <f8
+    shape: [3, 4]
+    data: !!binary |
+      AAAAAAAAAAAAAAAAAADwPwAAAAAAAABAAAAAAAAACEAAAAAAAAAQQAAAAAAAABR
+      AAAAAAAAAGEAA
+      AAAAAAAcQAAAAAAAACBAAAAAAAAAIkAAAAAAAAAkQAAAAAAAACZA
+)""";
+  using Matrix34d = Eigen::Matrix<double, 3, 4>;
+  const Matrix34d expected =
+      (Matrix34d{} << 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11).finished();
+  const auto& mat = AcceptNoThrow<EigenMatrixStruct>(Load(matrix_doc));
+  EXPECT_TRUE(drake::CompareMatrices(mat.value, expected));
+  const auto& mat34 = AcceptNoThrow<EigenMatrix34Struct>(Load(matrix_doc));
+  EXPECT_TRUE(drake::CompareMatrices(mat34.value, expected));
+
+  // Shape mismatches are reported the same way as for sequences.
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      AcceptIntoDummy<EigenMatrixStruct>(Load(vector_doc)),
+      ".*has 1-dimensional !BinaryArray shape.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      AcceptIntoDummy<EigenVec3Struct>(Load(matrix_doc)),
+      ".*has dimension 3x4.*wanted 3x1.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(AcceptIntoDummy<EigenVecUpTo3Struct>(Load(R"""(
+doc:
+  value: !BinaryArray
+    dtype: <f8
+    shape: [4]
+    data: !!binary AAAAAAAA8D8AAAAAAAAAQAAAAAAAAAhAAAAAAAAAEEA=
+)""")),
+                              ".*has dimension 4x1; the maximum size is 3x1.*");
+
+  // Malformed encodings are rejected.
+  DRAKE_EXPECT_THROWS_MESSAGE(AcceptIntoDummy<EigenVecStruct>(Load(R"""(
+doc:
+  value: !BinaryArray
+    dtype: <f4
+    shape: [3]
+    data: !!binary AAAAAAAA8D8AAAAAAAAAQAAAAAAAAAhA
+)""")),
+                              ".*unsupported dtype.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(AcceptIntoDummy<EigenVecStruct>(Load(R"""(
+doc:
+  value: !BinaryArray
+    dtype: <f8
+    shape: [4]
+    data: !!binary AAAAAAAA8D8AAAAAAAAAQAAAAAAAAAhA
+)""")),
+                              ".*24 bytes of data \\(wanted 32\\).*");
+  DRAKE_EXPECT_THROWS_MESSAGE(AcceptIntoDummy<EigenVecStruct>(Load(R"""(
+doc:
+  value: !BinaryArray
+    dtype: <f8
+    shape: [3]
+    data: AAAAAAAA8D8AAAAAAAAAQAAAAAAAAAhA
+)""")),
+                              ".*without the !!binary tag.*");
+}
+
 TEST_P(YamlReadArchiveTest, EigenMatrixUpTo6) {
   using Matrix34d = Eigen::Matrix<double, 3, 4>;
   const auto test = [](const std::string& doc, const Matrix34d& expected) {
@@ -173,6 +173,21 @@ The array-like types (`std::array`, `std::vector`, `Eigen::Matrix`) all
 serialize to a <a href="https://yaml.org/spec/1.2.2/#collections">Sequence</a>
 node in YAML.
 
+When reading, an `Eigen::Matrix` of `double` may instead be given as a compact
+`!BinaryArray` Mapping node, as written by pydrake's `yaml_dump_typed` when
+its `binary_array_min_size` option is set:
+
+@code{yaml}
+value: !BinaryArray
+  dtype: <f8
+  shape: [2, 3]
+  data: !!binary |
+    AAAAAAAAAAAAAAAAAADwPwAAAAAAAABAAAAAAAAACEAAAAAAAAAQQAAAAAAAABRA
+@endcode
+
+The `data` holds the matrix's values in row-major order as little-endian
+float64 bytes. The `shape` is `[rows, cols]`, or `[size]` for a vector.
+
 User-defined structs and the native maps (`std::map`, `std::unordered_map`) all
 serialize to a <a href="https://yaml.org/spec/1.2.2/#collections">Mapping</a>
 node in YAML.
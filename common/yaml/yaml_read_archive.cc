@@ -1,6 +1,7 @@
 #include "drake/common/yaml/yaml_read_archive.h"
 
 #include <algorithm>
+#include <bit>
 #include <cstring>
 
 #include <fmt/format.h>
@@ -326,6 +327,79 @@ void YamlReadArchive::ParseScalar(const internal::Node& scalar,
   *result = std::vector<std::byte>(data, data + decoded.size());
 }
 
+bool YamlReadArchive::ParseBinaryArray(const internal::Node& node,
+                                       std::vector<size_t>* shape,
+                                       std::vector<double>* values) const {
+  DRAKE_DEMAND(node.IsMapping());
+  DRAKE_DEMAND(shape != nullptr);
+  DRAKE_DEMAND(values != nullptr);
+  // The encoded data is little-endian; Drake only supports such platforms.
+  static_assert(std::endian::native == std::endian::little);
+
+  const string_map<internal::Node>& mapping = node.GetMapping();
+  for (const auto& [key, value] : mapping) {
+    unused(value);
+    if ((key != "dtype") && (key != "shape") && (key != "data")) {
+      ReportError(fmt::format("has !BinaryArray with unknown key '{}' in the",
+                              key));
+      return false;
+    }
+  }
+  const auto dtype = mapping.find("dtype");
+  const auto shape_node = mapping.find("shape");
+  const auto data = mapping.find("data");
+  if ((dtype == mapping.end()) || (shape_node == mapping.end()) ||
+      (data == mapping.end())) {
+    ReportError("has !BinaryArray missing its dtype, shape, or data in the");
+    return false;
+  }
+
+  if (!dtype->second.IsScalar() || (dtype->second.GetScalar() != "<f8")) {
+    ReportError(
+        "has !BinaryArray with unsupported dtype (wanted '<f8') in the");
+    return false;
+  }
+
+  if (!shape_node->second.IsSequence()) {
+    ReportError("has !BinaryArray with non-Sequence shape in the");
+    return false;
+  }
+  shape->clear();
+  size_t size = 1;
+  for (const internal::Node& dim_node : shape_node->second.GetSequence()) {
+    int64_t dim{};
+    if (!dim_node.IsScalar() ||
+        !YAML::convert<int64_t>::decode(YAML::Node(dim_node.GetScalar()),
+                                        dim) ||
+        (dim < 0)) {
+      ReportError("has !BinaryArray with invalid shape in the");
+      return false;
+    }
+    shape->push_back(static_cast<size_t>(dim));
+    size *= static_cast<size_t>(dim);
+  }
+
+  const internal::Node& data_node = data->second;
+  if (!data_node.IsScalar() ||
+      (data_node.GetTag() != internal::Node::kTagBinary)) {
+    ReportError("has !BinaryArray data without the !!binary tag in the");
+    return false;
+  }
+  const std::vector<unsigned char> bytes =
+      YAML::DecodeBase64(data_node.GetScalar());
+  if (bytes.size() != size * sizeof(double)) {
+    ReportError(fmt::format(
+        "has !BinaryArray with {} bytes of data (wanted {}) in the",
+        bytes.size(), size * sizeof(double)));
+    return false;
+  }
+  values->resize(size);
+  if (size > 0) {
+    std::memcpy(values->data(), bytes.data(), bytes.size());
+  }
+  return true;
+}
+
 const internal::Node* YamlReadArchive::MaybeGetSubNode(const char* name) const {
   DRAKE_DEMAND(name != nullptr);
   if (mapish_item_key_ != nullptr) {
@@ -9,6 +9,7 @@
 #include <optional>
 #include <ostream>
 #include <string>
+#include <string_view>
 #include <unordered_map>
 #include <unordered_set>
 #include <utility>
@@ -424,6 +425,13 @@ class YamlReadArchive final {
   template <typename NVP>
   void VisitEigenDenseBase(const NVP& nvp) {
     using Derived = std::remove_cvref_t<decltype(*nvp.value())>;
+    // A compact "!BinaryArray" mapping can stand in for any matrix shape.
+    const internal::Node* maybe_binary = MaybeGetSubNode(nvp.name());
+    if ((maybe_binary != nullptr) && maybe_binary->IsMapping() &&
+        (maybe_binary->GetTag() == kTagBinaryArray)) {
+      this->VisitEigenBinaryArray(nvp, *maybe_binary);
+      return;
+    }
     if constexpr (Derived::ColsAtCompileTime == 1) {
       // If the compile-time size is a column vector, then we'll re-use the
       // visitor logic from std::array or std::vector to handle it.
@@ -500,6 +508,58 @@ class YamlReadArchive final {
     }
   }
 
+  // Reads a "!BinaryArray" mapping (as written by pydrake's yaml_dump_typed)
+  // directly into an Eigen matrix. The mapping's `data` holds the row-major
+  // little-endian float64 values, base64 encoded with the !!binary tag.
+  template <typename NVP>
+  void VisitEigenBinaryArray(const NVP& nvp, const internal::Node& node) {
+    std::vector<size_t> shape;
+    std::vector<double> values;
+    if (!ParseBinaryArray(node, &shape, &values)) {
+      return;
+    }
+    using Derived = std::remove_cvref_t<decltype(*nvp.value())>;
+    size_t rows{};
+    size_t cols{};
+    if ((shape.size() == 1) && (Derived::ColsAtCompileTime == 1)) {
+      rows = shape[0];
+      cols = 1;
+    } else if (shape.size() == 2) {
+      rows = shape[0];
+      cols = shape[1];
+    } else {
+      ReportError(fmt::format("has {}-dimensional !BinaryArray shape in the",
+                              shape.size()));
+      return;
+    }
+    if (((Derived::RowsAtCompileTime != Eigen::Dynamic) &&
+         (static_cast<int>(rows) != Derived::RowsAtCompileTime)) ||
+        ((Derived::ColsAtCompileTime != Eigen::Dynamic) &&
+         (static_cast<int>(cols) != Derived::ColsAtCompileTime))) {
+      ReportError(fmt::format("has dimension {}x{} (wanted {}x{})", rows, cols,
+                              static_cast<int>(Derived::RowsAtCompileTime),
+                              static_cast<int>(Derived::ColsAtCompileTime)));
+      return;
+    }
+    if (((Derived::MaxRowsAtCompileTime != Eigen::Dynamic) &&
+         (static_cast<int>(rows) > Derived::MaxRowsAtCompileTime)) ||
+        ((Derived::MaxColsAtCompileTime != Eigen::Dynamic) &&
+         (static_cast<int>(cols) > Derived::MaxColsAtCompileTime))) {
+      ReportError(fmt::format(
+          "has dimension {}x{}; the maximum size is {}x{} in the", rows, cols,
+          static_cast<int>(Derived::MaxRowsAtCompileTime),
+          static_cast<int>(Derived::MaxColsAtCompileTime)));
+      return;
+    }
+    auto&& storage = *nvp.value();
+    storage.resize(rows, cols);
+    for (size_t i = 0; i < rows; ++i) {
+      for (size_t j = 0; j < cols; ++j) {
+        storage(i, j) = values[i * cols + j];
+      }
+    }
+  }
+
   template <typename Key, typename Value, typename NVP>
   void VisitMap(const NVP& nvp) {
     // For now, we only allow std::string as the keys of a serialized std::map.
@@ -553,6 +613,14 @@ class YamlReadArchive final {
   void ParseScalar(const internal::Node& scalar,
                    std::vector<std::byte>* result);
 
+  // Parses the shape and (row-major) values of a "!BinaryArray" mapping node.
+  // On failure, reports an error and returns false.
+  bool ParseBinaryArray(const internal::Node& node, std::vector<size_t>* shape,
+                        std::vector<double>* values) const;
+
+  // The YAML tag for pydrake's compact encoding of a numpy array.
+  static constexpr std::string_view kTagBinaryArray{"!BinaryArray"};
+
   template <typename T>
   void ParseScalarImpl(const internal::Node& scalar, T* result);
 
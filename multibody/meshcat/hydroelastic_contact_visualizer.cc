@@ -22,6 +22,17 @@ using geometry::MeshcatCone;
 using math::RigidTransformd;
 using math::RotationMatrixd;
 
+namespace {
+
+// Returns true iff `a` and `b` have the same shape and the same coefficients.
+template <typename Derived>
+bool IsSame(const Eigen::MatrixBase<Derived>& a,
+            const Eigen::MatrixBase<Derived>& b) {
+  return a.rows() == b.rows() && a.cols() == b.cols() && a == b;
+}
+
+}  // namespace
+
 HydroelasticContactVisualizer::HydroelasticContactVisualizer(
     std::shared_ptr<Meshcat> meshcat, ContactVisualizerParams params)
     : meshcat_(std::move(meshcat)), params_(std::move(params)) {
@@ -121,8 +132,10 @@ void HydroelasticContactVisualizer::Update(
       meshcat_->SetProperty(path + "/moment_C_W", "visible", false, time);
     }
 
-    // Contact surface
-    {
+    // Contact surface. When only the force and moment have changed since the
+    // prior update, there's no need to re-send the (possibly large) mesh.
+    if (!IsSame(item.p_WV, status.p_WV) || !IsSame(item.faces, status.faces) ||
+        !IsSame(item.pressure, status.pressure)) {
       // Map normalized pressure values to color using a flame map.
 
       // TODO(#17683): This creates a unique mapping from pressure to color for
@@ -157,6 +170,9 @@ void HydroelasticContactVisualizer::Update(
                                      item.faces, colors, false);
       meshcat_->SetTransform(path + "/contact_surface",
                              RigidTransformd(-item.centroid_W));
+      status.p_WV = item.p_WV;
+      status.faces = item.faces;
+      status.pressure = item.pressure;
     }
   }
 
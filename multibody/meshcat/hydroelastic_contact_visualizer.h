@@ -46,7 +46,8 @@ struct HydroelasticContactVisualizerItem {
 /* HydroelasticContactVisualizer publishes hydroelastic contact results for
 MeshCat. It draws two single-sided arrows, one for force and one for moment, at
 the centroid of the contact patch. The length of each vector is scaled by the
-magnitude of the contact force/moment.
+magnitude of the contact force/moment. The contact surface mesh is only
+re-sent to MeshCat when its vertices, faces, or pressure values change.
 
 This is unit tested via contact_visualizer_test overall; there is currently no
 hydroelastic-contact-specific unit test.
@@ -84,6 +85,11 @@ class HydroelasticContactVisualizer {
     bool visible{false};
     /* Whether this contact was active as of the most recent Update(). */
     bool active{false};
+    /* The contact surface most recently sent to meshcat, so that an unchanged
+    surface is not re-sent on every Update(). */
+    Eigen::Matrix3Xd p_WV;
+    Eigen::Matrix3Xi faces;
+    Eigen::VectorXd pressure;
   };
 
   /* Find an entry in path_visibility_status_, or else add one and return it.
@@ -85,6 +85,42 @@ GTEST_TEST(HydroelasticContactVisualizer, TestZeroForceOrMoment) {
   }
 }
 
+// Tests that an unchanged contact surface is not re-sent to meshcat.
+GTEST_TEST(HydroelasticContactVisualizer, UnchangedSurface) {
+  auto meshcat = std::make_shared<Meshcat>();
+  ContactVisualizerParams params{};
+  internal::HydroelasticContactVisualizer visualizer(meshcat, params);
+
+  const Vector3d centroid_W = Vector3d::Zero();
+  // clang-format off
+  const Matrix3Xd p_WV = (Matrix3Xd(3, 3) << 0., 1., 0.,
+                                             0., 0., 1.,
+                                             0., 0., 0.).finished();
+  // clang-format on
+  const Matrix3Xi faces = (Matrix3Xi(3, 1) << 0, 1, 2).finished();
+  const VectorXd pressure = (VectorXd(3) << 1e4, 0., 0.).finished();
+  const std::string path = fmt::format("{}/body_A+body_B", params.prefix);
+  const std::string surface_path = path + "/contact_surface";
+
+  std::vector<internal::HydroelasticContactVisualizerItem> items;
+  items.push_back({"body_A", "body_B", centroid_W, Vector3d::UnitX(),
+                   Vector3d::UnitY(), p_WV, faces, pressure});
+  visualizer.Update(0, items);
+  EXPECT_TRUE(meshcat->HasPath(surface_path));
+
+  // To detect whether the surface is re-sent, we remove it behind the
+  // visualizer's back. Changing only the force does not re-send it.
+  meshcat->Delete(surface_path);
+  items[0].force_C_W = 2 * Vector3d::UnitX();
+  visualizer.Update(0, items);
+  EXPECT_FALSE(meshcat->HasPath(surface_path));
+
+  // Changing the surface does re-send it.
+  items[0].pressure[1] = 1.0;
+  visualizer.Update(0, items);
+  EXPECT_TRUE(meshcat->HasPath(surface_path));
+}
+
 }  // namespace
 }  // namespace meshcat
 }  // namespace multibody
@@ -0,0 +1,242 @@
+#include "drake/perception/fused_depth_image_to_point_cloud.h"
+
+#include <cmath>
+#include <numeric>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <fmt/format.h>
+
+#include "drake/common/drake_throw.h"
+#include "drake/math/rigid_transform.h"
+#include "drake/systems/sensors/image.h"
+
+using drake::Value;
+using drake::math::RigidTransformd;
+using drake::systems::Context;
+using drake::systems::InputPort;
+using drake::systems::sensors::CameraInfo;
+using drake::systems::sensors::Image;
+using drake::systems::sensors::ImageDepth16U;
+using drake::systems::sensors::ImageDepth32F;
+using drake::systems::sensors::ImageRgba8U;
+using drake::systems::sensors::ImageTraits;
+using drake::systems::sensors::PixelType;
+using Eigen::Vector3d;
+
+namespace drake {
+namespace perception {
+namespace {
+
+using pc_flags::kRGBs;
+using pc_flags::kXYZs;
+
+// Returns true iff the given depth produces a point, i.e., is not NaN, nor
+// kTooClose, nor kTooFar.
+template <PixelType pixel_type>
+bool IsValidDepth(const typename ImageTraits<pixel_type>::ChannelType z) {
+  return (z != ImageTraits<pixel_type>::kTooClose) &&
+         (z != ImageTraits<pixel_type>::kTooFar) && !std::isnan(z);
+}
+
+template <PixelType pixel_type>
+int CountValidPixels(const Image<pixel_type>& depth_image) {
+  int count = 0;
+  for (int v = 0; v < depth_image.height(); ++v) {
+    for (int u = 0; u < depth_image.width(); ++u) {
+      count += IsValidDepth<pixel_type>(depth_image.at(u, v)[0]);
+    }
+  }
+  return count;
+}
+
+// Writes the valid pixels of the given depth image (and their colors, when
+// the output has RGBs) into the output, starting at the point `start`.
+template <PixelType pixel_type>
+void ConvertValidPixels(const CameraInfo& camera_info,
+                        const RigidTransformd& X_PC,
+                        const Image<pixel_type>& depth_image,
+                        const ImageRgba8U* color_image, const float scale,
+                        const int start, PointCloud* output) {
+  Eigen::Ref<Matrix3X<float>> output_xyz = output->mutable_xyzs();
+  std::optional<Eigen::Ref<Matrix3X<uint8_t>>> output_rgb;
+  if (output->has_rgbs()) {
+    output_rgb = output->mutable_rgbs();
+  }
+
+  const double cx = camera_info.center_x();
+  const double cy = camera_info.center_y();
+  const double fx_inv = 1.0 / camera_info.focal_x();
+  const double fy_inv = 1.0 / camera_info.focal_y();
+
+  int col = start;
+  for (int v = 0; v < depth_image.height(); ++v) {
+    for (int u = 0; u < depth_image.width(); ++u) {
+      const auto z = depth_image.at(u, v)[0];
+      if (!IsValidDepth<pixel_type>(z)) {
+        continue;
+      }
+      const Vector3d xyz =
+          X_PC * Vector3d(scale * z * (u - cx) * fx_inv,
+                          scale * z * (v - cy) * fy_inv, scale * z);
+      output_xyz.col(col) = xyz.template cast<float>();
+      if (output_rgb) {
+        if (color_image != nullptr) {
+          const auto color = color_image->at(u, v);
+          output_rgb->col(col) = Vector3<uint8_t>(color[0], color[1], color[2]);
+        } else {
+          output_rgb->col(col).setConstant(PointCloud::kDefaultColor);
+        }
+      }
+      ++col;
+    }
+  }
+}
+
+}  // namespace
+
+FusedDepthImageToPointCloud::FusedDepthImageToPointCloud(
+    std::vector<CameraInfo> camera_infos, PixelType depth_pixel_type,
+    float scale, const pc_flags::BaseFieldT fields,
+    std::optional<double> voxel_size, Parallelism parallelize)
+    : camera_infos_(std::move(camera_infos)),
+      depth_pixel_type_(depth_pixel_type),
+      scale_(scale),
+      fields_(fields),
+      voxel_size_(voxel_size),
+      parallelize_(parallelize) {
+  DRAKE_THROW_UNLESS(!camera_infos_.empty());
+  DRAKE_THROW_UNLESS(fields == kXYZs || fields == (kXYZs | kRGBs));
+  DRAKE_THROW_UNLESS(!voxel_size.has_value() || *voxel_size > 0);
+  if (depth_pixel_type != PixelType::kDepth32F &&
+      depth_pixel_type != PixelType::kDepth16U) {
+    throw std::logic_error(
+        "Unsupported pixel_type in FusedDepthImageToPointCloud");
+  }
+
+  for (int i = 0; i < num_cameras(); ++i) {
+    const std::string depth_image_name = fmt::format("depth_image_{}", i);
+    const InputPort<double>& depth_image_port =
+        (depth_pixel_type == PixelType::kDepth32F)
+            ? this->DeclareAbstractInputPort(depth_image_name,
+                                             Value<ImageDepth32F>{})
+            : this->DeclareAbstractInputPort(depth_image_name,
+                                             Value<ImageDepth16U>{});
+    depth_image_input_ports_.push_back(depth_image_port.get_index());
+    color_image_input_ports_.push_back(
+        this->DeclareAbstractInputPort(fmt::format("color_image_{}", i),
+                                       Value<ImageRgba8U>{})
+            .get_index());
+    camera_pose_input_ports_.push_back(
+        this->DeclareAbstractInputPort(fmt::format("camera_pose_{}", i),
+                                       Value<RigidTransformd>{})
+            .get_index());
+  }
+
+  auto calc_fused =
+      (depth_pixel_type == PixelType::kDepth32F)
+          ? &FusedDepthImageToPointCloud::CalcFused<PixelType::kDepth32F>
+          : &FusedDepthImageToPointCloud::CalcFused<PixelType::kDepth16U>;
+  if (voxel_size.has_value()) {
+    // The fused point cloud is an intermediate result, which we store in the
+    // cache so that its memory is reused from one calculation to the next.
+    fused_cache_index_ =
+        this->DeclareCacheEntry("fused_point_cloud", PointCloud{0, fields},
+                                calc_fused, {this->all_input_ports_ticket()})
+            .cache_index();
+    this->DeclareAbstractOutputPort(
+        "point_cloud", PointCloud{0, fields},
+        &FusedDepthImageToPointCloud::CalcDownSampled,
+        {this->cache_entry_ticket(*fused_cache_index_)});
+  } else {
+    this->DeclareAbstractOutputPort("point_cloud", PointCloud{0, fields},
+                                    calc_fused,
+                                    {this->all_input_ports_ticket()});
+  }
+}
+
+const InputPort<double>& FusedDepthImageToPointCloud::depth_image_input_port(
+    int camera_index) const {
+  DRAKE_THROW_UNLESS(0 <= camera_index && camera_index < num_cameras());
+  return this->get_input_port(depth_image_input_ports_[camera_index]);
+}
+
+const InputPort<double>& FusedDepthImageToPointCloud::color_image_input_port(
+    int camera_index) const {
+  DRAKE_THROW_UNLESS(0 <= camera_index && camera_index < num_cameras());
+  return this->get_input_port(color_image_input_ports_[camera_index]);
+}
+
+const InputPort<double>& FusedDepthImageToPointCloud::camera_pose_input_port(
+    int camera_index) const {
+  DRAKE_THROW_UNLESS(0 <= camera_index && camera_index < num_cameras());
+  return this->get_input_port(camera_pose_input_ports_[camera_index]);
+}
+
+template <PixelType pixel_type>
+void FusedDepthImageToPointCloud::CalcFused(const Context<double>& context,
+                                            PointCloud* output) const {
+  DRAKE_THROW_UNLESS(output->fields().base_fields() == fields_);
+  const bool has_rgbs = output->has_rgbs();
+  const int num_cameras = this->num_cameras();
+
+  // Gather (and check) all of the inputs before we start any parallel work.
+  std::vector<const Image<pixel_type>*> depth_images(num_cameras);
+  std::vector<const ImageRgba8U*> color_images(num_cameras, nullptr);
+  std::vector<RigidTransformd> X_PCs(num_cameras);
+  for (int i = 0; i < num_cameras; ++i) {
+    depth_images[i] = this->EvalInputValue<Image<pixel_type>>(
+        context, depth_image_input_ports_[i]);
+    DRAKE_THROW_UNLESS(depth_images[i] != nullptr);
+    if (has_rgbs) {
+      color_images[i] = this->EvalInputValue<ImageRgba8U>(
+          context, color_image_input_ports_[i]);
+      if (color_images[i] != nullptr) {
+        DRAKE_THROW_UNLESS(color_images[i]->width() ==
+                           depth_images[i]->width());
+        DRAKE_THROW_UNLESS(color_images[i]->height() ==
+                           depth_images[i]->height());
+      }
+    }
+    const auto* const pose_or_null =
+        this->EvalInputValue<RigidTransformd>(
+            context, camera_pose_input_ports_[i]);
+    if (pose_or_null != nullptr) {
+      X_PCs[i] = *pose_or_null;
+    }
+  }
+
+  // Count each camera's valid pixels, to find the range of points that it
+  // writes into the output. Then, size the output once (which is a no-op when
+  // the number of points is unchanged) and fill in each camera's range.
+  [[maybe_unused]] const int num_threads = parallelize_.num_threads();
+  std::vector<int> starts(num_cameras + 1, 0);
+#if defined(_OPENMP)
+#pragma omp parallel for num_threads(num_threads)
+#endif
+  for (int i = 0; i < num_cameras; ++i) {
+    starts[i + 1] = CountValidPixels(*depth_images[i]);
+  }
+  std::partial_sum(starts.begin(), starts.end(), starts.begin());
+  output->resize(starts.back(), /* skip_initialization = */ true);
+#if defined(_OPENMP)
+#pragma omp parallel for num_threads(num_threads)
+#endif
+  for (int i = 0; i < num_cameras; ++i) {
+    ConvertValidPixels(camera_infos_[i], X_PCs[i], *depth_images[i],
+                       color_images[i], scale_, starts[i], output);
+  }
+}
+
+void FusedDepthImageToPointCloud::CalcDownSampled(
+    const Context<double>& context, PointCloud* output) const {
+  const PointCloud& fused =
+      this->get_cache_entry(*fused_cache_index_).Eval<PointCloud>(context);
+  *output = fused.VoxelizedDownSample(*voxel_size_, parallelize_);
+}
+
+}  // namespace perception
+}  // namespace drake
@@ -0,0 +1,135 @@
+#pragma once
+
+#include <optional>
+#include <vector>
+
+#include "drake/common/drake_copyable.h"
+#include "drake/common/parallelism.h"
+#include "drake/perception/point_cloud.h"
+#include "drake/systems/framework/context.h"
+#include "drake/systems/framework/leaf_system.h"
+#include "drake/systems/sensors/camera_info.h"
+#include "drake/systems/sensors/pixel_types.h"
+
+namespace drake {
+namespace perception {
+
+/// Converts the depth images from several cameras into one fused point cloud.
+///
+/// @system
+/// name: FusedDepthImageToPointCloud
+/// input_ports:
+/// - depth_image_0
+/// - color_image_0 (optional)
+/// - camera_pose_0 (optional)
+/// - ...
+/// - depth_image_(K-1)
+/// - color_image_(K-1) (optional)
+/// - camera_pose_(K-1) (optional)
+/// output_ports:
+/// - point_cloud
+/// @endsystem
+///
+/// For each of the K cameras, the system has an input port that takes a depth
+/// image, an optional input port that takes a color image, and an optional
+/// input port that takes the camera pose X_PC (the pose of the camera in a
+/// common parent frame P). The output is a single PointCloud in frame P, which
+/// is equivalent to converting each depth image using DepthImageToPointCloud
+/// and then concatenating the results, but is computed without any per-camera
+/// intermediate point clouds. If a camera_pose input is not connected, then
+/// that camera's frame is taken to be P.
+///
+/// Unlike DepthImageToPointCloud, the output only contains the valid points:
+/// pixels that are NaN, kTooClose, or kTooFar (as defined by ImageTraits) do
+/// not produce a point. The points are ordered by camera and then by pixel.
+///
+/// When the output point cloud has RGBs, the color of each point is taken
+/// from that camera's color image (which must be the same size as its depth
+/// image), or else is kDefaultColor if the color_image input is not
+/// connected.
+///
+/// Optionally, the fused point cloud may be down-sampled; see
+/// PointCloud::VoxelizedDownSample().
+///
+/// @ingroup perception_systems
+class FusedDepthImageToPointCloud final : public systems::LeafSystem<double> {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(FusedDepthImageToPointCloud);
+
+  /// Constructs the converter.
+  ///
+  /// @param[in] camera_infos The camera info for each camera. The number of
+  ///   cameras K is the size of this vector.
+  /// @param[in] depth_pixel_type The pixel type of all of the depth image
+  ///   inputs. Only 16U and 32F are supported.
+  /// @param[in] scale The depth image inputs are multiplied by this scale
+  ///   factor before projecting to a point cloud.  (This is useful for
+  ///   converting mm to meters, etc.)
+  /// @param[in] fields The fields the point cloud contains; must be either
+  ///   kXYZs or kXYZs | kRGBs.
+  /// @param[in] voxel_size When set, the fused point cloud is down-sampled
+  ///   into voxels of this size.
+  /// @param[in] parallelize Enables OpenMP parallelization across the cameras
+  ///   (and of the down-sampling).
+  /// @throws std::exception if camera_infos is empty.
+  /// @throws std::exception if the fields are not supported.
+  /// @throws std::exception if voxel_size is set and not positive.
+  explicit FusedDepthImageToPointCloud(
+      std::vector<systems::sensors::CameraInfo> camera_infos,
+      systems::sensors::PixelType depth_pixel_type =
+          systems::sensors::PixelType::kDepth32F,
+      float scale = 1.0, pc_flags::BaseFieldT fields = pc_flags::kXYZs,
+      std::optional<double> voxel_size = std::nullopt,
+      Parallelism parallelize = false);
+
+  /// Returns the number of cameras K.
+  int num_cameras() const { return static_cast<int>(camera_infos_.size()); }
+
+  /// Returns the abstract valued input port that expects either an
+  /// ImageDepth16U or ImageDepth32F (depending on the constructor argument)
+  /// for the given camera.
+  const systems::InputPort<double>& depth_image_input_port(
+      int camera_index) const;
+
+  /// Returns the abstract valued input port that expects an ImageRgba8U for
+  /// the given camera.
+  const systems::InputPort<double>& color_image_input_port(
+      int camera_index) const;
+
+  /// Returns the abstract valued input port that expects X_PC as a
+  /// RigidTransformd for the given camera.  (This input port does not
+  /// necessarily need to be connected; refer to the class overview for
+  /// details.)
+  const systems::InputPort<double>& camera_pose_input_port(
+      int camera_index) const;
+
+  /// Returns the abstract valued output port that provides a PointCloud.
+  /// Only the channels passed into the constructor argument "fields" are
+  /// present.
+  const systems::OutputPort<double>& point_cloud_output_port() const {
+    return LeafSystem<double>::get_output_port(0);
+  }
+
+ private:
+  template <systems::sensors::PixelType depth_pixel_type>
+  void CalcFused(const systems::Context<double>&, PointCloud*) const;
+
+  void CalcDownSampled(const systems::Context<double>&, PointCloud*) const;
+
+  const std::vector<systems::sensors::CameraInfo> camera_infos_;
+  const systems::sensors::PixelType depth_pixel_type_;
+  const float scale_;
+  const pc_flags::BaseFieldT fields_;
+  const std::optional<double> voxel_size_;
+  const Parallelism parallelize_;
+
+  std::vector<systems::InputPortIndex> depth_image_input_ports_;
+  std::vector<systems::InputPortIndex> color_image_input_ports_;
+  std::vector<systems::InputPortIndex> camera_pose_input_ports_;
+
+  // When down-sampling, the cache entry for the fused point cloud.
+  std::optional<systems::CacheIndex> fused_cache_index_;
+};
+
+}  // namespace perception
+}  // namespace drake
@@ -0,0 +1,263 @@
+#include "drake/perception/point_cloud_index.h"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+
+#include "drake/common/drake_throw.h"
+
+namespace drake {
+namespace perception {
+
+namespace {
+
+// A candidate neighbor, as its (squared distance, index). The lexicographic
+// ordering of the pairs sorts the neighbors by increasing distance, breaking
+// ties by index.
+using Neighbor = std::pair<float, int>;
+
+// Voxel keys are clamped to this magnitude so that the key arithmetic in the
+// queries cannot overflow.
+constexpr int kMaxKey = 1 << 28;
+
+}  // namespace
+
+PointCloudIndex::PointCloudIndex(const PointCloud& cloud,
+                                 const double voxel_size,
+                                 const Parallelism parallelize)
+    : voxel_size_(voxel_size) {
+  DRAKE_THROW_UNLESS(cloud.has_xyzs());
+  DRAKE_THROW_UNLESS(voxel_size > 0);
+  xyzs_ = cloud.xyzs();
+  IndexNewPoints(size(), parallelize);
+}
+
+void PointCloudIndex::Update(const PointCloud& cloud,
+                             const Parallelism parallelize) {
+  DRAKE_THROW_UNLESS(cloud.has_xyzs());
+  DRAKE_THROW_UNLESS(cloud.size() >= size());
+  const int old_size = size();
+  const int num_new = cloud.size() - old_size;
+  xyzs_.conservativeResize(3, cloud.size());
+  xyzs_.rightCols(num_new) = cloud.xyzs().rightCols(num_new);
+  IndexNewPoints(num_new, parallelize);
+}
+
+std::size_t PointCloudIndex::KeyHash::operator()(
+    const Eigen::Vector3i& key) const {
+  // The classic spatial hash of Teschner et al. (2003), "Optimized Spatial
+  // Hashing for Collision Detection of Deformable Objects".
+  return (static_cast<std::size_t>(key.x()) * 73856093) ^
+         (static_cast<std::size_t>(key.y()) * 19349663) ^
+         (static_cast<std::size_t>(key.z()) * 83492791);
+}
+
+Eigen::Vector3i PointCloudIndex::ComputeKey(const Eigen::Vector3f& xyz) const {
+  Eigen::Vector3i key;
+  for (int i = 0; i < 3; ++i) {
+    const double scaled = std::floor(xyz[i] / voxel_size_);
+    key[i] = static_cast<int>(std::clamp<double>(scaled, -kMaxKey, kMaxKey));
+  }
+  return key;
+}
+
+void PointCloudIndex::IndexNewPoints(
+    const int num_new, [[maybe_unused]] const Parallelism parallelize) {
+  const int start = size() - num_new;
+
+  // Computing the keys is the bulk of the work, so do that in parallel, and
+  // then insert them into the hash map serially.
+  std::vector<Eigen::Vector3i> keys(num_new);
+  std::vector<uint8_t> is_finite(num_new);
+#if defined(_OPENMP)
+#pragma omp parallel for num_threads(parallelize.num_threads())
+#endif
+  for (int i = 0; i < num_new; ++i) {
+    const Eigen::Vector3f xyz = xyzs_.col(start + i);
+    is_finite[i] = xyz.allFinite();
+    if (is_finite[i]) {
+      keys[i] = ComputeKey(xyz);
+    }
+  }
+
+  for (int i = 0; i < num_new; ++i) {
+    if (!is_finite[i]) {
+      continue;
+    }
+    if (voxels_.empty()) {
+      min_key_ = keys[i];
+      max_key_ = keys[i];
+    } else {
+      min_key_ = min_key_.cwiseMin(keys[i]);
+      max_key_ = max_key_.cwiseMax(keys[i]);
+    }
+    voxels_[keys[i]].push_back(start + i);
+  }
+}
+
+std::pair<Eigen::MatrixXi, Eigen::MatrixXf> PointCloudIndex::FindNearest(
+    const Eigen::Ref<const Matrix3X<float>>& queries, const int k,
+    [[maybe_unused]] const Parallelism parallelize) const {
+  DRAKE_THROW_UNLESS(k >= 1);
+  const int num_queries = queries.cols();
+  Eigen::MatrixXi indices(k, num_queries);
+  Eigen::MatrixXf distances(k, num_queries);
+#if defined(_OPENMP)
+#pragma omp parallel for num_threads(parallelize.num_threads())
+#endif
+  for (int j = 0; j < num_queries; ++j) {
+    FindNearestOne(queries.col(j), k, indices.col(j), distances.col(j));
+  }
+  return {std::move(indices), std::move(distances)};
+}
+
+void PointCloudIndex::FindNearestOne(
+    const Eigen::Vector3f& query, const int k,
+    Eigen::Ref<Eigen::VectorXi> indices,
+    Eigen::Ref<Eigen::VectorXf> distances) const {
+  indices.setConstant(-1);
+  distances.setConstant(std::numeric_limits<float>::infinity());
+  if (voxels_.empty() || !query.allFinite()) {
+    return;
+  }
+
+  // The k best neighbors found so far, as a max-heap.
+  std::vector<Neighbor> best;
+  best.reserve(k);
+  const auto consider = [&](const std::vector<int>& voxel) {
+    for (const int index : voxel) {
+      const float squared_distance = (xyzs_.col(index) - query).squaredNorm();
+      const Neighbor candidate(squared_distance, index);
+      if (static_cast<int>(best.size()) < k) {
+        best.push_back(candidate);
+        std::push_heap(best.begin(), best.end());
+      } else if (candidate < best.front()) {
+        std::pop_heap(best.begin(), best.end());
+        best.back() = candidate;
+        std::push_heap(best.begin(), best.end());
+      }
+    }
+  };
+
+  // Visit the voxels in rings of increasing (Chebyshev) distance from the
+  // query's voxel. Every point in a voxel that is outside of ring r is at
+  // least r * voxel_size away from the query, so we can stop once the k'th
+  // best neighbor is closer than that. Since sparse clouds could require
+  // many rings of mostly empty voxels, we switch to checking every occupied
+  // voxel once that would be cheaper.
+  const Eigen::Vector3i center = ComputeKey(query);
+  const int max_ring = std::max((center - min_key_).maxCoeff(),
+                                (max_key_ - center).maxCoeff());
+  const int64_t num_voxels = voxels_.size();
+  bool done = false;
+  for (int ring = 0; ring <= max_ring && !done; ++ring) {
+    const int64_t ring_width = 2 * ring + 1;
+    const int64_t ring_volume = ring_width * ring_width * ring_width;
+    if (ring_volume > num_voxels) {
+      best.clear();
+      for (const auto& [key, voxel] : voxels_) {
+        consider(voxel);
+      }
+      break;
+    }
+    for (int dx = -ring; dx <= ring; ++dx) {
+      for (int dy = -ring; dy <= ring; ++dy) {
+        // Only the voxels on the surface of the ring's cube are new.
+        const bool on_surface = std::abs(dx) == ring || std::abs(dy) == ring;
+        const int dz_step = on_surface ? 1 : std::max(2 * ring, 1);
+        for (int dz = -ring; dz <= ring; dz += dz_step) {
+          const auto iter =
+              voxels_.find(center + Eigen::Vector3i(dx, dy, dz));
+          if (iter != voxels_.end()) {
+            consider(iter->second);
+          }
+        }
+      }
+    }
+    if (static_cast<int>(best.size()) == k) {
+      const double bound = ring * voxel_size_;
+      done = best.front().first <= bound * bound;
+    }
+  }
+
+  std::sort(best.begin(), best.end());
+  for (int i = 0; i < static_cast<int>(best.size()); ++i) {
+    indices[i] = best[i].second;
+    distances[i] = std::sqrt(best[i].first);
+  }
+}
+
+std::vector<Eigen::VectorXi> PointCloudIndex::FindWithinRadius(
+    const Eigen::Ref<const Matrix3X<float>>& queries, const double radius,
+    [[maybe_unused]] const Parallelism parallelize) const {
+  DRAKE_THROW_UNLESS(radius >= 0);
+  const int num_queries = queries.cols();
+  std::vector<Eigen::VectorXi> result(num_queries);
+#if defined(_OPENMP)
+#pragma omp parallel for num_threads(parallelize.num_threads())
+#endif
+  for (int j = 0; j < num_queries; ++j) {
+    result[j] = FindWithinRadiusOne(queries.col(j), radius);
+  }
+  return result;
+}
+
+Eigen::VectorXi PointCloudIndex::FindWithinRadiusOne(
+    const Eigen::Vector3f& query, const double radius) const {
+  if (voxels_.empty() || !query.allFinite()) {
+    return Eigen::VectorXi();
+  }
+
+  const float radius_f = static_cast<float>(radius);
+  const float squared_radius = radius_f * radius_f;
+  std::vector<Neighbor> found;
+  const auto consider = [&](const std::vector<int>& voxel) {
+    for (const int index : voxel) {
+      const float squared_distance = (xyzs_.col(index) - query).squaredNorm();
+      if (squared_distance <= squared_radius) {
+        found.emplace_back(squared_distance, index);
+      }
+    }
+  };
+
+  // The range of voxels that overlap the query's bounding box, clipped to the
+  // occupied voxels. When the range contains more voxels than are occupied,
+  // it is cheaper to check every occupied voxel instead.
+  const Eigen::Vector3f offset = Eigen::Vector3f::Constant(radius_f);
+  const Eigen::Vector3i lower = ComputeKey(query - offset).cwiseMax(min_key_);
+  const Eigen::Vector3i upper = ComputeKey(query + offset).cwiseMin(max_key_);
+  if ((upper.array() >= lower.array()).all()) {
+    const int64_t num_in_range =
+        ((upper - lower).cast<int64_t>().array() + 1).prod();
+    if (num_in_range > static_cast<int64_t>(voxels_.size())) {
+      for (const auto& [key, voxel] : voxels_) {
+        if ((key.array() >= lower.array()).all() &&
+            (key.array() <= upper.array()).all()) {
+          consider(voxel);
+        }
+      }
+    } else {
+      for (int x = lower.x(); x <= upper.x(); ++x) {
+        for (int y = lower.y(); y <= upper.y(); ++y) {
+          for (int z = lower.z(); z <= upper.z(); ++z) {
+            const auto iter = voxels_.find(Eigen::Vector3i(x, y, z));
+            if (iter != voxels_.end()) {
+              consider(iter->second);
+            }
+          }
+        }
+      }
+    }
+  }
+
+  std::sort(found.begin(), found.end());
+  Eigen::VectorXi indices(found.size());
+  for (int i = 0; i < static_cast<int>(found.size()); ++i) {
+    indices[i] = found[i].second;
+  }
+  return indices;
+}
+
+}  // namespace perception
+}  // namespace drake
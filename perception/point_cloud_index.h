@@ -0,0 +1,119 @@
+#pragma once
+
+#include <cstddef>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <Eigen/Dense>
+
+#include "drake/common/drake_copyable.h"
+#include "drake/common/eigen_types.h"
+#include "drake/common/parallelism.h"
+#include "drake/perception/point_cloud.h"
+
+namespace drake {
+namespace perception {
+
+/// A reusable spatial index over the xyzs of a PointCloud, which answers
+/// batches of k-nearest-neighbor and fixed-radius queries.
+///
+/// The index hashes each point into a 3D grid with cells (voxels) of
+/// dimension `voxel_size`. A query only visits the voxels near the query
+/// point, so the index is most efficient when `voxel_size` is comparable to
+/// the query radius (or to the typical distance to the k'th nearest
+/// neighbor). Points with non-finite xyz values are not indexed, and so are
+/// never returned by a query.
+///
+/// The index stores its own copy of the xyzs, so it remains valid after the
+/// cloud is modified or destroyed. When points are appended to the cloud
+/// (e.g., using PointCloud::Expand()), use Update() to index the new points
+/// without rebuilding the index for the existing points.
+class PointCloudIndex final {
+ public:
+  DRAKE_DEFAULT_COPY_AND_MOVE_AND_ASSIGN(PointCloudIndex);
+
+  /// Builds an index over the xyzs of `cloud`.
+  /// @p parallelize enables OpenMP parallelization.
+  /// @throws std::exception if cloud.has_xyzs() is false.
+  /// @throws std::exception if voxel_size <= 0.
+  PointCloudIndex(const PointCloud& cloud, double voxel_size,
+                  Parallelism parallelize = false);
+
+  /// Returns the dimension of the voxels.
+  double voxel_size() const { return voxel_size_; }
+
+  /// Returns the number of points that have been added to the index
+  /// (including the non-finite points, which are not indexed). The indices
+  /// returned by the queries are in the range [0, size()).
+  int size() const { return static_cast<int>(xyzs_.cols()); }
+
+  /// Indexes the points of `cloud` that were appended since this index was
+  /// built (or last updated), i.e., the points [size(), cloud.size()).
+  /// @p parallelize enables OpenMP parallelization.
+  /// @pre The first size() points of `cloud` are unchanged since this index
+  /// was built (or last updated). This is not checked.
+  /// @throws std::exception if cloud.has_xyzs() is false.
+  /// @throws std::exception if cloud.size() < size().
+  void Update(const PointCloud& cloud, Parallelism parallelize = false);
+
+  /// Finds the (up to) `k` closest points to each query point.
+  ///
+  /// @param queries The 3xN matrix of query points.
+  /// @param k The number of closest points to find for each query point.
+  /// @p parallelize enables OpenMP parallelization.
+  /// @returns the pair of k×N matrices (indices, distances), where column j
+  /// lists the indices of the closest points to `queries.col(j)` and their
+  /// (Euclidean) distances from it, sorted by increasing distance. When
+  /// fewer than `k` points are indexed, the remaining entries of the column
+  /// are filled with the index -1 and an infinite distance.
+  /// @throws std::exception if k < 1.
+  std::pair<Eigen::MatrixXi, Eigen::MatrixXf> FindNearest(
+      const Eigen::Ref<const Matrix3X<float>>& queries, int k,
+      Parallelism parallelize = false) const;
+
+  /// Finds all of the points within the Euclidean distance `radius` of each
+  /// query point.
+  ///
+  /// @param queries The 3xN matrix of query points.
+  /// @param radius The search radius.
+  /// @p parallelize enables OpenMP parallelization.
+  /// @returns a vector whose j'th element lists the indices of the points
+  /// within `radius` of `queries.col(j)`, sorted by increasing distance.
+  /// @throws std::exception if radius < 0.
+  std::vector<Eigen::VectorXi> FindWithinRadius(
+      const Eigen::Ref<const Matrix3X<float>>& queries, double radius,
+      Parallelism parallelize = false) const;
+
+ private:
+  struct KeyHash {
+    std::size_t operator()(const Eigen::Vector3i& key) const;
+  };
+
+  // Returns the key of the voxel that contains the given point.
+  Eigen::Vector3i ComputeKey(const Eigen::Vector3f& xyz) const;
+
+  // Adds the points [xyzs_.cols() - num_new, xyzs_.cols()) to voxels_.
+  void IndexNewPoints(int num_new, Parallelism parallelize);
+
+  // Implements FindNearest() for one query point, writing into the given
+  // columns of the results.
+  void FindNearestOne(const Eigen::Vector3f& query, int k,
+                      Eigen::Ref<Eigen::VectorXi> indices,
+                      Eigen::Ref<Eigen::VectorXf> distances) const;
+
+  // Implements FindWithinRadius() for one query point.
+  Eigen::VectorXi FindWithinRadiusOne(const Eigen::Vector3f& query,
+                                      double radius) const;
+
+  double voxel_size_{};
+  Matrix3X<float> xyzs_;
+  // Maps each occupied voxel's key to the indices of the points inside it.
+  std::unordered_map<Eigen::Vector3i, std::vector<int>, KeyHash> voxels_;
+  // The (inclusive) bounds of the occupied voxels' keys.
+  Eigen::Vector3i min_key_{Eigen::Vector3i::Zero()};
+  Eigen::Vector3i max_key_{Eigen::Vector3i::Zero()};
+};
+
+}  // namespace perception
+}  // namespace drake
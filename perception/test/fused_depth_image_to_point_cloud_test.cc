@@ -0,0 +1,219 @@
+#include "drake/perception/fused_depth_image_to_point_cloud.h"
+
+#include <limits>
+#include <memory>
+#include <optional>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/ssize.h"
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+#include "drake/common/test_utilities/expect_throws_message.h"
+#include "drake/math/rigid_transform.h"
+#include "drake/perception/depth_image_to_point_cloud.h"
+
+using drake::math::RigidTransformd;
+using drake::math::RollPitchYawd;
+using drake::systems::sensors::CameraInfo;
+using drake::systems::sensors::Image;
+using drake::systems::sensors::ImageRgba8U;
+using drake::systems::sensors::ImageTraits;
+using drake::systems::sensors::PixelType;
+using Eigen::Vector3d;
+
+namespace drake {
+namespace perception {
+namespace {
+
+constexpr float kFloatNaN = std::numeric_limits<float>::quiet_NaN();
+
+// Returns a depth image whose pixels are a deterministic pattern of valid
+// depths, with a few invalid (NaN, kTooClose, and kTooFar) pixels.
+template <PixelType pixel_type>
+Image<pixel_type> MakeDepthImage(int width, int height, int seed) {
+  using Traits = ImageTraits<pixel_type>;
+  Image<pixel_type> image(width, height);
+  for (int v = 0; v < height; ++v) {
+    for (int u = 0; u < width; ++u) {
+      const int i = u + v * width + seed;
+      image.at(u, v)[0] = static_cast<typename Traits::ChannelType>(
+          1 + (i * 7) % 5 + (pixel_type == PixelType::kDepth32F ? 0.5 : 0));
+    }
+  }
+  image.at(0, 0)[0] = Traits::kTooClose;
+  image.at(1, 0)[0] = Traits::kTooFar;
+  if constexpr (pixel_type == PixelType::kDepth32F) {
+    image.at(2, 1)[0] = kFloatNaN;
+  }
+  return image;
+}
+
+ImageRgba8U MakeColorImage(int width, int height, int seed) {
+  ImageRgba8U image(width, height);
+  for (int v = 0; v < height; ++v) {
+    for (int u = 0; u < width; ++u) {
+      for (int channel = 0; channel < 4; ++channel) {
+        image.at(u, v)[channel] =
+            static_cast<uint8_t>(u * 31 + v * 17 + channel + seed);
+      }
+    }
+  }
+  return image;
+}
+
+// Returns the expected output, by converting each depth image separately and
+// then concatenating the points with finite xyzs.
+template <PixelType pixel_type>
+PointCloud MakeExpected(const std::vector<CameraInfo>& camera_infos,
+                        const std::vector<RigidTransformd>& X_PCs,
+                        const std::vector<Image<pixel_type>>& depth_images,
+                        const std::vector<std::optional<ImageRgba8U>>& colors,
+                        pc_flags::BaseFieldT fields, float scale) {
+  std::vector<PointCloud> clouds;
+  for (int i = 0; i < ssize(camera_infos); ++i) {
+    PointCloud organized(0, fields);
+    DepthImageToPointCloud::Convert(camera_infos[i], X_PCs[i], depth_images[i],
+                                    colors[i], scale, &organized);
+    PointCloud& cloud = clouds.emplace_back(0, fields);
+    for (int j = 0; j < organized.size(); ++j) {
+      if (organized.xyz(j).allFinite()) {
+        cloud.Expand(1);
+        cloud.mutable_xyz(cloud.size() - 1) = organized.xyz(j);
+        if (cloud.has_rgbs()) {
+          cloud.mutable_rgb(cloud.size() - 1) =
+              colors[i] ? organized.rgb(j) : Vector3<uint8_t>::Zero();
+        }
+      }
+    }
+  }
+  return Concatenate(clouds);
+}
+
+template <PixelType pixel_type>
+void CheckFused(pc_flags::BaseFieldT fields, Parallelism parallelize) {
+  const float scale = (pixel_type == PixelType::kDepth16U) ? 0.001 : 1.0;
+  const std::vector<CameraInfo> camera_infos{
+      CameraInfo(6, 4, M_PI / 4), CameraInfo(5, 3, 10.0, 12.0, 2.0, 1.0),
+      CameraInfo(4, 4, M_PI / 3)};
+  const std::vector<RigidTransformd> X_PCs{
+      RigidTransformd::Identity(),
+      RigidTransformd(RollPitchYawd(0.1, -0.2, 0.3), Vector3d(1, 2, 3)),
+      RigidTransformd(Vector3d(-1, 0, 0.5))};
+  std::vector<Image<pixel_type>> depth_images;
+  for (int i = 0; i < ssize(camera_infos); ++i) {
+    depth_images.push_back(MakeDepthImage<pixel_type>(
+        camera_infos[i].width(), camera_infos[i].height(), i));
+  }
+  // The second camera has no color image.
+  const std::vector<std::optional<ImageRgba8U>> colors{
+      MakeColorImage(6, 4, 0), std::nullopt, MakeColorImage(4, 4, 2)};
+
+  const FusedDepthImageToPointCloud dut(camera_infos, pixel_type, scale,
+                                        fields, std::nullopt, parallelize);
+  EXPECT_EQ(dut.num_cameras(), 3);
+  auto context = dut.CreateDefaultContext();
+  for (int i = 0; i < dut.num_cameras(); ++i) {
+    dut.depth_image_input_port(i).FixValue(context.get(), depth_images[i]);
+    // The first camera's pose is left disconnected (i.e., the identity).
+    if (i > 0) {
+      dut.camera_pose_input_port(i).FixValue(context.get(), X_PCs[i]);
+    }
+    if (colors[i]) {
+      dut.color_image_input_port(i).FixValue(context.get(), *colors[i]);
+    }
+  }
+
+  const PointCloud expected = MakeExpected(camera_infos, X_PCs, depth_images,
+                                           colors, fields, scale);
+  const PointCloud& fused =
+      dut.point_cloud_output_port().Eval<PointCloud>(*context);
+  EXPECT_EQ(fused.fields(), pc_flags::Fields(fields));
+  // There are 3 (or 2) invalid pixels per camera.
+  const int num_invalid = (pixel_type == PixelType::kDepth32F) ? 3 : 2;
+  EXPECT_EQ(fused.size(), 24 + 15 + 16 - 3 * num_invalid);
+  ASSERT_EQ(fused.size(), expected.size());
+  EXPECT_TRUE(CompareMatrices(fused.xyzs(), expected.xyzs(), 1e-6));
+  if (fused.has_rgbs()) {
+    EXPECT_EQ(fused.rgbs(), expected.rgbs());
+  }
+
+  // When down-sampling, the output matches down-sampling the fused cloud.
+  const double voxel_size = 0.5;
+  const FusedDepthImageToPointCloud down_sampling_dut(
+      camera_infos, pixel_type, scale, fields, voxel_size, parallelize);
+  auto down_sampling_context = down_sampling_dut.CreateDefaultContext();
+  for (int i = 0; i < dut.num_cameras(); ++i) {
+    down_sampling_dut.depth_image_input_port(i).FixValue(
+        down_sampling_context.get(), depth_images[i]);
+    down_sampling_dut.camera_pose_input_port(i).FixValue(
+        down_sampling_context.get(), X_PCs[i]);
+    if (colors[i]) {
+      down_sampling_dut.color_image_input_port(i).FixValue(
+          down_sampling_context.get(), *colors[i]);
+    }
+  }
+  const PointCloud expected_down_sampled =
+      expected.VoxelizedDownSample(voxel_size);
+  const PointCloud& down_sampled =
+      down_sampling_dut.point_cloud_output_port().Eval<PointCloud>(
+          *down_sampling_context);
+  ASSERT_EQ(down_sampled.size(), expected_down_sampled.size());
+  EXPECT_LT(down_sampled.size(), fused.size());
+  EXPECT_TRUE(CompareMatrices(down_sampled.xyzs(),
+                              expected_down_sampled.xyzs(), 1e-6));
+}
+
+GTEST_TEST(FusedDepthImageToPointCloudTest, Depth32F) {
+  CheckFused<PixelType::kDepth32F>(pc_flags::kXYZs, false);
+}
+
+GTEST_TEST(FusedDepthImageToPointCloudTest, Depth16U) {
+  CheckFused<PixelType::kDepth16U>(pc_flags::kXYZs, false);
+}
+
+GTEST_TEST(FusedDepthImageToPointCloudTest, Color) {
+  CheckFused<PixelType::kDepth32F>(pc_flags::kXYZs | pc_flags::kRGBs, false);
+  CheckFused<PixelType::kDepth16U>(pc_flags::kXYZs | pc_flags::kRGBs, false);
+}
+
+GTEST_TEST(FusedDepthImageToPointCloudTest, Parallel) {
+  CheckFused<PixelType::kDepth32F>(pc_flags::kXYZs | pc_flags::kRGBs,
+                                   Parallelism(2));
+}
+
+GTEST_TEST(FusedDepthImageToPointCloudTest, Ports) {
+  const FusedDepthImageToPointCloud dut({CameraInfo(4, 3, M_PI / 4)});
+  EXPECT_EQ(dut.num_input_ports(), 3);
+  EXPECT_EQ(dut.depth_image_input_port(0).get_name(), "depth_image_0");
+  EXPECT_EQ(dut.color_image_input_port(0).get_name(), "color_image_0");
+  EXPECT_EQ(dut.camera_pose_input_port(0).get_name(), "camera_pose_0");
+  EXPECT_EQ(dut.point_cloud_output_port().get_name(), "point_cloud");
+  EXPECT_THROW(dut.depth_image_input_port(1), std::exception);
+
+  // The depth image is required.
+  auto context = dut.CreateDefaultContext();
+  EXPECT_THROW(dut.point_cloud_output_port().Eval<PointCloud>(*context),
+               std::exception);
+}
+
+GTEST_TEST(FusedDepthImageToPointCloudTest, BadArguments) {
+  const std::vector<CameraInfo> camera_infos{CameraInfo(4, 3, M_PI / 4)};
+  DRAKE_EXPECT_THROWS_MESSAGE(FusedDepthImageToPointCloud({}),
+                              ".*camera_infos_.empty.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      FusedDepthImageToPointCloud(camera_infos, PixelType::kDepth32F, 1.0,
+                                  pc_flags::kXYZs | pc_flags::kNormals),
+      ".*fields.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      FusedDepthImageToPointCloud(camera_infos, PixelType::kDepth32F, 1.0,
+                                  pc_flags::kXYZs, 0.0),
+      ".*voxel_size.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      FusedDepthImageToPointCloud(camera_infos, PixelType::kRgba8U),
+      ".*Unsupported pixel_type.*");
+}
+
+}  // namespace
+}  // namespace perception
+}  // namespace drake
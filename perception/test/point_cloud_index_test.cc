@@ -0,0 +1,198 @@
+#include "drake/perception/point_cloud_index.h"
+
+#include <algorithm>
+#include <limits>
+#include <utility>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+#include "drake/common/test_utilities/expect_throws_message.h"
+
+using Eigen::Matrix3Xf;
+using Eigen::MatrixXf;
+using Eigen::MatrixXi;
+using Eigen::Vector3f;
+using Eigen::VectorXi;
+
+namespace drake {
+namespace perception {
+namespace {
+
+constexpr float kInf = std::numeric_limits<float>::infinity();
+constexpr float kNaN = std::numeric_limits<float>::quiet_NaN();
+
+// Returns the indices of the (finite) points in `xyzs`, sorted by increasing
+// distance from `query` (breaking ties by index), along with their distances.
+std::vector<std::pair<float, int>> SortByDistance(const Matrix3Xf& xyzs,
+                                                  const Vector3f& query) {
+  std::vector<std::pair<float, int>> result;
+  for (int i = 0; i < xyzs.cols(); ++i) {
+    if (xyzs.col(i).allFinite()) {
+      result.emplace_back((xyzs.col(i) - query).squaredNorm(), i);
+    }
+  }
+  std::sort(result.begin(), result.end());
+  return result;
+}
+
+PointCloud MakeCloud(const Matrix3Xf& xyzs) {
+  PointCloud cloud(xyzs.cols());
+  cloud.mutable_xyzs() = xyzs;
+  return cloud;
+}
+
+// Checks the index's query results against a brute-force search.
+void CheckQueries(const PointCloudIndex& dut, const Matrix3Xf& xyzs,
+                  const Matrix3Xf& queries, int k, double radius,
+                  Parallelism parallelize) {
+  const auto [indices, distances] = dut.FindNearest(queries, k, parallelize);
+  ASSERT_EQ(indices.rows(), k);
+  ASSERT_EQ(indices.cols(), queries.cols());
+  ASSERT_EQ(distances.rows(), k);
+  ASSERT_EQ(distances.cols(), queries.cols());
+  const std::vector<VectorXi> within =
+      dut.FindWithinRadius(queries, radius, parallelize);
+  ASSERT_EQ(within.size(), queries.cols());
+
+  for (int j = 0; j < queries.cols(); ++j) {
+    const auto expected = SortByDistance(xyzs, queries.col(j));
+    for (int i = 0; i < k; ++i) {
+      if (i < static_cast<int>(expected.size())) {
+        EXPECT_EQ(indices(i, j), expected[i].second);
+        EXPECT_FLOAT_EQ(distances(i, j), std::sqrt(expected[i].first));
+      } else {
+        EXPECT_EQ(indices(i, j), -1);
+        EXPECT_EQ(distances(i, j), kInf);
+      }
+    }
+
+    std::vector<int> expected_within;
+    for (const auto& [squared_distance, index] : expected) {
+      if (squared_distance <= radius * radius) {
+        expected_within.push_back(index);
+      }
+    }
+    EXPECT_EQ(std::vector<int>(within[j].data(),
+                               within[j].data() + within[j].size()),
+              expected_within);
+  }
+}
+
+class PointCloudIndexTest : public ::testing::TestWithParam<int> {
+ protected:
+  Parallelism parallelize() const { return Parallelism(GetParam()); }
+};
+
+TEST_P(PointCloudIndexTest, RandomCloud) {
+  const int num_points = 500;
+  Matrix3Xf xyzs = Matrix3Xf::Random(3, num_points);
+  // Add some invalid points, which are never returned.
+  xyzs.col(3).setConstant(kNaN);
+  xyzs(1, 10) = kInf;
+
+  const PointCloudIndex dut(MakeCloud(xyzs), 0.1, parallelize());
+  EXPECT_EQ(dut.voxel_size(), 0.1);
+  EXPECT_EQ(dut.size(), num_points);
+
+  Matrix3Xf queries = 1.2 * Matrix3Xf::Random(3, 50);
+  // Some of the queries are exactly on a point.
+  queries.col(0) = xyzs.col(0);
+  queries.col(1) = xyzs.col(100);
+  CheckQueries(dut, xyzs, queries, 1, 0.0, parallelize());
+  CheckQueries(dut, xyzs, queries, 8, 0.15, parallelize());
+  CheckQueries(dut, xyzs, queries, 30, 0.5, parallelize());
+}
+
+TEST_P(PointCloudIndexTest, SparseCloud) {
+  // A few points that are far apart (relative to the voxel size), which
+  // requires the queries to consider many (mostly empty) voxels.
+  Matrix3Xf xyzs(3, 4);
+  // clang-format off
+  xyzs << 0, 10, -50, 0,
+          0,  0,  20, 0,
+          0,  3,   0, 1e6;
+  // clang-format on
+  const PointCloudIndex dut(MakeCloud(xyzs), 0.01, parallelize());
+  Matrix3Xf queries(3, 3);
+  // clang-format off
+  queries << 0.1, 100, -40,
+             0.1,   0,  20,
+             0.1, 0.5,   0;
+  // clang-format on
+  CheckQueries(dut, xyzs, queries, 3, 15.0, parallelize());
+  CheckQueries(dut, xyzs, queries, 6, 1e7, parallelize());
+}
+
+TEST_P(PointCloudIndexTest, Update) {
+  const int num_points = 200;
+  const Matrix3Xf xyzs = Matrix3Xf::Random(3, 2 * num_points);
+  PointCloud cloud = MakeCloud(xyzs.leftCols(num_points));
+  PointCloudIndex dut(cloud, 0.2, parallelize());
+  EXPECT_EQ(dut.size(), num_points);
+
+  // Index the points that are appended to the cloud.
+  cloud.Expand(num_points);
+  cloud.mutable_xyzs().rightCols(num_points) = xyzs.rightCols(num_points);
+  dut.Update(cloud, parallelize());
+  EXPECT_EQ(dut.size(), 2 * num_points);
+  const Matrix3Xf queries = Matrix3Xf::Random(3, 20);
+  CheckQueries(dut, xyzs, queries, 5, 0.3, parallelize());
+
+  // The results match an index built from scratch.
+  const PointCloudIndex rebuilt(cloud, 0.2, parallelize());
+  const auto [indices, distances] = dut.FindNearest(queries, 5);
+  const auto [rebuilt_indices, rebuilt_distances] =
+      rebuilt.FindNearest(queries, 5);
+  EXPECT_EQ(indices, rebuilt_indices);
+  EXPECT_TRUE(CompareMatrices(distances, rebuilt_distances));
+
+  // Updating without any new points is a no-op.
+  dut.Update(cloud);
+  EXPECT_EQ(dut.size(), 2 * num_points);
+
+  // The cloud must not shrink.
+  cloud.resize(num_points);
+  DRAKE_EXPECT_THROWS_MESSAGE(dut.Update(cloud), ".*cloud.size.*");
+}
+
+INSTANTIATE_TEST_SUITE_P(Parallelism, PointCloudIndexTest,
+                         ::testing::Values(1, 2));
+
+GTEST_TEST(PointCloudIndexTest, EmptyCloud) {
+  const PointCloudIndex dut(PointCloud(0), 1.0);
+  EXPECT_EQ(dut.size(), 0);
+  const Matrix3Xf queries = Matrix3Xf::Zero(3, 2);
+  const auto [indices, distances] = dut.FindNearest(queries, 2);
+  EXPECT_TRUE((indices.array() == -1).all());
+  EXPECT_TRUE((distances.array() == kInf).all());
+  for (const VectorXi& within : dut.FindWithinRadius(queries, 1.0)) {
+    EXPECT_EQ(within.size(), 0);
+  }
+}
+
+GTEST_TEST(PointCloudIndexTest, InvalidQuery) {
+  const PointCloudIndex dut(MakeCloud(Matrix3Xf::Zero(3, 3)), 1.0);
+  const Matrix3Xf queries = Matrix3Xf::Constant(3, 1, kNaN);
+  const auto [indices, distances] = dut.FindNearest(queries, 2);
+  EXPECT_TRUE((indices.array() == -1).all());
+  EXPECT_EQ(dut.FindWithinRadius(queries, 1.0)[0].size(), 0);
+}
+
+GTEST_TEST(PointCloudIndexTest, BadArguments) {
+  const PointCloud cloud = MakeCloud(Matrix3Xf::Zero(3, 3));
+  DRAKE_EXPECT_THROWS_MESSAGE(PointCloudIndex(cloud, 0.0), ".*voxel_size.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      PointCloudIndex(PointCloud(3, pc_flags::kNormals), 1.0),
+      ".*has_xyzs.*");
+  const PointCloudIndex dut(cloud, 1.0);
+  const Matrix3Xf queries = Matrix3Xf::Zero(3, 1);
+  DRAKE_EXPECT_THROWS_MESSAGE(dut.FindNearest(queries, 0), ".*k >= 1.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(dut.FindWithinRadius(queries, -1.0),
+                              ".*radius >= 0.*");
+}
+
+}  // namespace
+}  // namespace perception
+}  // namespace drake
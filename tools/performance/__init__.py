@@ -0,0 +1 @@
+# Empty Python module `__init__`, required to make this a module.
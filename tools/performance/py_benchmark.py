@@ -0,0 +1,226 @@
+"""A minimal harness for Python benchmarking programs.
+
+The command-line flags mimic (a subset of) those of a Google Benchmark
+program, e.g., ``--benchmark_filter=REGEX`` selects which benchmarks to run,
+``--benchmark_dry_run`` runs each benchmark for only one iteration, and
+``--benchmark_out=FILE`` writes the results as JSON (in the same format as
+Google Benchmark). This means that a program using this harness can be run
+under the //tools/performance:benchmark_tool.
+
+This module is only intended for use by the programs in the "benchmarking"
+folders; it is not part of Drake's public API.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+import socket
+import statistics
+import sys
+import time
+
+# The number of each time unit per second.
+_TIME_UNITS = {"ns": 1e9, "us": 1e6, "ms": 1e3, "s": 1.0}
+
+
+def _measure(function, *, min_time, dry_run):
+    """Calls ``function()`` repeatedly for at least ``min_time`` seconds and
+    returns the tuple (iterations, real_time, cpu_time), where the times are
+    the totals over all iterations (in seconds).
+    """
+    iterations = 1
+    while True:
+        real_start = time.perf_counter()
+        cpu_start = time.process_time()
+        for _ in range(iterations):
+            function()
+        real_time = time.perf_counter() - real_start
+        cpu_time = time.process_time() - cpu_start
+        if dry_run or real_time >= min_time:
+            return iterations, real_time, cpu_time
+        # Like Google Benchmark, grow the iteration count by at most 10x.
+        scale = 1.4 * min_time / max(real_time, 1e-9)
+        iterations = max(iterations + 1, int(iterations * min(scale, 10.0)))
+
+
+def _run(name, setup, items_per_iteration, *, args, time_unit):
+    """Runs one benchmark and returns its list of result dicts (in Google
+    Benchmark's JSON format), i.e., one result per repetition followed by
+    the aggregates (when there are multiple repetitions).
+    """
+    per_second = _TIME_UNITS[time_unit]
+    function = setup(args)
+    runs = []
+    for repetition_index in range(args.benchmark_repetitions):
+        iterations, real_time, cpu_time = _measure(
+            function,
+            min_time=args.benchmark_min_time,
+            dry_run=args.benchmark_dry_run,
+        )
+        runs.append(
+            {
+                "name": name,
+                "run_name": name,
+                "run_type": "iteration",
+                "repetitions": args.benchmark_repetitions,
+                "repetition_index": repetition_index,
+                "threads": 1,
+                "iterations": iterations,
+                "real_time": per_second * real_time / iterations,
+                "cpu_time": per_second * cpu_time / iterations,
+                "time_unit": time_unit,
+                "items_per_second": (
+                    items_per_iteration * iterations / max(real_time, 1e-9)
+                ),
+            }
+        )
+    if len(runs) == 1:
+        return runs
+    aggregates = []
+    for aggregate_name, reduce in (
+        ("mean", statistics.mean),
+        ("median", statistics.median),
+        ("stddev", statistics.stdev),
+    ):
+        aggregates.append(
+            {
+                "name": f"{name}_{aggregate_name}",
+                "run_name": name,
+                "run_type": "aggregate",
+                "aggregate_name": aggregate_name,
+                "repetitions": len(runs),
+                "threads": 1,
+                "iterations": len(runs),
+                "real_time": reduce([x["real_time"] for x in runs]),
+                "cpu_time": reduce([x["cpu_time"] for x in runs]),
+                "time_unit": time_unit,
+                "items_per_second": reduce(
+                    [x["items_per_second"] for x in runs]
+                ),
+            }
+        )
+    if args.benchmark_display_aggregates_only:
+        return aggregates
+    return runs + aggregates
+
+
+def _parse_min_time(value):
+    # Google Benchmark spells this flag as, e.g., "0.5s".
+    return float(value.removesuffix("s"))
+
+
+def _parse_bool(value):
+    return value.lower() in ("1", "true", "yes")
+
+
+def main(
+    *,
+    description,
+    benchmarks,
+    time_unit="us",
+    add_arguments=None,
+    get_context=None,
+):
+    """Parses the command line, runs the selected benchmarks, and prints (and
+    optionally writes) the results.
+
+    Args:
+        description: the program's ``--help`` text.
+        benchmarks: the list of (name, setup, items_per_iteration) for all
+            benchmarks, in the order they are run. The setup is a function
+            that performs any setup given the parsed command-line arguments,
+            and then returns the (no-argument) function to be timed. The items
+            are the number of units of work (e.g., steps) per call.
+        time_unit: the unit for the reported times: "ns", "us", "ms", or "s".
+        add_arguments: an optional function that adds any program-specific
+            flags to the given argparse.ArgumentParser.
+        get_context: an optional function that returns a dict of any
+            program-specific entries for the JSON "context", given the parsed
+            command-line arguments.
+    """
+    assert time_unit in _TIME_UNITS, time_unit
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--benchmark_filter",
+        metavar="REGEX",
+        default=".",
+        help="only run the benchmarks whose name matches this regex",
+    )
+    parser.add_argument(
+        "--benchmark_min_time",
+        metavar="SECONDS",
+        type=_parse_min_time,
+        default=0.5,
+        help="run each benchmark for at least this long",
+    )
+    parser.add_argument(
+        "--benchmark_repetitions",
+        metavar="N",
+        type=int,
+        default=1,
+        help="run each benchmark N times, and report aggregate statistics",
+    )
+    parser.add_argument(
+        "--benchmark_display_aggregates_only",
+        metavar="BOOL",
+        type=_parse_bool,
+        default=False,
+        help="when using repetitions, only report the aggregate statistics",
+    )
+    parser.add_argument(
+        "--benchmark_dry_run",
+        action="store_true",
+        help="run each benchmark for only one iteration (e.g., for testing)",
+    )
+    parser.add_argument(
+        "--benchmark_out",
+        metavar="FILE",
+        help="also write the results to this file",
+    )
+    parser.add_argument(
+        "--benchmark_out_format",
+        choices=["json"],
+        default="json",
+        help="the format of the --benchmark_out file",
+    )
+    if add_arguments is not None:
+        add_arguments(parser)
+    args = parser.parse_args()
+    assert args.benchmark_repetitions >= 1
+
+    pattern = re.compile(args.benchmark_filter)
+    results = []
+    print(f"{'Benchmark':<40} {'Time':>12} {'CPU':>12} {'Iterations':>12}")
+    print("-" * 79)
+    for name, setup, items_per_iteration in benchmarks:
+        if not pattern.search(name):
+            continue
+        for result in _run(
+            name, setup, items_per_iteration, args=args, time_unit=time_unit
+        ):
+            results.append(result)
+            print(
+                f"{result['name']:<40}"
+                f" {result['real_time']:>9.2f} {time_unit:<2}"
+                f" {result['cpu_time']:>9.2f} {time_unit:<2}"
+                f" {result['iterations']:>12}"
+                f" items_per_second={result['items_per_second']:.5g}/s",
+                flush=True,
+            )
+
+    if args.benchmark_out:
+        context = {
+            "date": datetime.datetime.now().astimezone().isoformat(),
+            "host_name": socket.gethostname(),
+            "executable": sys.argv[0],
+            "num_cpus": os.cpu_count(),
+        }
+        if get_context is not None:
+            context.update(get_context(args))
+        with open(args.benchmark_out, "w", encoding="utf-8") as f:
+            json.dump({"context": context, "benchmarks": results}, f, indent=2)